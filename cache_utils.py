@@ -0,0 +1,213 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+# ==========================================
+# 여러 패키지가 함께 쓰는 캐시 도우미
+# ==========================================
+#   - file_sha256: routing(.rgraph 캐시), weather(Parquet 캐시) 처럼 원본 파일에서 만든 캐시가
+#     아직 유효한지 판단할 때 쓰는 내용 해시
+#   - BoundedLRU: Streamlit 의 여러 세션(사용자)이 한 프로세스에서 공유하는 LRU.
+#     항목 수(maxsize) 또는 값 크기의 합(max_bytes)으로 제한합니다.
+#   - DiskLRU: 한 폴더에 저장한 캐시 파일들의 총 크기를 제한하는 LRU (내보내기 파일, 썸네일).
+#     사용 순서는 파일 수정 시각으로도 기록하므로, 프로세스를 다시 띄우면 폴더를 훑어 그대로 이어 씁니다.
+
+
+def file_sha256(path, size=None, chunk_size=1 << 20):
+    """파일 내용의 sha256 digest (32바이트). 파일은 chunk_size 씩 나눠 읽습니다.
+
+    size 를 주면 앞에서부터 size 바이트까지만 해시합니다 (파일이 그보다 짧으면 끝까지).
+    """
+    digest = hashlib.sha256()
+    remaining = size
+    with open(path, 'rb') as f:
+        while remaining is None or remaining > 0:
+            chunk = f.read(chunk_size if remaining is None else min(chunk_size, remaining))
+            if not chunk:
+                break
+            digest.update(chunk)
+            if remaining is not None:
+                remaining -= len(chunk)
+    return digest.digest()
+
+
+class BoundedLRU:
+    """크기가 제한된 LRU 캐시 (세션 간 공유, lock 으로 보호, 적중/실패 횟수 집계)
+
+    maxsize 는 항목 수, max_bytes 는 sizeof(값) 합의 한도입니다 (None 이면 제한 없음).
+    한도를 넘으면 오래 쓰지 않은 항목부터 밀어내되, 방금 넣은 항목 하나는 남겨 둡니다.
+    on_evict(key, value) 는 밀려난 항목마다 호출됩니다 (예: 디스크 파일 삭제).
+    """
+
+    def __init__(self, maxsize=None, max_bytes=None, sizeof=len, on_evict=None):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.on_evict = on_evict
+        self.hits = 0
+        self.misses = 0
+        self.total_bytes = 0
+        self._data = OrderedDict()  # key -> (값, 크기), 오래 쓰지 않은 것부터
+        self._lock = threading.Lock()
+
+    def _over_limit(self):
+        if self.maxsize is not None and len(self._data) > self.maxsize:
+            return True
+        return self.max_bytes is not None and self.total_bytes > self.max_bytes
+
+    def get(self, key, default=None, check=None):
+        """key 의 값 (적중으로 집계). 없거나 check(값) 이 False 이면 지우고 default"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and (check is None or check(entry[0])):
+                self._data.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            if entry is not None:
+                del self._data[key]
+                self.total_bytes -= entry[1]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self.total_bytes -= old[1]
+            size = self.sizeof(value) if self.max_bytes is not None else 0
+            self._data[key] = (value, size)
+            self.total_bytes += size
+            while self._over_limit() and len(self._data) > 1:
+                old_key, (old_value, old_size) = self._data.popitem(last=False)
+                self.total_bytes -= old_size
+                if self.on_evict is not None:
+                    self.on_evict(old_key, old_value)
+        return value
+
+    def get_or_compute(self, key, compute):
+        """key 가 있으면 저장된 값을, 없으면 compute() 결과를 저장하고 돌려줍니다.
+
+        compute 는 lock 밖에서 실행해 다른 세션의 조회를 막지 않습니다.
+        """
+        missing = object()
+        value = self.get(key, missing)
+        if value is not missing:
+            return value
+        return self.put(key, compute())
+
+    def pop(self, key, default=None):
+        """key 를 지우고 값을 돌려줍니다 (on_evict 는 호출하지 않음)."""
+        with self._lock:
+            entry = self._data.pop(key, None)
+            if entry is None:
+                return default
+            self.total_bytes -= entry[1]
+            return entry[0]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.total_bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+
+def _remove_file(key, path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _touch(path):
+    """사용 순서를 디스크에도 기록 (파일이 그사이 지워졌으면 무시)"""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+class DiskLRU:
+    """directory 안의 '<key><suffix>' 파일들. 총 크기가 max_bytes 를 넘으면 오래 쓰지 않은 파일부터 지웁니다.
+
+    suffixes 는 이 캐시가 관리하는 파일 확장자 목록이며, 시작할 때 폴더에 남아 있는 해당 파일을
+    수정 시각 순으로 다시 등록합니다.
+    """
+
+    def __init__(self, directory, max_bytes, suffixes):
+        self.directory = directory
+        self.suffixes = tuple(suffixes)
+        self._files = BoundedLRU(max_bytes=max_bytes, sizeof=os.path.getsize, on_evict=_remove_file)
+        self.scan()
+
+    def scan(self):
+        """폴더에 남아 있는 캐시 파일을 수정 시각 순으로 등록합니다 (한도를 넘으면 오래된 것부터 삭제)."""
+        if not os.path.isdir(self.directory):
+            return
+        entries = []
+        for name in os.listdir(self.directory):
+            key, suffix = os.path.splitext(name)
+            if suffix not in self.suffixes:
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                entries.append((os.stat(path).st_mtime_ns, key, path))
+            except OSError:
+                continue
+        for _, key, path in sorted(entries):
+            self._files.put(key, path)
+
+    def get(self, key):
+        """key 의 파일 경로 (없거나 파일이 지워졌으면 None)"""
+        path = self._files.get(key, check=os.path.exists)
+        if path is not None:
+            _touch(path)
+        return path
+
+    def write(self, key, suffix, write):
+        """write(f) 로 '<key><suffix>' 파일을 만들고 (임시 파일에 쓴 뒤 교체) 등록한 경로를 돌려줍니다."""
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"{key}{suffix}")
+        tmp_path = f"{path}.tmp{os.getpid()}.{threading.get_ident()}"
+        try:
+            with open(tmp_path, 'wb') as f:
+                write(f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            _remove_file(key, tmp_path)
+            raise
+        return self._files.put(key, path)
+
+    def pop(self, key):
+        """key 를 목록에서만 지웁니다 (파일이 사라진 경우 등)."""
+        return self._files.pop(key)
+
+    def stats(self):
+        return self._files.stats()
+
+    def __contains__(self, key):
+        return key in self._files
+
+    def __len__(self):
+        return len(self._files)
@@ -0,0 +1,216 @@
+import os
+import threading
+import time
+from collections import deque, namedtuple
+
+import pandas as pd
+
+# ==========================================
+# 페이지 공용 데이터 로더
+# ==========================================
+# 페이지마다 따로 있던 load_data (실행 위치에 따라 달라지는 상대 경로, 캐시 밖에서 반복되는
+# os.path.exists 확인, 더미 데이터 대체)를 한곳에 모았습니다.
+#   - 데이터셋 경로는 프로젝트 폴더 기준 후보 목록에서 찾고 (streamlit 을 어디서 실행해도 같음)
+#   - 필수 컬럼 검사는 파일을 새로 읽을 때 한 번만 하며
+#   - 읽은 표는 프로세스 전체가 (경로, mtime, 크기) 를 키로 공유합니다.
+#     파일이 바뀌면 키가 달라지므로 다음 요청에서 자동으로 다시 읽습니다.
+#   - 읽을 때마다 걸린 시간을 기록해 timings() 로 보여줍니다.
+# 돌려주는 DataFrame 은 모든 세션이 함께 쓰므로 고치지 말고, 필요하면 복사해서 쓰세요.
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+MOCK_VERSION = "mock"
+
+# candidates: 프로젝트 폴더 기준 후보 경로 (앞에서부터 확인)
+# required: 필수 컬럼 / reader: 경로 -> DataFrame
+Dataset = namedtuple("Dataset", ["candidates", "required", "reader"])
+
+# frame: 표 / path: 읽은 파일 (더미면 None) / version: (경로, mtime, 크기) 또는 'mock'
+# seconds: 파일을 읽는 데 걸린 시간 / cached: 이번 요청을 저장된 표로 처리했는지
+LoadResult = namedtuple("LoadResult", ["frame", "path", "version", "seconds", "cached"])
+
+
+def _read_temperature(path):
+    # weather 패키지는 기온 데이터를 실제로 읽을 때만 불러옵니다 (다른 페이지가 함께 끌어오지 않도록).
+    from weather import load_temperature
+
+    return load_temperature(path)
+
+
+DATASETS = {
+    "mbti": Dataset(
+        ("countries (1).csv", os.path.join("pages", "countries (1).csv")),
+        ("Country",),
+        pd.read_csv,
+    ),
+    "tourism": Dataset(
+        ("korea_tourism.csv", os.path.join("pages", "korea_tourism.csv")),
+        ('관광지명', '지역', '방문객수(만명)', '카테고리'),
+        pd.read_csv,
+    ),
+    # 인코딩 판별·날짜 정리와 Parquet 전처리 캐시는 weather.load_temperature 가 맡습니다.
+    "temperature": Dataset(
+        (os.path.join("pages", "test.csv"), "test.csv"),
+        ('날짜', '평균기온(℃)'),
+        _read_temperature,
+    ),
+}
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def validate(df, required, name=""):
+    """필수 컬럼이 모두 있는지 확인하고, 없으면 ValueError"""
+    missing = [col for col in required if col not in df.columns]
+    if missing:
+        label = f"{name} " if name else ""
+        raise ValueError(f"{label}데이터에 필수 컬럼이 없습니다: {', '.join(missing)}")
+
+
+class DataLoader:
+    """데이터셋 이름 -> DataFrame. (경로, mtime, 크기) 가 같으면 프로세스 안에서 한 번만 읽습니다."""
+
+    def __init__(self, datasets=DATASETS, root=PROJECT_ROOT, history=100):
+        self.datasets = dict(datasets)
+        self.root = root
+        self.hits = 0
+        self.misses = 0
+        self._frames = {}  # 데이터셋 이름 -> (version, frame, 읽은 시간, 검사 오류), 최신 판 하나만 보관
+        self._timings = deque(maxlen=history)
+        self._lock = threading.Lock()
+        self._loading = {}  # 데이터셋 이름 -> lock (같은 파일을 여러 세션이 동시에 읽지 않도록)
+
+    def resolve(self, name):
+        """데이터셋 파일의 절대 경로. 후보가 모두 없으면 None"""
+        for candidate in self.datasets[name].candidates:
+            path = os.path.join(self.root, candidate)
+            if os.path.isfile(path):
+                return path
+        return None
+
+    def version(self, name):
+        """데이터 판 구분용 키: 파일이면 (경로, mtime, 크기), 없으면 'mock'"""
+        path = self.resolve(name)
+        if path is None:
+            return MOCK_VERSION
+        stat = os.stat(path)
+        return (path, stat.st_mtime_ns, stat.st_size)
+
+    def _record(self, name, result):
+        self._timings.append({
+            "dataset": name,
+            "path": result.path,
+            "rows": len(result.frame),
+            "seconds": result.seconds,
+            "cached": result.cached,
+            "at": time.time(),
+        })
+
+    def _lookup(self, name, version):
+        entry = self._frames.get(name)
+        if entry is not None and entry[0] == version:
+            return entry
+        return None
+
+    def load(self, name, fallback=None):
+        """데이터셋을 LoadResult 로 돌려줍니다.
+
+        파일이 없으면 FileNotFoundError, 필수 컬럼이 없으면 ValueError 를 냅니다.
+        fallback (인자 없는 함수) 을 주면 두 경우 모두 그 결과를 version='mock' 으로 돌려줍니다.
+        """
+        dataset = self.datasets[name]
+        version = self.version(name)
+        try:
+            if version == MOCK_VERSION:
+                names = ", ".join(os.path.basename(c) for c in dataset.candidates[:1])
+                raise FileNotFoundError(f"파일을 찾을 수 없습니다: {names}")
+            return self._load_file(name, dataset, version)
+        except (FileNotFoundError, ValueError):
+            if fallback is None:
+                raise
+            return self._load_fallback(name, fallback)
+
+    def _load_file(self, name, dataset, version):
+        with self._lock:
+            entry = self._lookup(name, version)
+            if entry is None:
+                loading = self._loading.setdefault(name, threading.Lock())
+            else:
+                self.hits += 1
+        if entry is None:
+            # 파일 해석은 데이터셋별 lock 안에서만 실행해 다른 데이터셋 조회를 막지 않습니다.
+            with loading:
+                with self._lock:
+                    entry = self._lookup(name, version)
+                if entry is None:
+                    started = time.perf_counter()
+                    # 형식 오류도 같은 판에 대해서는 기억해 두어, 잘못된 파일을 rerun 마다 다시 읽지 않습니다.
+                    try:
+                        frame = dataset.reader(version[0])
+                        validate(frame, dataset.required, name)
+                        error = None
+                    except ValueError as e:
+                        frame, error = None, e
+                    entry = (version, frame, time.perf_counter() - started, error)
+                    with self._lock:
+                        self._frames[name] = entry
+                        self.misses += 1
+                    if error is not None:
+                        raise error
+                    result = LoadResult(frame, version[0], version, entry[2], False)
+                    self._record(name, result)
+                    return result
+                with self._lock:
+                    self.hits += 1
+        if entry[3] is not None:
+            raise entry[3]
+        result = LoadResult(entry[1], version[0], version, entry[2], True)
+        self._record(name, result)
+        return result
+
+    def _load_fallback(self, name, fallback):
+        key = (MOCK_VERSION, name)
+        with self._lock:
+            entry = self._frames.get(key)
+        if entry is not None:
+            result = LoadResult(entry[1], None, MOCK_VERSION, entry[2], True)
+        else:
+            started = time.perf_counter()
+            frame = fallback()
+            entry = (MOCK_VERSION, frame, time.perf_counter() - started, None)
+            with self._lock:
+                self._frames[key] = entry
+            result = LoadResult(frame, None, MOCK_VERSION, entry[2], False)
+        self._record(name, result)
+        return result
+
+    def timings(self):
+        """최근 로드 기록 (오래된 것부터) DataFrame"""
+        with self._lock:
+            records = list(self._timings)
+        return pd.DataFrame(records, columns=["dataset", "path", "rows", "seconds", "cached", "at"])
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "datasets": len(self._frames),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._frames.clear()
+            self._timings.clear()
+
+
+def default_loader():
+    """프로세스 전체가 함께 쓰는 DataLoader (모든 페이지가 같은 표를 공유)"""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = DataLoader()
+        return _default
@@ -0,0 +1,164 @@
+import hashlib
+import io
+import os
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
+
+from cache_utils import BoundedLRU, DiskLRU
+
+# ==========================================
+# 외부 이미지 로컬 캐시 + 썸네일
+# ==========================================
+# pages/food.py (Unsplash), pages/pok.py (PokeAPI 공식 아트워크) 는 원격 URL 을 st.image 에 넘기므로
+# 방문자마다 원본 크기 이미지를 다시 받고, 외부 서버가 느리면 화면도 멈춥니다.
+#   - URL 마다 한 번만 내려받아 max_size 안으로 줄인 썸네일을 .cache/images/ 에 저장하고,
+#   - 이후에는 디스크의 바이트를 그대로 돌려줍니다.
+#   - 저장된 파일의 총 크기가 max_bytes 를 넘으면 가장 오래 쓰지 않은 썸네일부터 지웁니다 (cache_utils.DiskLRU).
+# 내려받기 실패(네트워크 끊김, 이미지가 아님 등)는 None 으로 알려 주고, 페이지는 원래 URL 로 대신 표시합니다.
+#   - 실패한 URL 은 retry_after 초 동안 기억해, 외부 서버가 죽어 있는 동안 rerun 마다 다시 기다리지 않습니다.
+#   - 같은 URL 을 동시에 여러 번 내려받지 않도록 진행 중인 요청은 URL 별 Event 하나로 묶습니다.
+#   - 화면에서는 get(url, wait=False) 로 부르면 아직 없는 이미지를 백그라운드에서 받게 하고 바로 None 을 돌려줍니다.
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(PROJECT_ROOT, ".cache", "images")
+
+USER_AGENT = "Mozilla/5.0 (streamlit image cache)"
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def fetch_url(url, timeout=10):
+    """URL 의 바이트를 그대로 내려받습니다 (http, https, file 등 urllib 이 지원하는 모든 주소)."""
+    request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return response.read()
+
+
+def make_thumbnail(data, max_size=(480, 480)):
+    """이미지 바이트 -> (썸네일 바이트, 확장자). 투명도가 있으면 PNG, 아니면 JPEG"""
+    with Image.open(io.BytesIO(data)) as image:
+        image.thumbnail(max_size, Image.LANCZOS)
+        buffer = io.BytesIO()
+        if image.mode in ("RGBA", "LA", "P"):
+            image.save(buffer, format="PNG", optimize=True)
+            return buffer.getvalue(), "png"
+        image.convert("RGB").save(buffer, format="JPEG", quality=85, optimize=True)
+        return buffer.getvalue(), "jpg"
+
+
+class ImageCache:
+    """URL -> 썸네일 파일. 총 크기가 제한된 디스크 LRU (세션 간 공유)"""
+
+    def __init__(self, directory=CACHE_DIR, max_bytes=64 * 1024 * 1024, max_size=(480, 480), fetch=fetch_url,
+                 retry_after=60.0):
+        self.directory = directory
+        self.max_size = tuple(max_size)
+        self.fetch = fetch
+        self.retry_after = retry_after
+        self.failures = 0
+        self._files = DiskLRU(directory, max_bytes, (".png", ".jpg"))
+        self._failed = BoundedLRU(maxsize=1024)  # key -> 실패한 시각 (time.monotonic)
+        self._pending = {}  # key -> 내려받기가 끝나면 set 되는 Event
+        self._lock = threading.Lock()
+
+    def key(self, url):
+        return hashlib.sha1(f"{url}|{self.max_size[0]}x{self.max_size[1]}".encode("utf-8")).hexdigest()
+
+    def _read(self, key):
+        path = self._files.get(key)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            self._files.pop(key)
+            return None
+        return data
+
+    def get(self, url, wait=True):
+        """url 의 썸네일 바이트. 처음이면 내려받아 저장하고, 실패하면 None
+
+        wait=False 이면 내려받기를 기다리지 않습니다: 아직 없는 이미지는 백그라운드에서 받기 시작하고
+        (이미 받는 중이면 그대로 두고) 바로 None 을 돌려줍니다.
+        최근 retry_after 초 안에 실패한 URL 은 다시 시도하지 않고 None 입니다.
+        """
+        key = self.key(url)
+        data = self._read(key)
+        if data is not None:
+            return data
+
+        with self._lock:
+            failed_at = self._failed.get(key)
+            if failed_at is not None and time.monotonic() - failed_at < self.retry_after:
+                return None
+            pending = self._pending.get(key)
+            owner = pending is None
+            if owner:
+                pending = self._pending[key] = threading.Event()
+
+        if not owner:
+            # 다른 스레드(미리 받기 등)가 받는 중
+            if not wait:
+                return None
+            pending.wait()
+            return self._read(key)
+        if not wait:
+            threading.Thread(target=self._download, args=(url, key, pending), daemon=True).start()
+            return None
+        return self._download(url, key, pending)
+
+    def _download(self, url, key, pending):
+        try:
+            try:
+                data, ext = make_thumbnail(self.fetch(url), self.max_size)
+            except Exception:
+                with self._lock:
+                    self.failures += 1
+                self._failed.put(key, time.monotonic())
+                return None
+            try:
+                self._files.write(key, f".{ext}", lambda f: f.write(data))
+            except OSError:
+                pass  # 디스크에 저장하지 못해도 받은 썸네일은 이번 요청에 돌려줍니다.
+            self._failed.pop(key)
+            return data
+        finally:
+            with self._lock:
+                del self._pending[key]
+            pending.set()
+
+    def prefetch(self, urls, workers=4):
+        """여러 URL 을 미리 받아 둡니다. 이미지 수신은 대기 시간이 대부분이라 스레드로 동시에 받습니다."""
+        urls = list(dict.fromkeys(urls))
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            results = list(pool.map(self.get, urls))
+        return {"requested": len(urls), "cached": sum(r is not None for r in results)}
+
+    def prefetch_in_background(self, urls, workers=4):
+        """prefetch 를 데몬 스레드에서 실행합니다 (페이지 첫 화면을 막지 않음)."""
+        thread = threading.Thread(target=self.prefetch, args=(list(urls), workers), daemon=True)
+        thread.start()
+        return thread
+
+    def stats(self):
+        with self._lock:
+            failures, pending = self.failures, len(self._pending)
+        return dict(self._files.stats(), failures=failures, pending=pending)
+
+    def __len__(self):
+        return len(self._files)
+
+
+def default_cache():
+    """프로세스 전체가 함께 쓰는 ImageCache. 모든 페이지가 같은 폴더를 쓰므로 크기 집계가 어긋나지 않게 하나만 만듭니다."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = ImageCache()
+        return _default
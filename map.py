@@ -84,19 +84,20 @@ def find_shortest_path(graph, start, end):
 # ==========================================
 # 4. 실행 및 테스트
 # ==========================================
-print("🗺️ AI 네비게이션 시스템 가동")
-print("-" * 30)
+if __name__ == "__main__":
+    print("🗺️ AI 네비게이션 시스템 가동")
+    print("-" * 30)
 
-start_city = "서울"
-end_city = "부산"
+    start_city = "서울"
+    end_city = "부산"
 
-# 함수 실행
-path, total_dist = find_shortest_path(graph, start_city, end_city)
+    # 함수 실행
+    path, total_dist = find_shortest_path(graph, start_city, end_city)
 
-if path:
-    print(f"🚩 출발: {start_city}")
-    print(f"🏁 도착: {end_city}")
-    print(f"🛣️ 최단 경로: {' -> '.join(path)}")
-    print(f"📏 총 거리: {total_dist}km")
-else:
-    print("❌ 경로를 찾을 수 없습니다.")
+    if path:
+        print(f"🚩 출발: {start_city}")
+        print(f"🏁 도착: {end_city}")
+        print(f"🛣️ 최단 경로: {' -> '.join(path)}")
+        print(f"📏 총 거리: {total_dist}km")
+    else:
+        print("❌ 경로를 찾을 수 없습니다.")
@@ -0,0 +1,23 @@
+"""pages/01_mbti.py 에서 쓰는 국가별 MBTI 데이터 계층"""
+
+from .store import DEFAULT_CSV, MBTIStore
+from .similarity import METRICS, SimilarityIndex
+from .clustering import ClusterResult, cluster_countries, kmeans, pca_2d
+from .figcache import FigureCache
+from .rollup import GRANULARITIES, aggregation_matrix, available_granularities, rollup
+
+__all__ = [
+    "DEFAULT_CSV",
+    "MBTIStore",
+    "METRICS",
+    "SimilarityIndex",
+    "ClusterResult",
+    "cluster_countries",
+    "kmeans",
+    "pca_2d",
+    "FigureCache",
+    "GRANULARITIES",
+    "aggregation_matrix",
+    "available_granularities",
+    "rollup",
+]
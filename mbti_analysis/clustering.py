@@ -0,0 +1,94 @@
+from collections import namedtuple
+
+import numpy as np
+
+from cache_utils import BoundedLRU
+
+# ==========================================
+# 국가 군집(k-means) + 2차원 PCA 투영
+# ==========================================
+# 국가 x 유형 행렬 전체를 한 번에 다루는 벡터화 k-means 로 비슷한 성향의 국가를 묶고,
+# 산점도용으로 PCA 2차원 좌표를 계산합니다.
+# 결과는 (데이터 지문, k) 별로 보관하므로 국가나 유형 선택을 바꿔도 다시 군집화하지 않습니다.
+
+# 군집 결과: labels(국가별 군집 번호), centers, inertia(군집 내 제곱거리 합),
+#            coords(PCA 2차원 좌표), explained(두 축의 설명 분산 비율)
+ClusterResult = namedtuple("ClusterResult", ["labels", "centers", "inertia", "coords", "explained"])
+
+MAX_CACHED_RESULTS = 32
+
+_cache = BoundedLRU(maxsize=MAX_CACHED_RESULTS)
+
+
+def _squared_distances(X, centers):
+    """모든 (점, 중심) 쌍의 제곱거리: |x|^2 - 2 x·c + |c|^2"""
+    d = (X * X).sum(axis=1)[:, None] - 2 * X @ centers.T + (centers * centers).sum(axis=1)[None, :]
+    return np.maximum(d, 0.0)
+
+
+def _kmeans_plus_plus(X, k, rng):
+    """k-means++ 초기 중심: 이미 고른 중심에서 먼 점일수록 뽑힐 확률이 높음"""
+    centers = [X[rng.integers(len(X))]]
+    closest = _squared_distances(X, np.array(centers))[:, 0]
+    for _ in range(1, k):
+        total = closest.sum()
+        idx = rng.choice(len(X), p=closest / total) if total > 0 else rng.integers(len(X))
+        centers.append(X[idx])
+        closest = np.minimum(closest, _squared_distances(X, X[idx:idx + 1])[:, 0])
+    return np.array(centers)
+
+
+def kmeans(X, k, seed=0, n_init=4, max_iter=100, tol=1e-6):
+    """(labels, centers, inertia). 초기값을 n_init 번 바꿔 inertia 가 가장 작은 결과를 고릅니다."""
+    X = np.asarray(X, dtype=np.float64)
+    k = max(1, min(k, len(X)))
+    rng = np.random.default_rng(seed)
+    best = None
+
+    for _ in range(n_init):
+        centers = _kmeans_plus_plus(X, k, rng)
+        for _ in range(max_iter):
+            labels = _squared_distances(X, centers).argmin(axis=1)
+            # 군집별 합계를 한 번에: bincount 대신 one-hot 행렬 곱
+            onehot = np.zeros((len(X), k))
+            onehot[np.arange(len(X)), labels] = 1.0
+            counts = onehot.sum(axis=0)
+            sums = onehot.T @ X
+            empty = counts == 0
+            new_centers = np.where(empty[:, None], centers, sums / np.maximum(counts, 1)[:, None])
+            shift = np.abs(new_centers - centers).max()
+            centers = new_centers
+            if shift <= tol:
+                break
+
+        distances = _squared_distances(X, centers)
+        labels = distances.argmin(axis=1)
+        inertia = float(distances[np.arange(len(X)), labels].sum())
+        if best is None or inertia < best[2]:
+            best = (labels, centers, inertia)
+
+    return best
+
+
+def pca_2d(X):
+    """(n x 2 좌표, 두 주성분의 설명 분산 비율)"""
+    X = np.asarray(X, dtype=np.float64)
+    centered = X - X.mean(axis=0)
+    _, s, vt = np.linalg.svd(centered, full_matrices=False)
+    components = vt[:2]
+    coords = centered @ components.T
+    if coords.shape[1] < 2:
+        coords = np.hstack([coords, np.zeros((len(X), 2 - coords.shape[1]))])
+    variance = s ** 2
+    explained = variance[:2] / variance.sum() if variance.sum() > 0 else np.zeros(2)
+    return coords, explained
+
+
+def cluster_countries(store, k, seed=0):
+    """store 의 국가들을 k 개 군집으로 묶습니다. (store.fingerprint, k, seed) 별로 결과를 재사용합니다."""
+    def compute():
+        labels, centers, inertia = kmeans(store.values, k, seed=seed)
+        coords, explained = pca_2d(store.values)
+        return ClusterResult(labels, centers, inertia, coords, explained)
+
+    return _cache.get_or_compute((store.fingerprint, k, seed), compute)
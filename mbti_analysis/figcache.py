@@ -0,0 +1,47 @@
+import io
+
+import matplotlib.pyplot as plt
+
+from cache_utils import BoundedLRU
+
+# ==========================================
+# 그래프 이미지(PNG/SVG) 캐시
+# ==========================================
+# 같은 (그래프 종류, 선택값, 데이터 지문) 조합은 matplotlib 으로 다시 그리지 않고
+# 한 번 렌더링해 둔 이미지 바이트를 돌려줍니다.
+# 그린 뒤에는 plt.close(fig) 로 Figure 를 바로 해제하므로 rerun 마다 메모리가 늘지 않습니다.
+# 전체 바이트 수가 max_bytes 를 넘으면 가장 오래 쓰지 않은 이미지부터 지웁니다.
+
+FORMATS = ("png", "svg")
+
+
+class FigureCache:
+    """바이트 크기로 제한된 렌더링 결과 LRU 캐시 (세션 간 공유)"""
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, dpi=100):
+        self.dpi = dpi
+        self._images = BoundedLRU(max_bytes=max_bytes)
+
+    def render(self, key, draw, fmt="png"):
+        """key 의 이미지 바이트. 없으면 draw() 가 돌려준 Figure 를 저장(fmt)하고 닫습니다."""
+        if fmt not in FORMATS:
+            raise ValueError(f"지원하지 않는 이미지 형식입니다: {fmt}")
+        return self._images.get_or_compute((fmt,) + tuple(key), lambda: self._draw(draw, fmt))
+
+    def _draw(self, draw, fmt):
+        fig = draw()
+        try:
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format=fmt, dpi=self.dpi, bbox_inches="tight")
+        finally:
+            plt.close(fig)
+        return buffer.getvalue()
+
+    def clear(self):
+        self._images.clear()
+
+    def stats(self):
+        return self._images.stats()
+
+    def __len__(self):
+        return len(self._images)
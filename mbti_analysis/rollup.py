@@ -0,0 +1,64 @@
+import numpy as np
+
+# ==========================================
+# 32 세부 유형 -> 16 유형 / 4 지표 / A·T 묶음
+# ==========================================
+# 열 이름("INFP-T" 등)은 데이터를 읽을 때 한 번만 해석해 0/1 묶음 행렬 M (세부 유형 수 x 묶음 수)을 만들고,
+# 묶음별 비율은 values @ M 한 번의 행렬 곱으로 구합니다.
+# 위젯을 바꿀 때마다 groupby 나 문자열 파싱을 다시 하지 않습니다.
+
+GRANULARITIES = {
+    "subtype": "32 세부 유형 (-A / -T)",
+    "type": "16 유형",
+    "axis": "4 지표 (E/I, S/N, T/F, J/P)",
+    "identity": "자기주장형(A) / 민감형(T)",
+}
+
+# 4 지표의 각 극. 유형 문자열에서 위치(0~3)의 글자로 판별합니다.
+AXIS_POLES = [("E", 0), ("I", 0), ("S", 1), ("N", 1), ("T", 2), ("F", 2), ("J", 3), ("P", 3)]
+
+
+def _split(mbti_type):
+    """'INFP-T' -> ('INFP', 'T'),  'INFP' -> ('INFP', None)"""
+    base, _, identity = mbti_type.partition("-")
+    return base.upper(), (identity.upper() or None)
+
+
+def available_granularities(types):
+    """열 이름으로 만들 수 있는 묶음 단위 목록"""
+    has_identity = all(_split(t)[1] is not None for t in types)
+    return ["subtype", "type", "axis", "identity"] if has_identity else ["type", "axis"]
+
+
+def aggregation_matrix(types, granularity):
+    """(묶음 이름 목록, 0/1 행렬 M) — M[i, g] = 1 이면 i 번째 열이 g 묶음에 속함"""
+    parts = [_split(t) for t in types]
+
+    if granularity == "subtype":
+        labels = list(types)
+        membership = [[i] for i in range(len(types))]
+    elif granularity == "type":
+        labels = sorted({base for base, _ in parts})
+        membership = [[labels.index(base)] for base, _ in parts]
+    elif granularity == "axis":
+        labels = [pole for pole, _ in AXIS_POLES]
+        membership = [
+            [g for g, (pole, pos) in enumerate(AXIS_POLES) if len(base) > pos and base[pos] == pole]
+            for base, _ in parts
+        ]
+    elif granularity == "identity":
+        labels = sorted({identity for _, identity in parts if identity})
+        membership = [[labels.index(identity)] if identity else [] for _, identity in parts]
+    else:
+        raise ValueError(f"지원하지 않는 묶음 단위입니다: {granularity}")
+
+    matrix = np.zeros((len(types), len(labels)))
+    for i, groups in enumerate(membership):
+        matrix[i, groups] = 1.0
+    return labels, matrix
+
+
+def rollup(values, types, granularity):
+    """(묶음 이름 목록, 국가 x 묶음 비율 행렬)"""
+    labels, matrix = aggregation_matrix(types, granularity)
+    return labels, values @ matrix
@@ -0,0 +1,79 @@
+import numpy as np
+
+# ==========================================
+# "X 와 가장 비슷한 나라" 최근접 이웃 인덱스
+# ==========================================
+# 데이터를 읽을 때 한 번만
+#   - 코사인 유사도: 행을 길이 1로 정규화한 행렬끼리 곱함
+#   - L1 거리     : 유형별 비율 차이의 절댓값 합
+# 을 계산해, 국가마다 가장 가까운 k 개 이웃 표(n x k)를 만들어 둡니다.
+# 질의는 표의 한 행을 읽는 것으로 끝납니다.
+# 국가(지역) 수 n 이 수천 개로 늘어도 n x n 행렬 전체를 메모리에 두지 않도록 행 묶음(block) 단위로 계산합니다.
+
+METRICS = {
+    "cosine": "코사인 유사도 (높을수록 비슷)",
+    "l1": "L1 거리 (낮을수록 비슷)",
+}
+
+# 한 번에 만들 block x n 점수 행렬의 최대 원소 수
+MAX_BLOCK_ELEMENTS = 1 << 22
+
+
+def _top_k(scores, k, largest):
+    """각 행에서 상위 k 개 열 번호를 점수 순으로 (argpartition 후 k 개만 정렬)"""
+    keyed = -scores if largest else scores
+    part = np.argpartition(keyed, k - 1, axis=1)[:, :k]
+    order = np.take_along_axis(keyed, part, axis=1).argsort(axis=1, kind='stable')
+    return np.take_along_axis(part, order, axis=1)
+
+
+class SimilarityIndex:
+    """국가별 MBTI 벡터의 top-k 이웃 표 (코사인 / L1)"""
+
+    def __init__(self, names, values, k=20):
+        self.names = np.asarray(names, dtype=object)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        values = np.asarray(values, dtype=np.float64)
+        n, d = values.shape
+        self.k = max(0, min(k, n - 1))
+
+        norms = np.linalg.norm(values, axis=1, keepdims=True)
+        self.normalized = values / np.where(norms == 0, 1.0, norms)
+
+        self.neighbors_of = {}
+        self.scores_of = {}
+        if self.k == 0:
+            for metric in METRICS:
+                self.neighbors_of[metric] = np.empty((n, 0), dtype=np.int64)
+                self.scores_of[metric] = np.empty((n, 0))
+            return
+
+        for metric in METRICS:
+            block = max(1, MAX_BLOCK_ELEMENTS // n)
+            neighbors = np.empty((n, self.k), dtype=np.int64)
+            scores = np.empty((n, self.k))
+            for start in range(0, n, block):
+                rows = np.arange(start, min(start + block, n))
+                if metric == "cosine":
+                    block_scores = self.normalized[rows] @ self.normalized.T
+                    block_scores[np.arange(len(rows)), rows] = -np.inf  # 자기 자신 제외
+                else:
+                    # 유형(열)마다 누적하면 block x n x d 크기의 중간 배열 없이 계산됩니다.
+                    block_scores = np.zeros((len(rows), n))
+                    diff = np.empty_like(block_scores)
+                    for j in range(d):
+                        np.subtract(values[rows, j, None], values[None, :, j], out=diff)
+                        block_scores += np.abs(diff, out=diff)
+                    block_scores[np.arange(len(rows)), rows] = np.inf
+                top = _top_k(block_scores, self.k, largest=(metric == "cosine"))
+                neighbors[rows] = top
+                scores[rows] = np.take_along_axis(block_scores, top, axis=1)
+            self.neighbors_of[metric] = neighbors
+            self.scores_of[metric] = scores
+
+    def neighbors(self, name, metric="cosine", k=None):
+        """name 과 가장 비슷한 (이름 목록, 점수 배열). k 는 인덱스를 만들 때의 k 이하"""
+        k = self.k if k is None else min(k, self.k)
+        i = self.index[name]
+        rows = self.neighbors_of[metric][i, :k]
+        return self.names[rows].tolist(), self.scores_of[metric][i, :k]
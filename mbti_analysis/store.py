@@ -0,0 +1,125 @@
+import hashlib
+import os
+
+import numpy as np
+import pandas as pd
+
+from .rollup import rollup
+from .similarity import SimilarityIndex
+
+# ==========================================
+# 국가별 MBTI 데이터 저장소 (NumPy 열 기반)
+# ==========================================
+# CSV 를 한 번만 읽어 (국가 수 x 유형 수) 실수 행렬로 보관하고,
+# 화면에서 자주 쓰는 결과를 미리 계산해 둡니다.
+#   - 전체 국가 평균과 그 내림차순 순서   (Tab 1)
+#   - 국가별 유형 내림차순 순서           (Tab 2)
+#   - 유형별 국가 내림차순 순위(argsort)  (Tab 3)
+# 위젯을 바꿀 때마다 mean() / sort_values() 를 다시 하지 않고 배열 인덱싱만 합니다.
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CSV = os.path.join(PROJECT_ROOT, "countries (1).csv")
+
+
+class MBTIStore:
+    """국가 x MBTI 유형 비율(%) 행렬과 미리 계산한 순위표"""
+
+    def __init__(self, countries, types, values, is_mock=False):
+        self.countries = np.asarray(countries, dtype=object)
+        self.types = list(types)
+        self.values = np.ascontiguousarray(values, dtype=np.float64)
+        self.is_mock = is_mock
+        self.country_index = {name: i for i, name in enumerate(self.countries)}
+        self.type_index = {name: j for j, name in enumerate(self.types)}
+        self._views = {}
+        self._similarity = None
+
+        # 전체 평균 (Tab 1)
+        self.means = self.values.mean(axis=0)
+        self.mean_order = np.argsort(-self.means, kind='stable')
+        # 국가별 유형 순서 (Tab 2): country_order[i] = i 번째 국가의 유형 열 번호 (큰 값부터)
+        self.country_order = np.argsort(-self.values, axis=1, kind='stable')
+        # 유형별 국가 순위 (Tab 3): type_ranking[j] = j 번째 유형 값이 큰 국가 번호 순
+        self.type_ranking = np.ascontiguousarray(np.argsort(-self.values, axis=0, kind='stable').T)
+
+        digest = hashlib.sha1(self.values.tobytes())
+        digest.update("\0".join(map(str, self.countries)).encode('utf-8'))
+        digest.update("\0".join(self.types).encode('utf-8'))
+        self.fingerprint = digest.hexdigest()
+
+    @classmethod
+    def from_frame(cls, df, is_mock=False):
+        """'Country' 열 + 유형별 열로 이루어진 DataFrame 에서 만듭니다.
+
+        값이 비율(0~1)로 들어 있으면 화면 표기(%)에 맞게 100 을 곱합니다.
+        """
+        if "Country" not in df.columns:
+            raise ValueError("데이터에 'Country' 컬럼이 없습니다.")
+        types = [col for col in df.columns if col != "Country"]
+        values = df[types].apply(pd.to_numeric, errors='coerce').fillna(0.0).to_numpy(dtype=np.float64)
+        if values.size and values.max() <= 1.0:
+            values = values * 100
+        return cls(df["Country"].astype(str).to_numpy(), types, values, is_mock)
+
+    @classmethod
+    def from_csv(cls, file_path=DEFAULT_CSV):
+        return cls.from_frame(pd.read_csv(file_path))
+
+    def view(self, granularity):
+        """16 유형 / 4 지표 / A·T 로 묶은 파생 저장소 (단위별로 처음 한 번만 계산)
+
+        파생 저장소도 MBTIStore 이므로 평균·순위표가 똑같이 미리 계산됩니다.
+        """
+        if granularity == "subtype":
+            return self
+        if granularity not in self._views:
+            labels, values = rollup(self.values, self.types, granularity)
+            self._views[granularity] = MBTIStore(self.countries, labels, values, self.is_mock)
+        return self._views[granularity]
+
+    def similarity(self):
+        """국가 간 최근접 이웃 인덱스 (처음 요청할 때 한 번만 계산)"""
+        if self._similarity is None:
+            self._similarity = SimilarityIndex(self.countries, self.values)
+        return self._similarity
+
+    # ------------------------------------------
+    # 조회 (모두 미리 계산한 배열을 잘라서 돌려줌)
+    # ------------------------------------------
+    def mean_ranking(self):
+        """(유형 목록, 평균 비율) 을 평균이 큰 순서로"""
+        return [self.types[j] for j in self.mean_order], self.means[self.mean_order]
+
+    def country_profile(self, country):
+        """(유형 목록, 비율) 을 해당 국가에서 비율이 큰 순서로"""
+        i = self.country_index[country]
+        order = self.country_order[i]
+        return [self.types[j] for j in order], self.values[i, order]
+
+    def top_countries(self, mbti_type, k=10):
+        """해당 유형 비율이 높은 국가 번호 k 개"""
+        return self.type_ranking[self.type_index[mbti_type], :k]
+
+    def rank_of(self, country, mbti_type):
+        """해당 유형에서 국가의 순위 (1부터)"""
+        ranking = self.type_ranking[self.type_index[mbti_type]]
+        return int(np.nonzero(ranking == self.country_index[country])[0][0]) + 1
+
+    def find_country(self, keyword):
+        """이름에 keyword 가 들어간 첫 국가 (대소문자 무시). 없으면 None"""
+        keyword = keyword.lower()
+        for name in self.countries:
+            if keyword in name.lower():
+                return name
+        return None
+
+    def frame(self, rows=None):
+        """화면 표시용 DataFrame (rows 에 국가 번호 배열을 주면 그 순서대로)"""
+        if rows is None:
+            rows = np.arange(len(self.countries))
+        df = pd.DataFrame(self.values[rows], columns=self.types)
+        df.insert(0, "Country", self.countries[rows])
+        return df
+
+    def __repr__(self):
+        return f"MBTIStore(countries={len(self.countries)}, types={len(self.types)})"
@@ -3,6 +3,7 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 import os
+import sys
 import numpy as np
 
 # -----------------------------------------------------------------------------
@@ -45,33 +46,46 @@ def create_mock_data():
         
     return pd.DataFrame(data)
 
-@st.cache_data
-def load_data():
-    # 파일 경로는 현재 파일의 위치에 따라 상대적으로 설정해야 할 수 있습니다.
-    # 같은 폴더에 있다고 가정합니다.
-    file_path = "mbti_data.csv" 
-    
-    # 만약 pages 폴더 안에 있다면 상위 폴더를 참조해야 할 수도 있으니 확인 필요
-    # 여기서는 같은 폴더 혹은 실행 위치 기준을 우선합니다.
-    
-    if os.path.exists(file_path):
-        try:
-            df = pd.read_csv(file_path)
-            # Country 컬럼이 있는지 확인
-            if "Country" not in df.columns:
-                return create_mock_data()
-            return df
-        except Exception:
-            return create_mock_data()
-    else:
-        # 파일이 없으면 더미 데이터 반환
-        return create_mock_data()
+# 프로젝트 루트의 mbti_analysis 패키지와 data_loader 모듈을 불러오기 위해 경로 추가
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+from data_loader import MOCK_VERSION, default_loader
+from mbti_analysis import (
+    GRANULARITIES, METRICS, FigureCache, MBTIStore, available_granularities, cluster_countries
+)
+
+# CSV 는 공용 로더가 (경로, mtime, 크기) 별로 한 번만 읽고, 평균/순위표는 데이터 판마다 한 번만 계산합니다.
+# 표(_frame)는 캐시 키에서 빼고 그 표의 판(version)만 키로 쓰며, 최신 판 하나만 보관합니다.
+@st.cache_resource(max_entries=1)
+def load_store(version, _frame):
+    return MBTIStore.from_frame(_frame, is_mock=version == MOCK_VERSION)
+
+# 그래프 이미지 캐시: 모든 세션이 공유하며, 같은 그래프는 한 번만 그립니다.
+@st.cache_resource
+def get_figure_cache():
+    return FigureCache(max_bytes=64 * 1024 * 1024)
 
 # 데이터 로드 실행
-df = load_data()
+# 파일 확인은 rerun 마다 stat 한 번뿐이고, 바뀌지 않았으면 저장된 표를 그대로 씁니다.
+# 파일이 없거나 형식이 맞지 않으면 더미 데이터 사용
+loaded = default_loader().load("mbti", fallback=create_mock_data)
+store = load_store(loaded.version, loaded.frame)
+st.sidebar.caption(f"⏱️ 데이터 읽기 {loaded.seconds:.2f}초" + (" · 저장된 표 사용" if loaded.cached else ""))
+figures = get_figure_cache()
+
+# 분석 단위 선택 (32 세부 유형 / 16 유형 / 4 지표 / A·T)
+# 묶음 결과는 단위별로 처음 한 번만 계산되어 store 안에 보관됩니다.
+granularity = st.sidebar.radio(
+    "분석 단위",
+    available_granularities(store.types),
+    format_func=GRANULARITIES.get
+)
+view = store.view(granularity)
 
-# MBTI 컬럼 리스트 추출 (Country 제외)
-mbti_cols = [col for col in df.columns if col != "Country"]
+# MBTI 컬럼 리스트 (Country 제외)
+mbti_cols = view.types
 
 # -----------------------------------------------------------------------------
 # 2. 메인 화면 구성
@@ -80,11 +94,13 @@ st.title("🌏 국가별 MBTI 성향 분석")
 st.markdown("전 세계 국가의 MBTI 분포와 한국의 위치를 비교 분석합니다.")
 
 # 데이터가 Mock Data인지 확인하여 안내 (선택적)
-if not os.path.exists("mbti_data.csv"):
+if store.is_mock:
     st.info("💡 CSV 데이터가 감지되지 않아 **테스트용 데이터**로 실행 중입니다.")
 
 # 탭 구성
-tab1, tab2, tab3 = st.tabs(["📊 전체 국가 평균", "🔍 국가별 상세 분석", "🏆 유형별 순위 & 한국 비교"])
+tab1, tab2, tab3, tab4, tab5 = st.tabs([
+    "📊 전체 국가 평균", "🔍 국가별 상세 분석", "🏆 유형별 순위 & 한국 비교", "🤝 닮은 국가 찾기", "🧭 국가 군집"
+])
 
 # --- Tab 1: 전체 평균 ---
 with tab1:
@@ -92,15 +108,18 @@ with tab1:
     if not mbti_cols:
         st.error("데이터에 MBTI 컬럼이 없습니다.")
     else:
-        avg_mbti = df[mbti_cols].mean().sort_values(ascending=False)
-        avg_df = avg_mbti.reset_index()
-        avg_df.columns = ['MBTI', 'Average Percentage']
+        # 평균과 정렬 순서는 load_store() 때 미리 계산되어 있습니다.
+        def draw_average():
+            avg_types, avg_values = view.mean_ranking()
+            avg_df = pd.DataFrame({'MBTI': avg_types, 'Average Percentage': avg_values})
 
-        fig, ax = plt.subplots(figsize=(12, 6))
-        sns.barplot(x='MBTI', y='Average Percentage', data=avg_df, palette="viridis", ax=ax)
-        ax.set_title("Global Average MBTI Distribution")
-        ax.set_ylabel("Percentage (%)")
-        st.pyplot(fig)
+            fig, ax = plt.subplots(figsize=(12, 6))
+            sns.barplot(x='MBTI', y='Average Percentage', data=avg_df, palette="viridis", ax=ax)
+            ax.set_title("Global Average MBTI Distribution")
+            ax.set_ylabel("Percentage (%)")
+            return fig
+
+        st.image(figures.render(("average", None, view.fingerprint), draw_average), use_container_width=True)
 
 # --- Tab 2: 국가별 분석 ---
 with tab2:
@@ -108,58 +127,135 @@ with tab2:
     col1, col2 = st.columns([1, 3])
     
     with col1:
-        selected_country = st.selectbox("분석할 국가를 선택하세요:", df['Country'].unique())
-    
-    # 선택 국가 데이터 필터링
-    country_data = df[df['Country'] == selected_country][mbti_cols].T
-    country_data.columns = ['Percentage']
-    country_data = country_data.sort_values(by='Percentage', ascending=False)
+        selected_country = st.selectbox("분석할 국가를 선택하세요:", view.countries)
     
-    with col2:
+    def draw_country():
+        # 선택 국가 데이터 (유형 순서는 미리 정렬되어 있음)
+        profile_types, profile_values = view.country_profile(selected_country)
+        country_data = pd.DataFrame({'Percentage': profile_values}, index=profile_types)
+
         fig, ax = plt.subplots(figsize=(10, 5))
         sns.barplot(x=country_data.index, y='Percentage', data=country_data, palette="coolwarm", ax=ax)
         ax.set_title(f"MBTI Distribution in {selected_country}")
-        st.pyplot(fig)
+        return fig
+
+    with col2:
+        st.image(figures.render(("country", selected_country, view.fingerprint), draw_country), use_container_width=True)
 
 # --- Tab 3: 순위 및 한국 비교 ---
 with tab3:
     st.header("유형별 국가 순위 TOP 10 & 한국 비교")
     target_mbti = st.selectbox("비교할 MBTI 유형을 선택하세요:", mbti_cols)
     
-    sorted_df = df.sort_values(by=target_mbti, ascending=False).reset_index(drop=True)
-    top_10 = sorted_df.head(10).copy()
-    
-    # 한국 데이터 찾기 (대소문자 무관)
-    korea_row = df[df['Country'].str.contains("Korea", case=False, na=False)]
-    
-    plot_data = top_10.copy()
-    korea_name = "South Korea"
-    
-    # 한국 데이터가 있고, TOP 10에 없다면 그래프에 추가
-    if not korea_row.empty:
-        korea_name = korea_row.iloc[0]['Country']
-        if korea_name not in top_10['Country'].values:
-            korea_data = korea_row.iloc[[0]].copy()
-            plot_data = pd.concat([top_10, korea_data])
-            
-    fig, ax = plt.subplots(figsize=(12, 7))
-    
-    # 한국만 다른 색으로 표시
-    colors = ['lightgrey'] * len(plot_data)
-    countries_list = plot_data['Country'].tolist()
-    
-    if korea_name in countries_list:
-        try:
-            korea_idx = countries_list.index(korea_name)
-            colors[korea_idx] = 'salmon'
-        except ValueError:
-            pass
-
-    sns.barplot(x=target_mbti, y='Country', data=plot_data, palette=colors, ax=ax)
-    ax.set_title(f"Top Countries for {target_mbti}")
-    
-    # 막대 옆에 숫자 표시
-    for i, v in enumerate(plot_data[target_mbti]):
-        ax.text(v + 0.1, i, f"{v:.1f}%", va='center', fontsize=10)
-        
-    st.pyplot(fig)
+    def draw_ranking():
+        # 유형별 국가 순위는 미리 argsort 되어 있으므로 앞에서 10개만 자릅니다.
+        top_rows = view.top_countries(target_mbti, 10)
+
+        # 한국 데이터 찾기 (대소문자 무관)
+        korea_name = view.find_country("Korea") or "South Korea"
+
+        # 한국 데이터가 있고, TOP 10에 없다면 그래프에 추가
+        if korea_name in view.country_index and view.country_index[korea_name] not in top_rows:
+            top_rows = np.append(top_rows, view.country_index[korea_name])
+        plot_data = view.frame(top_rows)
+
+        fig, ax = plt.subplots(figsize=(12, 7))
+
+        # 한국만 다른 색으로 표시
+        colors = ['lightgrey'] * len(plot_data)
+        countries_list = plot_data['Country'].tolist()
+
+        if korea_name in countries_list:
+            try:
+                korea_idx = countries_list.index(korea_name)
+                colors[korea_idx] = 'salmon'
+            except ValueError:
+                pass
+
+        sns.barplot(x=target_mbti, y='Country', data=plot_data, palette=colors, ax=ax)
+        ax.set_title(f"Top Countries for {target_mbti}")
+
+        # 막대 옆에 숫자 표시
+        for i, v in enumerate(plot_data[target_mbti]):
+            ax.text(v + 0.1, i, f"{v:.1f}%", va='center', fontsize=10)
+        return fig
+
+    st.image(figures.render(("ranking", target_mbti, view.fingerprint), draw_ranking), use_container_width=True)
+
+# --- Tab 4: 성향이 비슷한 국가 ---
+with tab4:
+    st.header("MBTI 성향이 가장 비슷한 국가")
+    # 이웃 표는 데이터(분석 단위)별로 한 번만 만들어지고, 여기서는 한 행을 읽기만 합니다.
+    similarity = view.similarity()
+    col1, col2 = st.columns([1, 3])
+
+    with col1:
+        countries = list(view.countries)
+        base_name = view.find_country("Korea")
+        base_country = st.selectbox(
+            "기준 국가를 선택하세요:",
+            countries,
+            index=countries.index(base_name) if base_name else 0
+        )
+        metric = st.radio("비교 방식", list(METRICS), format_func=METRICS.get)
+        # 비교할 국가가 하나 이하면 slider 의 최솟값과 최댓값이 같아지므로 그대로 씁니다.
+        if similarity.k > 1:
+            top_k = st.slider("표시할 국가 수", 1, similarity.k, min(10, similarity.k))
+        else:
+            top_k = similarity.k
+
+    similar_names, similar_scores = similarity.neighbors(base_country, metric, top_k)
+
+    with col2:
+        if not similar_names:
+            st.warning("비교할 다른 국가가 없습니다.")
+        else:
+            def draw_similar():
+                similar_df = pd.DataFrame({'Country': similar_names, 'Score': similar_scores})
+                fig, ax = plt.subplots(figsize=(10, 6))
+                sns.barplot(x='Score', y='Country', data=similar_df, color='skyblue', ax=ax)
+                ax.set_title(f"Countries most similar to {base_country} ({metric})")
+                ax.set_xlabel("Cosine similarity" if metric == "cosine" else "L1 distance (%p)")
+                if metric == "cosine":
+                    ax.set_xlim(max(0.0, similar_scores.min() - 0.01), 1.0)
+                return fig
+
+            key = ("similar", (base_country, metric, top_k), view.fingerprint)
+            st.image(figures.render(key, draw_similar), use_container_width=True)
+
+# --- Tab 5: 국가 군집 ---
+with tab5:
+    st.header("MBTI 성향으로 나눈 국가 그룹")
+    # 군집 결과는 (데이터 지문, k) 별로 보관되므로 다른 탭의 선택을 바꿔도 다시 계산하지 않습니다.
+    # 국가 수보다 많은 그룹은 만들 수 없으므로 기본값도 최댓값에 맞추고, 두 나라뿐이면 slider 없이 k=2 로 나눕니다.
+    max_clusters = min(10, len(view.countries))
+    if max_clusters > 2:
+        num_clusters = st.slider("그룹 수 (k)", 2, max_clusters, min(4, max_clusters))
+    else:
+        num_clusters = max_clusters
+    clusters = cluster_countries(view, num_clusters)
+
+    def draw_clusters():
+        fig, ax = plt.subplots(figsize=(10, 7))
+        scatter = ax.scatter(clusters.coords[:, 0], clusters.coords[:, 1], c=clusters.labels, cmap="tab10", s=40, alpha=0.8)
+        ax.legend(*scatter.legend_elements(), title="Cluster", loc="best")
+
+        korea_name = view.find_country("Korea")
+        if korea_name:
+            i = view.country_index[korea_name]
+            ax.scatter(*clusters.coords[i], s=200, facecolors='none', edgecolors='red', linewidths=2)
+            ax.annotate(korea_name, clusters.coords[i], xytext=(8, 8), textcoords="offset points", color='red')
+
+        ax.set_title("Countries projected onto 2 principal components")
+        ax.set_xlabel(f"PC1 ({clusters.explained[0] * 100:.1f}%)")
+        ax.set_ylabel(f"PC2 ({clusters.explained[1] * 100:.1f}%)")
+        return fig
+
+    st.image(figures.render(("clusters", num_clusters, view.fingerprint), draw_clusters), use_container_width=True)
+
+    with st.expander("그룹별 국가 목록 보기"):
+        members = pd.DataFrame({
+            'Cluster': range(num_clusters),
+            'Countries': [', '.join(view.countries[clusters.labels == c]) for c in range(num_clusters)]
+        })
+        st.dataframe(members, use_container_width=True)
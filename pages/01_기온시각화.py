@@ -4,6 +4,18 @@ import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 import os
+import sys
+
+# 프로젝트 루트의 weather 패키지와 data_loader 모듈을 불러오기 위해 경로 추가
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+from data_loader import default_loader
+from weather import (
+    STATION_DIR, IncrementalTrend, MultiResolution, analyze_trends, cached_stream_aggregate, compare_serial_parallel,
+    discover_station_files, ingest_stations, station_year_matrix,
+)
 
 # 1. 페이지 설정
 st.set_page_config(
@@ -13,62 +25,136 @@ st.set_page_config(
 )
 
 # 2. 데이터 로드 및 전처리 함수
-@st.cache_data
-def load_data(filename):
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    file_path = os.path.join(current_dir, filename)
+# test.csv 는 공용 로더가 (경로, mtime, 크기) 별로 한 번만 읽어 모든 세션이 공유합니다.
+# 인코딩 판별·날짜 정리·숫자 변환은 weather.load_temperature 가 한 번만 하고,
+# 결과를 .cache/weather/ 의 Parquet 파일로 남겨 다음 실행부터는 그것을 바로 읽습니다.
+def load_temperature_table():
+    """(LoadResult, 오류 메시지) 중 하나는 None"""
+    try:
+        return default_loader().load("temperature"), None
+    except (FileNotFoundError, ValueError) as e:
+        # 파일이 없거나 필수 컬럼('날짜', '평균기온(℃)')이 없는 경우
+        return None, str(e)
+    except Exception as e:
+        return None, f"오류 발생: {e}"
 
-    if not os.path.exists(file_path):
-        return None, f"파일을 찾을 수 없습니다: {filename}"
+# 일별·월별 시계열의 해상도 단계(원본, 1/4, 1/16, ...)는 파일·방식별로 한 번만 만듭니다.
+# 화면에서는 보이는 구간에 맞는 단계를 골라 최대 2,000개 점만 Plotly 로 보냅니다.
+DOWNSAMPLE_METHODS = {"lttb": "LTTB (모양 유지)", "minmax": "구간 최저·최고"}
 
-    try:
-        # 파일 읽기
-        try:
-            df = pd.read_csv(file_path, encoding='cp949')
-        except UnicodeDecodeError:
-            df = pd.read_csv(file_path, encoding='utf-8')
-
-        # 컬럼명 공백 제거
-        df.columns = [c.strip() for c in df.columns]
-
-        # 날짜 컬럼 전처리
-        if '날짜' in df.columns:
-            df['날짜'] = df['날짜'].astype(str).str.replace('"', '').str.replace('\t', '').str.strip()
-            df['날짜'] = pd.to_datetime(df['날짜'], errors='coerce')
-            df['연도'] = df['날짜'].dt.year
-        else:
-            return None, "CSV 파일에 '날짜' 컬럼이 없습니다."
+# 표(_df)는 캐시 키에서 빼고 그 표의 판(version, 파일이 바뀌면 달라짐)만 키로 쓰며, 최신 판만 보관합니다.
+@st.cache_data(max_entries=1)
+def load_monthly(version, _df):
+    return _df.set_index('날짜')['평균기온(℃)'].sort_index().resample('MS').mean().dropna()
 
-        # [핵심 수정] 기온 컬럼 데이터 전처리 강화
-        # 1. 혹시 문자로 되어있을 수 있으니 강제로 숫자로 변환 (에러나면 NaN 처리)
-        if '평균기온(℃)' in df.columns:
-            df['평균기온(℃)'] = pd.to_numeric(df['평균기온(℃)'], errors='coerce')
-            
-            # 2. 기온 데이터가 비어있는(NaN) 행은 삭제 (이게 없으면 nan 뜸)
-            df = df.dropna(subset=['평균기온(℃)', '연도'])
-        else:
-            return None, "CSV 파일에 '평균기온(℃)' 컬럼이 없습니다."
+@st.cache_resource(max_entries=len(DOWNSAMPLE_METHODS))
+def get_series(version, method, _df):
+    daily = _df.sort_values('날짜')
+    monthly = load_monthly(version, _df)
+    return {
+        "일별": MultiResolution(daily['날짜'].to_numpy(), daily['평균기온(℃)'].to_numpy(), method=method),
+        "월별": MultiResolution(monthly.index.to_numpy(), monthly.to_numpy(), method=method),
+    }
 
-        return df, None
-            
+# 대용량 파일용: 청크 단위로 읽으며 연도별 합계·개수만 누적 (메모리는 그룹 수에 비례)
+# 결과는 weather 패키지가 (파일, mtime, 크기) 별로 보관하므로 rerun 마다 다시 읽지 않습니다.
+def load_yearly_streaming():
+    file_path = default_loader().resolve("temperature")
+    if file_path is None:
+        return None, "파일을 찾을 수 없습니다: test.csv"
+
+    status = st.empty()
+
+    def report(rows, rows_per_second):
+        status.caption(f"⏳ {rows:,}행 처리 중 · {rows_per_second:,.0f} 행/초")
+
+    try:
+        result = cached_stream_aggregate(file_path, progress=report)
+    except ValueError as e:
+        return None, str(e)
     except Exception as e:
         return None, f"오류 발생: {e}"
 
+    status.caption(f"✅ 스트리밍 집계: {result.rows:,}행 · {result.seconds:.2f}초 · {result.rows_per_second:,.0f} 행/초")
+    return result.yearly_frame(), None
+
+# 새 날짜 행이 계속 붙는 파일용: 연도별 충분통계량을 디스크에 두고 새로 붙은 행만 반영
+# 집계기는 프로세스당 하나만 만들고, rerun 마다 refresh() 로 파일 끝의 새 행만 읽습니다.
+@st.cache_resource
+def get_incremental_trend(file_path):
+    return IncrementalTrend(file_path)
+
+def load_yearly_incremental():
+    file_path = default_loader().resolve("temperature")
+    if file_path is None:
+        return None, None, "파일을 찾을 수 없습니다: test.csv"
+
+    tracker = get_incremental_trend(file_path)
+    try:
+        new_rows = tracker.refresh()
+    except ValueError as e:
+        return None, None, str(e)
+    except Exception as e:
+        return None, None, f"오류 발생: {e}"
+
+    if new_rows:
+        st.caption(f"🔄 새로 반영한 행: {new_rows:,}개")
+    return tracker.yearly_frame(), tracker.trend(), None
+
+# 지점별 CSV 여러 개: 파일 단위로 프로세스 풀에서 병렬 집계 후 지점 x 연도 표로 합칩니다.
+# 파일 목록과 각 파일의 (mtime, 크기)를 캐시 키로 써서, 파일이 바뀌면 다시 집계합니다.
+@st.cache_data(show_spinner="지점별 파일을 병렬로 집계하는 중...")
+def load_station_table(file_signature):
+    paths = [path for path, _, _ in file_signature]
+    return ingest_stations(paths)
+
+# 폴더를 훑고 파일마다 헤더를 확인하는 일은 rerun 마다 하지 않고, 폴더의 수정 시각이 바뀌거나
+# 1분이 지났을 때만 다시 합니다 (파일 내용만 바뀐 경우는 ttl 이 지나면 반영).
+@st.cache_data(ttl=60, show_spinner=False)
+def station_signature(directory, directory_mtime_ns):
+    signature = []
+    for path in discover_station_files(directory):
+        stat = os.stat(path)
+        signature.append((path, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
 # 3. 메인 앱 화면
 st.title("🌡️ 지난 110년, 기온은 실제로 상승했을까?")
 st.markdown("데이터를 분석하여 **연도별 기온 변화**와 **장기적인 추세**를 Plotly 그래프로 확인합니다.")
 
 # 데이터 로드
-df, error = load_data('test.csv')
+LOAD_MODES = {
+    "full": "전체 읽기 (Parquet 캐시)",
+    "stream": "대용량 파일 스트리밍 집계",
+    "incremental": "새 관측값만 증분 반영",
+}
+load_mode = st.sidebar.radio(
+    "데이터 처리 방식",
+    list(LOAD_MODES),
+    format_func=LOAD_MODES.get,
+    help="스트리밍: 청크 단위로 읽으며 연도별 합계·개수만 누적합니다. / 증분: 파일 끝에 새로 붙은 행만 읽어 추세선을 갱신합니다."
+)
+
+# 증분 모드는 저장된 회귀 모멘트로 추세선을 바로 구하므로 polyfit 을 건너뜁니다.
+trend = None
+if load_mode == "stream":
+    df_yearly, error = load_yearly_streaming()
+elif load_mode == "incremental":
+    df_yearly, trend, error = load_yearly_incremental()
+else:
+    loaded, error = load_temperature_table()
+    df = None
+    if loaded is not None:
+        df = loaded.frame
+        st.sidebar.caption(f"⏱️ 데이터 읽기 {loaded.seconds:.2f}초" + (" · 저장된 표 사용" if loaded.cached else ""))
+    # 1. 연도별 평균 기온 구하기
+    df_yearly = None if df is None else df.groupby('연도')['평균기온(℃)'].mean().reset_index()
 
 if error:
     st.error(error)
-elif df is not None:
+elif df_yearly is not None:
     # --- 데이터 분석 ---
     
-    # 1. 연도별 평균 기온 구하기
-    df_yearly = df.groupby('연도')['평균기온(℃)'].mean().reset_index()
-    
     # [안전 장치] 연도별 평균에서도 혹시 모를 NaN 제거
     df_yearly = df_yearly.dropna()
 
@@ -79,7 +165,10 @@ elif df is not None:
         y = df_yearly['평균기온(℃)']
         
         # 1차 방정식 계수 산출 (여기서 NaN이 있으면 에러남 -> 위에서 처리 완료)
-        slope, intercept = np.polyfit(x, y, 1)
+        if trend is None:
+            slope, intercept = np.polyfit(x, y, 1)
+        else:
+            slope, intercept = trend
         
         # 추세선 값 생성
         df_yearly['추세선'] = slope * x + intercept
@@ -126,6 +215,121 @@ elif df is not None:
 
         with st.expander("데이터 자세히 보기"):
             st.dataframe(df_yearly)
+
+        # --- 일별·월별 시계열 (전체 읽기 모드에서만: 원본 일별 데이터가 필요) ---
+        if load_mode == "full":
+            st.divider()
+            st.subheader("📅 일별·월별 기온 변화")
+            c1, c2, c3 = st.columns([1, 1, 2])
+            resolution = c1.radio("간격", ["월별", "일별"], horizontal=True)
+            method = c2.radio("다운샘플링", list(DOWNSAMPLE_METHODS), format_func=DOWNSAMPLE_METHODS.get, horizontal=True)
+            view_start, view_end = c3.slider(
+                "표시 구간 (연도)", int(start_year), int(end_year), (int(start_year), int(end_year))
+            )
+
+            series = get_series(loaded.version, method, df)[resolution]
+            sx, sy, level = series.select(
+                np.datetime64(f"{view_start:04d}-01-01"), np.datetime64(f"{view_end:04d}-12-31")
+            )
+
+            fig_series = go.Figure(go.Scattergl(
+                x=sx, y=sy, mode='lines', name=f"{resolution} 평균기온", line=dict(color='steelblue', width=1)
+            ))
+            fig_series.update_layout(hovermode="x unified", xaxis_title="날짜", yaxis_title="기온 (℃)")
+            st.plotly_chart(fig_series, use_container_width=True)
+            st.caption(f"전송한 점: {len(sx):,}개 / 원본 {len(series):,}개 (해상도 단계 {level})")
+
+        # --- 기간별 추세 분석 (이동평균·이동 기울기·연대별·월별 기울기) ---
+        # 모든 창의 기울기를 누적합으로 한 번에 계산하고, 결과는 (데이터, 창 크기) 별로 재사용합니다.
+        st.divider()
+        st.subheader("📊 기간별 추세 분석")
+        max_window = min(50, len(df_yearly))
+        if max_window > 3:
+            window = st.slider("이동 창 크기 (년)", 3, max_window, min(10, max_window))
+        else:
+            # 연도가 2~3개뿐이면 슬라이더의 최솟값과 최댓값이 같아지므로 전체 기간을 창 하나로 씁니다.
+            window = max_window
+            st.caption(f"연도 수가 적어 이동 창 크기를 {window}년으로 고정합니다.")
+
+        monthly = load_monthly(loaded.version, df) if load_mode == "full" else None
+        monthly_parts = None
+        if monthly is not None:
+            monthly_parts = (monthly.index.year.to_numpy(), monthly.index.month.to_numpy(), monthly.to_numpy())
+        analytics = analyze_trends(df_yearly['연도'].to_numpy(), df_yearly['평균기온(℃)'].to_numpy(), window, monthly_parts)
+
+        tab_rolling, tab_slope, tab_decade, tab_month = st.tabs(["이동평균", "이동 기울기", "연대별 기울기", "월별 기울기"])
+
+        with tab_rolling:
+            fig_rolling = go.Figure()
+            fig_rolling.add_trace(go.Scatter(
+                x=analytics.years, y=analytics.values, mode='lines', name='연평균 기온', line=dict(color='lightgray', width=2)
+            ))
+            fig_rolling.add_trace(go.Scatter(
+                x=analytics.years, y=analytics.rolling_mean, mode='lines', name=f'{window}년 이동평균', line=dict(color='orange', width=3)
+            ))
+            fig_rolling.update_layout(hovermode="x unified", xaxis_title="연도", yaxis_title="기온 (℃)")
+            st.plotly_chart(fig_rolling, use_container_width=True)
+
+        with tab_slope:
+            fig_slope = px.line(
+                x=analytics.years, y=analytics.rolling_slope * 10,
+                labels={'x': '연도 (창의 마지막 해)', 'y': '기울기 (℃/10년)'},
+                title=f'최근 {window}년 추세 기울기의 변화'
+            )
+            fig_slope.add_hline(y=0, line_dash='dot', line_color='gray')
+            st.plotly_chart(fig_slope, use_container_width=True)
+
+        with tab_decade:
+            decades, decade_slopes, decade_means = analytics.decades
+            df_decades = pd.DataFrame({
+                '연대': [f"{d}년대" for d in decades],
+                '기울기 (℃/10년)': decade_slopes * 10,
+                '평균기온(℃)': decade_means,
+            })
+            st.plotly_chart(px.bar(df_decades, x='연대', y='기울기 (℃/10년)', color='평균기온(℃)', color_continuous_scale='RdBu_r'), use_container_width=True)
+
+        with tab_month:
+            if analytics.months is None:
+                st.info("월별 기울기는 '전체 읽기' 모드에서 일별 데이터로 계산합니다.")
+            else:
+                months, month_slopes = analytics.months
+                df_months = pd.DataFrame({'월': [f"{m}월" for m in months], '기울기 (℃/10년)': month_slopes * 10})
+                st.plotly_chart(px.bar(df_months, x='월', y='기울기 (℃/10년)'), use_container_width=True)
             
     else:
         st.warning("분석할 데이터가 충분하지 않습니다. (2년 이상의 데이터 필요)")
+
+# --- 지점별 비교 (여러 CSV 병렬 집계) ---
+st.divider()
+st.subheader("🗺️ 관측 지점별 연평균 기온 비교")
+st.caption(
+    f"`{os.path.relpath(STATION_DIR, ROOT_DIR)}` 폴더(하위 폴더 포함)에서 '날짜'·'평균기온(℃)' 컬럼이 있는 CSV 를 모두 찾아 지점별로 집계합니다."
+)
+
+signature = station_signature(STATION_DIR, os.stat(STATION_DIR).st_mtime_ns) if os.path.isdir(STATION_DIR) else ()
+if not signature:
+    st.info("지점별 CSV 파일을 찾지 못했습니다. 지점별 CSV 를 위 폴더에 넣어 주세요.")
+else:
+    station_table, station_rows, station_seconds = load_station_table(signature)
+    station_names = sorted(station_table['지점'].unique())
+    st.caption(f"파일 {len(signature)}개 · 지점 {len(station_names)}곳 · {station_rows:,}행 · {station_seconds:.2f}초")
+
+    selected_stations = st.multiselect("비교할 지점", station_names, default=station_names[:5])
+    if selected_stations:
+        df_stations = station_table[station_table['지점'].isin(selected_stations)]
+        fig_stations = px.line(df_stations, x='연도', y='평균기온(℃)', color='지점', title='지점별 연평균 기온')
+        fig_stations.update_layout(hovermode="x unified", xaxis_title="연도", yaxis_title="기온 (℃)")
+        st.plotly_chart(fig_stations, use_container_width=True)
+
+        with st.expander("지점 x 연도 표 보기"):
+            st.dataframe(station_year_matrix(df_stations))
+
+    if st.button("직렬 vs 병렬 집계 속도 비교"):
+        with st.spinner("같은 파일들을 직렬·병렬로 한 번씩 집계하는 중..."):
+            bench = compare_serial_parallel([path for path, _, _ in signature])
+        b1, b2, b3 = st.columns(3)
+        b1.metric("직렬", f"{bench['serial_seconds']:.2f} 초")
+        b2.metric(f"병렬 ({bench['processes']} 프로세스)", f"{bench['parallel_seconds']:.2f} 초")
+        b3.metric("속도 향상", f"{bench['speedup']:.2f} 배")
+        if not bench['same_result']:
+            st.warning("직렬·병렬 결과가 다릅니다.")
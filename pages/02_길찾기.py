@@ -0,0 +1,86 @@
+import streamlit as st
+import os
+import sys
+import time
+
+# 1. 페이지 설정
+st.set_page_config(
+    page_title="AI 네비게이션",
+    page_icon="🗺️",
+    layout="wide"
+)
+
+# 프로젝트 루트의 map.py / routing 패키지를 불러오기 위해 경로 추가
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+from map import graph
+from routing import RouteCache, Router, from_dict_graph
+
+MODE_LABELS = {
+    "dijkstra": "기본 Dijkstra",
+    "bidirectional": "양방향 Dijkstra",
+    "alt": "ALT (랜드마크 A*)",
+    "ch": "Contraction Hierarchies",
+}
+
+# 2. 엔진 / 캐시 준비
+# cache_resource: 모든 세션이 같은 객체를 공유하고, 재실행(rerun)해도 다시 만들지 않습니다.
+@st.cache_resource
+def get_router():
+    router = Router(from_dict_graph(graph))
+    # 랜드마크와 CH 전처리를 미리 끝내 두어 첫 사용자도 기다리지 않게 합니다.
+    router.landmarks
+    router.hierarchy
+    return router
+
+@st.cache_resource
+def get_route_cache():
+    return RouteCache(maxsize=512)
+
+router = get_router()
+route_cache = get_route_cache()
+
+# 3. 메인 화면
+st.title("🗺️ AI 네비게이션 시스템")
+st.markdown("출발 도시와 도착 도시를 고르면 **최단 경로**를 찾아드립니다.")
+st.divider()
+
+cities = router.rg.names
+col1, col2, col3 = st.columns(3)
+with col1:
+    start_city = st.selectbox("🚩 출발", cities, index=cities.index("서울"))
+with col2:
+    end_city = st.selectbox("🏁 도착", cities, index=cities.index("부산"))
+with col3:
+    mode = st.selectbox("탐색 방식", list(MODE_LABELS), format_func=MODE_LABELS.get)
+
+# 같은 (출발, 도착, 방식) 질의는 캐시에서 바로 꺼냅니다.
+started = time.perf_counter()
+hits_before = route_cache.hits
+result = route_cache.get_or_compute(
+    (start_city, end_city, mode),
+    lambda: router.route(start_city, end_city, mode),
+)
+elapsed_ms = (time.perf_counter() - started) * 1000
+from_cache = route_cache.hits > hits_before
+
+if result.path:
+    st.success(f"🛣️ 최단 경로: {' -> '.join(result.path)}")
+    m1, m2, m3 = st.columns(3)
+    m1.metric("📏 총 거리", f"{result.distance:g} km")
+    m2.metric("확정한 도시 수", f"{result.settled} / {len(cities)}")
+    m3.metric("응답 시간", f"{elapsed_ms:.2f} ms", "캐시 적중" if from_cache else "새로 탐색", delta_color="off")
+else:
+    st.error("❌ 경로를 찾을 수 없습니다.")
+
+# 4. 캐시 현황
+st.divider()
+st.subheader("⚡ 경로 캐시 현황 (모든 사용자 공유)")
+stats = route_cache.stats()
+c1, c2, c3, c4 = st.columns(4)
+c1.metric("적중(hit)", stats["hits"])
+c2.metric("실패(miss)", stats["misses"])
+c3.metric("적중률", f"{stats['hit_rate'] * 100:.1f}%")
+c4.metric("저장된 경로", f"{stats['size']} / {stats['maxsize']}")
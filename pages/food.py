@@ -1,5 +1,14 @@
 import streamlit as st
 import random
+import os
+import sys
+
+# 프로젝트 루트의 image_cache 모듈을 불러오기 위해 경로 추가
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+from image_cache import default_cache
 
 # 1. 데이터 구성
 # "불안해요" 항목의 이미지를 확실한 '찻잔' 사진으로 변경했습니다.
@@ -39,6 +48,17 @@ food_data = {
 # 2. 페이지 기본 설정
 st.set_page_config(page_title="오늘 뭐 먹지?", page_icon="🍽️")
 
+# 메뉴 사진은 한 번만 내려받아 썸네일로 저장해 두고 로컬 바이트를 보여줍니다.
+# 프로세스가 처음 이 페이지를 열 때 모든 사진을 백그라운드로 미리 받아 둡니다.
+@st.cache_resource
+def get_image_cache():
+    cache = default_cache()
+    cache.prefetch_in_background(item['img'] for item in food_data.values())
+    return cache
+
+# 선택을 기다리지 않고 페이지를 열자마자 미리 받기를 시작합니다.
+image_cache = get_image_cache()
+
 # 3. 타이틀 및 헤더
 st.title("🍽️ 기분에 따른 메뉴 추천")
 st.markdown("지금 당신의 **기분**을 알려주세요. 딱 맞는 **음식**을 골라드릴게요!")
@@ -60,7 +80,9 @@ if selected_mood:
         col1, col2 = st.columns([1, 1.2])
         
         with col1:
-            st.image(recommendation['img'], caption=recommendation['menu'], use_column_width=True)
+            # 아직 받는 중이거나 내려받기에 실패했으면 기다리지 않고 원래 URL 로 표시
+            image = image_cache.get(recommendation['img'], wait=False) or recommendation['img']
+            st.image(image, caption=recommendation['menu'], use_column_width=True)
             
         with col2:
             st.info("💡 **추천 이유**")
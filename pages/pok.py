@@ -1,4 +1,13 @@
 import streamlit as st
+import os
+import sys
+
+# 프로젝트 루트의 image_cache 모듈을 불러오기 위해 경로 추가
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+from image_cache import default_cache
 
 # 1. MBTI별 포켓몬 데이터 (이름, 이미지ID, 이유)
 # 이미지는 PokeAPI의 공식 아트워크 URL을 사용합니다.
@@ -21,9 +30,24 @@ pokemon_data = {
     "ENTJ": {"name": "메타그로스 (Metagross)", "id": 376, "reason": "철저하고 계획적입니다. 네 개의 뇌로 슈퍼컴퓨터처럼 계산하여 반드시 승리를 쟁취합니다."}
 }
 
+def artwork_url(pokemon_id):
+    """PokeAPI 공식 아트워크 이미지 URL"""
+    return f"https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/{pokemon_id}.png"
+
 # 2. 페이지 기본 설정
 st.set_page_config(page_title="MBTI 포켓몬 도감", page_icon="🐾")
 
+# 아트워크는 한 번만 내려받아 썸네일로 저장해 두고 로컬 바이트를 보여줍니다.
+# 프로세스가 처음 이 페이지를 열 때 16마리 모두 백그라운드로 미리 받아 둡니다.
+@st.cache_resource
+def get_image_cache():
+    cache = default_cache()
+    cache.prefetch_in_background(artwork_url(item['id']) for item in pokemon_data.values())
+    return cache
+
+# 선택을 기다리지 않고 페이지를 열자마자 미리 받기를 시작합니다.
+image_cache = get_image_cache()
+
 # 3. 헤더 영역
 st.title("🐾 나의 MBTI 포켓몬 찾기")
 st.markdown("당신의 **MBTI** 성향과 가장 닮은 **포켓몬**은 누구일까요?")
@@ -45,7 +69,7 @@ if selected_mbti:
     data = pokemon_data[selected_mbti]
     
     # 이미지 URL 생성 (PokeAPI 공식 아트워크 사용)
-    image_url = f"https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/{data['id']}.png"
+    image_url = artwork_url(data['id'])
     
     st.subheader(f"당신은... {data['name']} 타입!")
     
@@ -53,7 +77,9 @@ if selected_mbti:
     res_col1, res_col2 = st.columns([1, 1])
     
     with res_col1:
-        st.image(image_url, caption=data['name'], use_column_width=True)
+        # 아직 받는 중이거나 내려받기에 실패했으면 기다리지 않고 원래 URL 로 표시
+        image = image_cache.get(image_url, wait=False) or image_url
+        st.image(image, caption=data['name'], use_column_width=True)
         
     with res_col2:
         st.success("매칭 이유")
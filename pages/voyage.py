@@ -2,6 +2,15 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import os
+import sys
+
+# 프로젝트 루트의 tourism 패키지와 data_loader 모듈을 불러오기 위해 경로 추가
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+from data_loader import MOCK_VERSION, default_loader
+from tourism import MIME_TYPES, ExportCache, PlaceIndex, TourismCube, available_formats, normalize
 
 # -----------------------------------------------------------------------------
 # 1. 페이지 설정 (반드시 코드 맨 윗줄에 있어야 함)
@@ -41,23 +50,36 @@ def create_mock_data():
     }
     return pd.DataFrame(data)
 
-@st.cache_data
+# korea_tourism.csv 는 공용 로더가 프로젝트 폴더(또는 pages 폴더)에서 찾아
+# (경로, mtime, 크기) 별로 한 번만 읽습니다. 파일이 없거나 필수 컬럼이 없으면 가상 데이터 반환
 def load_data():
-    file_name = "korea_tourism.csv"
-    
-    # 1. 현재 폴더 확인
-    if os.path.exists(file_name):
-        return pd.read_csv(file_name)
-    
-    # 2. 상위 폴더 확인 (pages 폴더 내 실행 대비)
-    if os.path.exists(f"../{file_name}"):
-        return pd.read_csv(f"../{file_name}")
-        
-    # 3. 파일 없으면 가상 데이터 반환
-    return create_mock_data()
+    return default_loader().load("tourism", fallback=create_mock_data)
+
+# 검색 결과는 일치도 상위 MAX_SEARCH_RESULTS 건까지만 표시·다운로드합니다.
+MAX_SEARCH_RESULTS = 1000
+
+# 검색 인덱스는 데이터 판마다 한 번만 만들고 모든 세션이 공유합니다.
+# 표(_df)는 캐시 키에서 빼고 그 표의 판(version)만 키로 쓰며, 최신 판 하나만 보관합니다.
+@st.cache_resource(max_entries=1)
+def get_search_index(version, _df):
+    return PlaceIndex.from_frame(_df)
+
+# 집계 큐브(지역 x 카테고리 x 관광지 x 월)도 데이터 판마다 한 번만 만듭니다.
+# 로더가 이미 읽어 둔 표에서 부분합만 모으므로 CSV 를 다시 해석하지 않습니다.
+@st.cache_resource(max_entries=1)
+def get_cube(version, _df):
+    return TourismCube.from_frame(_df)
+
+# 다운로드 파일 캐시: 모든 세션이 공유하며, (데이터 판, 검색어, 형식) 별로 한 번만 만듭니다.
+@st.cache_resource
+def get_export_cache():
+    return ExportCache()
 
 # 데이터 불러오기
-df = load_data()
+# version: 데이터 판 구분용 키 (파일이면 (경로, mtime, 크기), 가상 데이터면 'mock')
+loaded = load_data()
+version, df = loaded.version, loaded.frame
+st.sidebar.caption(f"⏱️ 데이터 읽기 {loaded.seconds:.2f}초" + (" · 저장된 표 사용" if loaded.cached else ""))
 
 # -----------------------------------------------------------------------------
 # 3. 메인 대시보드 UI
@@ -66,7 +88,7 @@ st.title("🇰🇷 대한민국 인기 관광지 방문 현황")
 st.markdown("데이터 출처가 없으면 **예시 데이터**로 한국 주요 관광지 방문객 수를 시각화합니다.")
 
 # 데이터 정보 표시 (사이드바 활용 가능하지만 직관적으로 상단 배치)
-if not os.path.exists("korea_tourism.csv") and not os.path.exists("../korea_tourism.csv"):
+if version == MOCK_VERSION:
     st.info("💡 **알림:** 업로드된 데이터 파일이 없어 **샘플 데이터**를 사용 중입니다.")
 
 # 탭 구성
@@ -76,8 +98,9 @@ tab1, tab2, tab3 = st.tabs(["🏆 인기 순위 TOP 10", "📍 지역별 통계"
 with tab1:
     st.subheader("가장 많은 사람들이 방문한 관광지 TOP 10")
     
-    # 방문객 수 기준 정렬 및 TOP 10 추출
-    top10 = df.sort_values(by='방문객수(만명)', ascending=False).head(10)
+    # 방문객 수 순위는 큐브에 정렬해 둔 것을 앞에서 10개만 잘라 씁니다.
+    cube = get_cube(version, df)
+    top10 = cube.frame(cube.top_attractions(10))
     
     # 스트림릿 내장 차트는 인덱스를 X축으로 사용하므로 설정 필요
     chart_data = top10.set_index('관광지명')[['방문객수(만명)']]
@@ -89,37 +112,58 @@ with tab1:
 
 # --- 탭 2: 지역별/카테고리별 분석 ---
 with tab2:
+    # 합계·분포는 모두 큐브 배열에서 bincount 로 구하므로 원본 행은 다시 보지 않습니다.
+    period = None
+    if len(cube.periods) > 1:
+        period_choice = st.selectbox("기간", ["전체 기간"] + cube.periods)
+        period = None if period_choice == "전체 기간" else period_choice
+
     col1, col2 = st.columns(2)
     
     with col1:
         st.subheader("지역별 총 방문객 수")
-        # 지역별 그룹화
-        region_sum = df.groupby('지역')['방문객수(만명)'].sum().sort_values(ascending=False)
+        region_sum = cube.by_region(period=period)
         st.bar_chart(region_sum)
         
     with col2:
         st.subheader("관광지 카테고리 분포")
-        # 카테고리별 개수 세기
-        category_counts = df['카테고리'].value_counts()
+        # 카테고리별 관광지 수
+        category_counts = cube.category_counts()
         st.bar_chart(category_counts)
 
+    # 지역 세부 분석 (drill-down)
+    st.divider()
+    region = st.selectbox("세부 분석할 지역", list(region_sum.index))
+    col3, col4 = st.columns(2)
+    with col3:
+        st.metric(f"{region} 총 방문객", f"{cube.total(region=region, period=period):,.0f} 만 명")
+        st.bar_chart(cube.by_category(region=region, period=period))
+    with col4:
+        st.markdown(f"**{region} 인기 관광지 TOP 5**")
+        st.dataframe(cube.frame(cube.top_attractions(5, region=region, period=period), period), use_container_width=True, hide_index=True)
+
 # --- 탭 3: 전체 데이터 조회 ---
 with tab3:
     st.subheader("전체 데이터 목록")
     
     # 검색 기능 추가
-    search_term = st.text_input("관광지 이름 검색:")
+    # 관광지명·지역·카테고리 부분 일치, 초성(예: ㅇㅂㄹㄷ) 검색 지원. 결과는 일치도 순으로 정렬됩니다.
+    search_term = st.text_input("관광지 이름 검색:", placeholder="예: 랜드, 서울, ㄱㅂㄱ")
     if search_term:
-        filtered_df = df[df['관광지명'].str.contains(search_term)]
-        st.dataframe(filtered_df, use_container_width=True)
+        rows = get_search_index(version, df).search(search_term, limit=MAX_SEARCH_RESULTS)
+        filtered_df = df.iloc[rows]
+        if len(rows) == MAX_SEARCH_RESULTS:
+            st.caption(f"일치도 상위 {MAX_SEARCH_RESULTS:,}건까지만 표시합니다. 검색어를 더 구체적으로 입력해 보세요.")
     else:
-        st.dataframe(df, use_container_width=True)
+        filtered_df = df
+    st.dataframe(filtered_df, use_container_width=True)
 
-    # 데이터 다운로드 버튼
-    csv = df.to_csv(index=False).encode('utf-8-sig')
+    # 데이터 다운로드 버튼 (화면에 보이는 목록 그대로)
+    # 파일 내용은 버튼을 누를 때 처음 만들어지고, 같은 데이터·검색어·형식이면 저장된 파일을 다시 씁니다.
+    export_format = st.radio("파일 형식", available_formats(), format_func=str.upper, horizontal=True)
     st.download_button(
-        label="데이터 CSV 다운로드",
-        data=csv,
-        file_name='korea_tourism_data.csv',
-        mime='text/csv',
+        label=f"데이터 {export_format.upper()} 다운로드",
+        data=get_export_cache().data(lambda: filtered_df, version, normalize(search_term), export_format),
+        file_name=f'korea_tourism_data.{export_format}',
+        mime=MIME_TYPES[export_format],
     )
@@ -0,0 +1,38 @@
+"""map.py 네비게이션을 큰 도로망에서도 돌릴 수 있게 만든 경로 탐색 엔진"""
+
+from .graph import RoutingGraph, from_dict_graph
+from .dijkstra import INF, dijkstra, shortest_path
+from .table import DistanceTable, build_distance_table
+from .batch import DistanceMatrix, many_to_many, shortest_path_tree
+from .search import Landmarks, alt_search, bidirectional_dijkstra
+from .ch import ContractionHierarchy, build_contraction_hierarchy
+from .router import RouteResult, Router
+from .cache import RouteCache
+from .dynamic import DynamicRouter
+from .loader import load_graph, open_graph_cache, read_edge_list, write_graph_cache
+
+__all__ = [
+    "RoutingGraph",
+    "from_dict_graph",
+    "INF",
+    "dijkstra",
+    "shortest_path",
+    "DistanceTable",
+    "build_distance_table",
+    "DistanceMatrix",
+    "many_to_many",
+    "shortest_path_tree",
+    "Landmarks",
+    "alt_search",
+    "bidirectional_dijkstra",
+    "ContractionHierarchy",
+    "build_contraction_hierarchy",
+    "RouteResult",
+    "Router",
+    "RouteCache",
+    "DynamicRouter",
+    "load_graph",
+    "open_graph_cache",
+    "read_edge_list",
+    "write_graph_cache",
+]
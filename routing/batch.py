@@ -0,0 +1,127 @@
+import heapq
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .dijkstra import INF, build_path
+
+# ==========================================
+# 여러 출발지 x 여러 도착지 일괄 질의 (many-to-many)
+# ==========================================
+# 출발지 N 개 x 도착지 M 개를 find_shortest_path 로 풀면 N*M 번 탐색을 처음부터 다시 합니다.
+# 여기서는 서로 다른 출발지마다 최단 경로 트리(shortest-path tree)를 한 번만 만들고,
+# 거리 행렬과 경로 복원은 모두 그 트리에서 꺼내 씁니다.
+
+
+def shortest_path_tree(rg, source, targets=None):
+    """source 에서의 최단 경로 트리 (거리 배열, 이전 노드 배열).
+
+    targets 를 주면 그 노드들이 모두 확정되는 순간 탐색을 멈춥니다.
+    """
+    offsets = rg.offsets
+    edge_targets = rg.targets
+    weights = rg.weights
+
+    dist = array('d', [INF]) * rg.num_nodes
+    prev = array('q', [-1]) * rg.num_nodes
+    dist[source] = 0.0
+    heap = [(0.0, source)]
+    remaining = set(targets) if targets is not None else None
+
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue
+        if remaining is not None:
+            remaining.discard(u)
+            if not remaining:
+                break
+
+        for pos in range(offsets[u], offsets[u + 1]):
+            v = edge_targets[pos]
+            nd = d + weights[pos]
+            if nd < dist[v]:
+                dist[v] = nd
+                prev[v] = u
+                heapq.heappush(heap, (nd, v))
+
+    return dist, prev
+
+
+class DistanceMatrix:
+    """many_to_many() 결과: 거리 행렬 + 출발지별 최단 경로 트리"""
+
+    def __init__(self, rg, sources, targets, distances, trees):
+        self.rg = rg
+        self.sources = list(sources)
+        self.targets = list(targets)
+        self.distances = distances  # shape = (출발지 수, 도착지 수), 길이 없으면 inf
+        self._trees = trees  # {출발 id: prev 배열}
+
+    def distance(self, start, end):
+        return float(self.distances[self.sources.index(start), self.targets.index(end)])
+
+    def path(self, start, end):
+        """필요할 때만 트리를 거슬러 올라가 (경로, 총 거리) 를 만듭니다."""
+        rg = self.rg
+        source = rg.node_id(start)
+        target = rg.node_id(end)
+        if source not in self._trees:
+            raise KeyError(f"출발지 목록에 없는 도시입니다: {start}")
+
+        distance = self.distance(start, end)
+        if distance == INF:
+            return None, None
+        path = build_path(self._trees[source], source, target)
+        return [rg.names[node] for node in path], distance
+
+    def to_dataframe(self):
+        """출발지를 행, 도착지를 열로 하는 pandas DataFrame"""
+        import pandas as pd
+
+        return pd.DataFrame(self.distances, index=self.sources, columns=self.targets)
+
+
+# 프로세스 풀 작업자는 시작할 때 그래프를 한 번만 전달받아 전역에 보관합니다.
+_worker_graph = None
+
+
+def _init_worker(rg):
+    global _worker_graph
+    _worker_graph = rg
+
+
+def _worker_tree(args):
+    source, target_ids = args
+    dist, prev = shortest_path_tree(_worker_graph, source, target_ids)
+    return source, dist, prev
+
+
+def many_to_many(rg, sources, targets, processes=None):
+    """출발지 목록 x 도착지 목록의 최단 거리 행렬을 계산합니다.
+
+    processes 에 2 이상을 주면 출발지들을 프로세스 풀에 나눠서 계산합니다.
+    """
+    source_ids = list(dict.fromkeys(rg.node_id(name) for name in sources))
+    target_ids = [rg.node_id(name) for name in targets]
+    jobs = [(source, target_ids) for source in source_ids]
+
+    if processes and processes > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker, initargs=(rg,)) as pool:
+            results = list(pool.map(_worker_tree, jobs))
+    else:
+        results = [(source,) + shortest_path_tree(rg, source, target_ids) for source, target_ids in jobs]
+
+    dists = {}
+    trees = {}
+    for source, dist, prev in results:
+        dists[source] = dist
+        trees[source] = prev
+
+    distances = np.empty((len(sources), len(targets)))
+    for row, name in enumerate(sources):
+        dist = dists[rg.node_id(name)]
+        distances[row] = [dist[target] for target in target_ids]
+
+    return DistanceMatrix(rg, sources, targets, distances, trees)
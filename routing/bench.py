@@ -0,0 +1,260 @@
+"""경로 탐색 벤치마크
+
+    python -m routing.bench                                   # 기본: 16 ~ 1M 노드, 모든 그래프/방식
+    python -m routing.bench --sizes 16,256,4096 --families grid --out result.json
+    python -m routing.bench --compare old.json new.json       # 두 결과 비교 (느려진 항목 표시)
+
+결과는 JSON 파일로 저장되며, 항목마다 (그래프 종류, 노드 수, 방식, 단계) 와
+소요 시간, 확정 노드 수, 최대 메모리(RSS, 선택 시 tracemalloc) 가 기록됩니다.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from .batch import many_to_many
+from .ch import build_contraction_hierarchy
+from .generators import GENERATORS
+from .router import Router
+from .table import build_distance_table
+
+DEFAULT_SIZES = (16, 256, 4096, 65536, 1048576)
+
+# 방식별로 돌릴 최대 노드 수 (None = 제한 없음).
+# map.py 의 기준 구현은 O(V^2), 전 구간 테이블은 O(V^2) 메모리, CH 전처리는 순수 파이썬이라 오래 걸립니다.
+# (CH 는 4096 노드에서도 전처리에 10초 이상 걸리므로, 더 큰 그래프는 --no-limits 로 직접 돌리세요.)
+MODE_MAX_NODES = {
+    "baseline": 4096,
+    "dijkstra": None,
+    "bidirectional": None,
+    "alt": None,
+    "ch": 4096,
+    "table": 2048,
+}
+
+
+def _peak_rss_kb():
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage // 1024 if sys.platform == "darwin" else usage
+
+
+class _Measure:
+    """with 블록의 소요 시간과 (켜져 있으면) tracemalloc 최대 메모리를 잽니다."""
+
+    def __init__(self, trace_memory):
+        self.trace_memory = trace_memory
+        self.seconds = 0.0
+        self.peak_traced_bytes = None
+
+    def __enter__(self):
+        if self.trace_memory:
+            tracemalloc.start()
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.seconds = time.perf_counter() - self._started
+        if self.trace_memory:
+            self.peak_traced_bytes = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        return False
+
+
+def _query_pairs(n, count, seed):
+    rng = random.Random(seed)
+    return [(str(rng.randrange(n)), str(rng.randrange(n))) for _ in range(count)]
+
+
+def _summarize(latencies):
+    latencies = sorted(latencies)
+    return {
+        "queries": len(latencies),
+        "mean_seconds": statistics.fmean(latencies),
+        "median_seconds": statistics.median(latencies),
+        "p95_seconds": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+    }
+
+
+def run_case(family, n, modes, queries=50, seed=0, trace_memory=False, limits=MODE_MAX_NODES, log=print):
+    """그래프 하나를 만들고 각 방식의 전처리/단일 질의/일괄 질의를 측정합니다."""
+    records = []
+
+    def record(mode, phase, measure, **extra):
+        entry = {
+            "family": family,
+            "nodes": n,
+            "edges": rg.num_edges if rg is not None else None,
+            "mode": mode,
+            "phase": phase,
+            "seconds": measure.seconds,
+            "peak_rss_kb": _peak_rss_kb(),
+            "peak_traced_bytes": measure.peak_traced_bytes,
+        }
+        entry.update(extra)
+        records.append(entry)
+        log(f"  {family:<10} n={n:<8} {mode:<13} {phase:<10} {measure.seconds:10.4f}s {extra.get('mean_settled', '')}")
+
+    rg = None
+    with _Measure(trace_memory) as m:
+        rg = GENERATORS[family](n, seed=seed)
+    record("graph", "generate", m)
+
+    router = Router(rg)
+    pairs = _query_pairs(n, queries, seed)
+
+    for mode in modes:
+        if mode == "batch":
+            continue
+        limit = limits.get(mode)
+        if limit is not None and n > limit:
+            continue
+
+        # 1. 전처리
+        if mode == "baseline":
+            import map as reference  # map.py 의 원래 find_shortest_path
+
+            with _Measure(trace_memory) as m:
+                graph_dict = rg.to_dict()
+            record(mode, "preprocess", m)
+            query = lambda a, b: (reference.find_shortest_path(graph_dict, a, b), None)
+        elif mode == "table":
+            with _Measure(trace_memory) as m:
+                table = build_distance_table(rg)
+            record(mode, "preprocess", m)
+            query = lambda a, b: (table.route(a, b), None)
+        else:
+            if mode == "alt":
+                with _Measure(trace_memory) as m:
+                    router.landmarks
+                record(mode, "preprocess", m)
+            elif mode == "ch":
+                with _Measure(trace_memory) as m:
+                    router._hierarchy = build_contraction_hierarchy(rg, measure_memory=False)
+                record(mode, "preprocess", m, shortcuts=router.hierarchy.stats["shortcuts"])
+
+            def query(a, b, mode=mode):
+                result = router.route(a, b, mode)
+                return result, result.settled
+
+        # 2. 단일 질의
+        latencies, settled = [], []
+        with _Measure(trace_memory) as total:
+            for a, b in pairs:
+                started = time.perf_counter()
+                _, count = query(a, b)
+                latencies.append(time.perf_counter() - started)
+                if count is not None:
+                    settled.append(count)
+        extra = _summarize(latencies)
+        if settled:
+            extra["mean_settled"] = statistics.fmean(settled)
+        record(mode, "query", total, **extra)
+
+    # 3. 일괄 질의 (출발지 8 x 도착지 64, 방식과 무관한 API)
+    if "batch" in modes:
+        rng = random.Random(seed + 1)
+        sources = [str(rng.randrange(n)) for _ in range(min(8, n))]
+        targets = [str(rng.randrange(n)) for _ in range(min(64, n))]
+        with _Measure(trace_memory) as m:
+            many_to_many(rg, sources, targets)
+        record("batch", "query", m, sources=len(sources), targets=len(targets))
+
+    return records
+
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, families=tuple(GENERATORS), modes=None, queries=50, seed=0,
+                   trace_memory=False, limits=MODE_MAX_NODES, log=print):
+    modes = list(modes) if modes else list(MODE_MAX_NODES) + ["batch"]
+    results = []
+    for family in families:
+        for n in sizes:
+            results.extend(run_case(family, n, modes, queries, seed, trace_memory, limits, log))
+    return {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "queries": queries,
+            "trace_memory": trace_memory,
+        },
+        "results": results,
+    }
+
+
+def compare(old, new, threshold=1.2):
+    """두 결과에서 같은 항목의 시간 비율(new / old)을 구합니다. threshold 이상이면 회귀로 표시."""
+    key = lambda r: (r["family"], r["nodes"], r["mode"], r["phase"])
+    old_by_key = {key(r): r for r in old["results"]}
+    rows = []
+    for r in new["results"]:
+        before = old_by_key.get(key(r))
+        if before is None or not before["seconds"]:
+            continue
+        field = "mean_seconds" if "mean_seconds" in r and "mean_seconds" in before else "seconds"
+        ratio = r[field] / before[field] if before[field] else float('inf')
+        rows.append(key(r) + (ratio, ratio >= threshold))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="경로 탐색 벤치마크")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="쉼표로 구분한 노드 수")
+    parser.add_argument("--families", default=",".join(GENERATORS), help="grid, geometric, scale_free")
+    parser.add_argument("--modes", default=None, help="baseline, dijkstra, bidirectional, alt, ch, table, batch")
+    parser.add_argument("--queries", type=int, default=50, help="방식별 단일 질의 횟수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--trace-memory", action="store_true", help="tracemalloc 으로 단계별 최대 메모리 측정 (느려짐)")
+    parser.add_argument("--no-limits", action="store_true", help="방식별 최대 노드 수 제한을 끕니다")
+    parser.add_argument("--out", default="bench_results.json")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="두 결과 파일 비교")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        with open(args.compare[0], encoding='utf-8') as f:
+            old = json.load(f)
+        with open(args.compare[1], encoding='utf-8') as f:
+            new = json.load(f)
+        regressions = 0
+        for family, n, mode, phase, ratio, slower in compare(old, new):
+            regressions += slower
+            print(f"{'⚠️ ' if slower else '  '}{family:<10} n={n:<8} {mode:<13} {phase:<10} x{ratio:.2f}")
+        return 1 if regressions else 0
+
+    report = run_benchmarks(
+        sizes=[int(s) for s in args.sizes.split(",")],
+        families=args.families.split(","),
+        modes=args.modes.split(",") if args.modes else None,
+        queries=args.queries,
+        seed=args.seed,
+        trace_memory=args.trace_memory,
+        limits={} if args.no_limits else MODE_MAX_NODES,
+    )
+    with open(args.out, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"결과 저장: {args.out} ({len(report['results'])} 항목)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,14 @@
+from cache_utils import BoundedLRU
+
+# ==========================================
+# 질의 결과 LRU 캐시
+# ==========================================
+# Streamlit 의 여러 세션(사용자)이 같은 프로세스에서 하나의 캐시를 공유하므로 lock 으로 보호합니다.
+# 인기 있는 (출발, 도착, 방식) 조합은 탐색 없이 바로 결과를 돌려줍니다.
+
+
+class RouteCache(BoundedLRU):
+    """항목 수로 제한된 경로 검색 결과 LRU 캐시 (적중/실패 횟수 집계)"""
+
+    def __init__(self, maxsize=1024):
+        super().__init__(maxsize=maxsize)
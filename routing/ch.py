@@ -0,0 +1,319 @@
+import heapq
+import time
+import tracemalloc
+from array import array
+
+import numpy as np
+
+from .dijkstra import INF
+
+# ==========================================
+# Contraction Hierarchies (CH)
+# ==========================================
+# 전처리:
+#   1. 중요도가 낮은 노드부터 하나씩 "축약(contract)"합니다.
+#   2. 노드 v 를 지우면 끊기는 최단 경로 u -> v -> w 마다 지름길(shortcut) u -> w 를 넣습니다.
+#      (v 없이도 그만큼 짧은 우회로(witness)가 있으면 넣지 않습니다.)
+#   3. 축약 순서가 곧 rank 이며, 간선을 "rank 가 올라가는 방향"만 남겨 up / down 그래프로 저장합니다.
+# 질의:
+#   출발지에서는 up 그래프로, 도착지에서는 down 그래프로 rank 가 높은 쪽으로만 탐색해
+#   만나는 지점 중 가장 짧은 합을 고릅니다. 탐색 공간이 매우 작아 큰 도로망에서도 빠릅니다.
+#   지름길 간선은 middle(가운데 노드)를 기록해 두었다가 원래의 도시 단위 경로로 풀어냅니다.
+
+# 우회로(witness) 탐색에서 확정할 최대 노드 수. 작을수록 전처리가 빠르지만 지름길이 늘어납니다.
+WITNESS_SETTLE_LIMIT = 60
+
+
+def _witness_search(out_edges, source, excluded, max_dist, limit):
+    """excluded 노드를 거치지 않는 source 기준 제한 Dijkstra (max_dist 를 넘으면 중단)"""
+    dist = {source: 0.0}
+    heap = [(0.0, source)]
+    settled = 0
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue
+        if d > max_dist or settled >= limit:
+            break
+        settled += 1
+        for v, (w, _) in out_edges[u].items():
+            if v == excluded:
+                continue
+            nd = d + w
+            if nd < dist.get(v, INF):
+                dist[v] = nd
+                heapq.heappush(heap, (nd, v))
+    return dist
+
+
+def _shortcuts_for(v, out_edges, in_edges, limit):
+    """v 를 축약할 때 필요한 지름길 목록 [(u, w, 거리)]"""
+    shortcuts = []
+    outgoing = out_edges[v]
+    if not outgoing:
+        return shortcuts
+    max_out = max(w for w, _ in outgoing.values())
+
+    for u, (w_uv, _) in in_edges[v].items():
+        dist = _witness_search(out_edges, u, v, w_uv + max_out, limit)
+        for w, (w_vw, _) in outgoing.items():
+            if w == u:
+                continue
+            via = w_uv + w_vw
+            if dist.get(w, INF) > via:
+                shortcuts.append((u, w, via))
+    return shortcuts
+
+
+def _to_csr(num_nodes, sources, targets, weights, middles):
+    """간선 목록을 출발 노드 기준 CSR 배열 4개로 정리합니다."""
+    sources = np.asarray(sources, dtype=np.int64)
+    order = np.argsort(sources, kind='stable')
+    offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=num_nodes), out=offsets[1:])
+    return (
+        offsets,
+        np.asarray(targets, dtype=np.int64)[order],
+        np.asarray(weights, dtype=np.float64)[order],
+        np.asarray(middles, dtype=np.int64)[order],
+    )
+
+
+def _as_array(values, typecode):
+    """탐색 루프에서 빠르게 인덱싱할 수 있도록 NumPy 배열을 array 로 바꿉니다."""
+    result = array(typecode)
+    result.frombytes(np.ascontiguousarray(values).tobytes())
+    return result
+
+
+class ContractionHierarchy:
+    """전처리가 끝난 CH: rank 와 up / down 그래프 (지름길의 middle 포함)"""
+
+    ARRAYS = (
+        "rank",
+        "up_offsets", "up_targets", "up_weights", "up_middle",
+        "down_offsets", "down_targets", "down_weights", "down_middle",
+    )
+
+    def __init__(self, names, **arrays):
+        self.names = list(names)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.stats = {}
+        for key in self.ARRAYS:
+            typecode = 'd' if key.endswith('weights') else 'q'
+            setattr(self, key, _as_array(arrays[key], typecode))
+
+    @property
+    def num_shortcuts(self):
+        return sum(1 for m in self.up_middle if m >= 0) + sum(1 for m in self.down_middle if m >= 0)
+
+    def query(self, source, target):
+        """정수 id 기준 질의. (거리, id 경로, 확정 노드 수)"""
+        if source == target:
+            return 0.0, [source], 1
+
+        sides = (
+            (self.up_offsets, self.up_targets, self.up_weights),
+            (self.down_offsets, self.down_targets, self.down_weights),
+        )
+        dist = ({source: 0.0}, {target: 0.0})
+        prev = ({source: -1}, {target: -1})
+        heaps = ([(0.0, source)], [(0.0, target)])
+        best = INF
+        meeting = -1
+        settled = 0
+
+        # 두 방향 모두 rank 가 오르는 쪽으로만 가므로 각 방향을 best 이상이 될 때까지 돌립니다.
+        while heaps[0] or heaps[1]:
+            for side in (0, 1):
+                heap = heaps[side]
+                if not heap:
+                    continue
+                d, u = heapq.heappop(heap)
+                if d >= best:
+                    heap.clear()
+                    continue
+                my_dist = dist[side]
+                if d > my_dist[u]:
+                    continue
+                settled += 1
+
+                other = dist[1 - side].get(u)
+                if other is not None and d + other < best:
+                    best = d + other
+                    meeting = u
+
+                offsets, targets, weights = sides[side]
+                my_prev = prev[side]
+                for pos in range(offsets[u], offsets[u + 1]):
+                    v = targets[pos]
+                    nd = d + weights[pos]
+                    if nd < my_dist.get(v, INF):
+                        my_dist[v] = nd
+                        my_prev[v] = u
+                        heapq.heappush(heap, (nd, v))
+
+        if meeting == -1:
+            return INF, None, settled
+
+        # 지름길이 섞인 경로: source -> ... -> meeting -> ... -> target
+        packed = []
+        node = meeting
+        while node != -1:
+            packed.append(node)
+            node = prev[0][node]
+        packed.reverse()
+        node = prev[1][meeting]
+        while node != -1:
+            packed.append(node)
+            node = prev[1][node]
+
+        # best 는 지름길 거리(이미 더해진 합)를 다른 순서로 더한 값이라 마지막 자리가 다를 수 있으므로,
+        # 펼친 경로의 원래 간선 거리를 경로 순서대로 다시 더해 Dijkstra 와 똑같은 값을 돌려줍니다.
+        path, distance = self._unpack(packed)
+        return distance, path, settled
+
+    def _edge(self, a, b):
+        """간선 a -> b 의 (가운데 노드, 거리). 원래 간선이면 가운데 노드는 -1"""
+        if self.rank[a] < self.rank[b]:
+            offsets, targets, weights, middles, start, end = (
+                self.up_offsets, self.up_targets, self.up_weights, self.up_middle, a, b)
+        else:
+            offsets, targets, weights, middles, start, end = (
+                self.down_offsets, self.down_targets, self.down_weights, self.down_middle, b, a)
+        for pos in range(offsets[start], offsets[start + 1]):
+            if targets[pos] == end:
+                return middles[pos], weights[pos]
+        raise KeyError(f"CH 에 없는 간선입니다: {a} -> {b}")
+
+    def _unpack(self, packed):
+        """지름길 a -> b (middle m) 을 a -> m -> b 로 재귀적으로 펼칩니다. (id 경로, 원래 간선 거리의 합)"""
+        path = [packed[0]]
+        distance = 0.0
+        stack = [(a, b) for a, b in zip(packed[-2::-1], packed[:0:-1])]
+        while stack:
+            a, b = stack.pop()
+            m, w = self._edge(a, b)
+            if m < 0:
+                path.append(b)
+                distance += w
+            else:
+                stack.append((m, b))
+                stack.append((a, m))
+        return path, distance
+
+    def route(self, start, end):
+        """find_shortest_path 와 같은 (경로, 총 거리). 길이 없으면 (None, None)"""
+        distance, path, _ = self.query(self.index[start], self.index[end])
+        if path is None:
+            return None, None
+        return [self.names[node] for node in path], distance
+
+    def save(self, file_path):
+        """up / down 그래프를 바이너리(.npz) 파일로 저장합니다."""
+        arrays = {
+            key: np.frombuffer(getattr(self, key), dtype=np.float64 if key.endswith('weights') else np.int64)
+            for key in self.ARRAYS
+        }
+        with open(file_path, 'wb') as f:
+            np.savez(f, names=np.array(self.names), **arrays)
+
+    @classmethod
+    def load(cls, file_path):
+        with np.load(file_path, allow_pickle=False) as data:
+            return cls(data['names'].tolist(), **{key: data[key] for key in cls.ARRAYS})
+
+    def __repr__(self):
+        return f"ContractionHierarchy(nodes={len(self.names)}, shortcuts={self.num_shortcuts})"
+
+
+def build_contraction_hierarchy(rg, witness_limit=WITNESS_SETTLE_LIMIT, measure_memory=True):
+    """RoutingGraph 를 축약해 ContractionHierarchy 를 만듭니다.
+
+    결과의 stats 에 전처리 시간(초), 최대 메모리(바이트), 지름길 수가 기록됩니다.
+    measure_memory 를 켜면 tracemalloc 때문에 전처리가 조금 느려집니다.
+    """
+    tracing = measure_memory and not tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.start()
+    started = time.perf_counter()
+
+    n = rg.num_nodes
+    # 축약 중에 계속 바뀌는 그래프: out_edges[u] = {v: (거리, middle)}
+    out_edges = [{} for _ in range(n)]
+    in_edges = [{} for _ in range(n)]
+    for u in range(n):
+        for v, w in rg.neighbors(u):
+            if u != v and w < out_edges[u].get(v, (INF,))[0]:
+                out_edges[u][v] = (w, -1)
+                in_edges[v][u] = (w, -1)
+
+    deleted_neighbors = [0] * n
+
+    def priority(v):
+        # edge difference: 추가될 지름길 수 - 사라지는 간선 수 (+ 이미 축약된 이웃 수로 고르게 분산)
+        shortcuts = _shortcuts_for(v, out_edges, in_edges, witness_limit)
+        value = len(shortcuts) - len(in_edges[v]) - len(out_edges[v]) + deleted_neighbors[v]
+        return value, shortcuts
+
+    heap = [(priority(v)[0], v) for v in range(n)]
+    heapq.heapify(heap)
+
+    rank = np.zeros(n, dtype=np.int64)
+    up = ([], [], [], [])
+    down = ([], [], [], [])
+    next_rank = 0
+    num_shortcuts = 0
+
+    while heap:
+        _, v = heapq.heappop(heap)
+        # lazy update: 우선순위를 다시 계산해 여전히 가장 작을 때만 축약
+        current, shortcuts = priority(v)
+        if heap and current > heap[0][0]:
+            heapq.heappush(heap, (current, v))
+            continue
+
+        rank[v] = next_rank
+        next_rank += 1
+
+        # 남아 있는 이웃은 모두 v 보다 나중에 축약되므로(rank 가 높음) 지금 간선이 최종 간선입니다.
+        for w, (weight, middle) in out_edges[v].items():
+            for column, value in zip(up, (v, w, weight, middle)):
+                column.append(value)
+        for u, (weight, middle) in in_edges[v].items():
+            for column, value in zip(down, (v, u, weight, middle)):
+                column.append(value)
+
+        for u, w, via in shortcuts:
+            if via < out_edges[u].get(w, (INF,))[0]:
+                out_edges[u][w] = (via, v)
+                in_edges[w][u] = (via, v)
+                num_shortcuts += 1
+
+        for w in out_edges[v]:
+            del in_edges[w][v]
+            deleted_neighbors[w] += 1
+        for u in in_edges[v]:
+            del out_edges[u][v]
+            deleted_neighbors[u] += 1
+        out_edges[v] = {}
+        in_edges[v] = {}
+
+    up_csr = _to_csr(n, *up)
+    down_csr = _to_csr(n, *down)
+    arrays = {"rank": rank}
+    for prefix, csr in (("up", up_csr), ("down", down_csr)):
+        for key, values in zip(("offsets", "targets", "weights", "middle"), csr):
+            arrays[f"{prefix}_{key}"] = values
+
+    ch = ContractionHierarchy(rg.names, **arrays)
+    ch.stats = {
+        "preprocess_seconds": time.perf_counter() - started,
+        "peak_memory_bytes": tracemalloc.get_traced_memory()[1] if tracing else None,
+        "shortcuts": num_shortcuts,
+        "edges": rg.num_edges,
+        "ch_edges": len(up[0]) + len(down[0]),
+    }
+    if tracing:
+        tracemalloc.stop()
+    return ch
@@ -0,0 +1,75 @@
+import heapq
+
+INF = float('inf')
+
+# ==========================================
+# 우선순위 큐(heapq) 기반 Dijkstra
+# ==========================================
+# map.py 의 find_shortest_path 는 매번 unvisited 전체를 훑어 최소 거리를 찾기 때문에
+# 한 번의 질의가 O(V^2) 입니다. 여기서는 힙에서 가장 가까운 노드를 꺼내므로
+# O((V + E) log V) 로 동작합니다.
+# 같은 노드가 힙에 여러 번 들어갈 수 있으며, 이미 확정된 거리보다 큰 항목은 꺼낼 때 건너뜁니다.
+
+
+def dijkstra(rg, source, target=None):
+    """정수 id 기준 단일 출발점 Dijkstra.
+
+    target 을 주면 그 노드가 확정되는 즉시 멈춥니다.
+    (거리 리스트, 이전 노드 리스트, 확정(settled)된 노드 수) 를 돌려줍니다.
+    """
+    offsets = rg.offsets
+    targets = rg.targets
+    weights = rg.weights
+
+    dist = [INF] * rg.num_nodes
+    prev = [-1] * rg.num_nodes
+    dist[source] = 0.0
+    heap = [(0.0, source)]
+    settled = 0
+
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue  # 이미 더 짧은 거리로 확정된 노드
+        settled += 1
+        if u == target:
+            break
+
+        for pos in range(offsets[u], offsets[u + 1]):
+            v = targets[pos]
+            nd = d + weights[pos]
+            if nd < dist[v]:
+                dist[v] = nd
+                prev[v] = u
+                heapq.heappush(heap, (nd, v))
+
+    return dist, prev, settled
+
+
+def build_path(prev, source, target):
+    """prev 배열을 도착점에서 출발점까지 거슬러 올라가 id 경로를 만듭니다."""
+    path = []
+    node = target
+    while node != -1:
+        path.append(node)
+        if node == source:
+            break
+        node = prev[node]
+    path.reverse()
+    return path
+
+
+def shortest_path(rg, start, end):
+    """find_shortest_path 와 같은 (경로, 총 거리) 를 돌려줍니다.
+
+    경로는 도시 이름 리스트이며, 길이 없으면 (None, None) 입니다.
+    """
+    source = rg.node_id(start)
+    target = rg.node_id(end)
+
+    dist, prev, _ = dijkstra(rg, source, target)
+    if dist[target] == INF:
+        return None, None
+
+    path = build_path(prev, source, target)
+    return [rg.names[node] for node in path], dist[target]
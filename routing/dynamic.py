@@ -0,0 +1,250 @@
+import heapq
+import time
+from array import array
+from collections import OrderedDict
+
+from .dijkstra import INF, build_path
+from .graph import RoutingGraph
+
+# ==========================================
+# 실시간 도로 상황 반영 (간선 가중치 변경 + 증분 재계산)
+# ==========================================
+# 출발지마다 최단 경로 트리(dist, prev)를 캐시해 두고, 간선이 바뀌면 전체를 다시 계산하는 대신
+#   - 거리가 줄어든 간선 u -> v : dist[u] + w 가 dist[v] 보다 작을 때만 v 부터 개선을 전파
+#   - 거리가 늘거나 끊긴 간선  : 그 간선을 실제로 쓰던 트리(prev[v] == u)에서
+#                                v 아래 서브트리만 초기화한 뒤 다시 계산
+# 그 외의 트리와 경로는 손대지 않습니다.
+
+
+class _Tree:
+    """한 출발지의 최단 경로 트리와, 그 트리로 만든 경로 캐시"""
+
+    def __init__(self, dist, prev):
+        self.dist = dist
+        self.prev = prev
+        self.routes = {}  # 도착 id -> 도시 이름 경로
+
+
+class DynamicRouter:
+    """간선을 추가/수정/삭제할 수 있는 경로 탐색기
+
+    route() 결과는 출발지별 최단 경로 트리에 캐시되고(최대 max_trees 개, LRU),
+    간선이 바뀌면 영향을 받는 트리만 증분으로 고칩니다.
+    """
+
+    def __init__(self, rg, max_trees=256):
+        self.names = list(rg.names)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.out_edges = [{} for _ in self.names]
+        self.in_edges = [{} for _ in self.names]
+        for u in range(rg.num_nodes):
+            for v, w in rg.neighbors(u):
+                if w < self.out_edges[u].get(v, INF):
+                    self.out_edges[u][v] = w
+                    self.in_edges[v][u] = w
+
+        self.max_trees = max_trees
+        self._trees = OrderedDict()
+        self._metrics = {
+            "queries": 0,
+            "cache_hits": 0,
+            "query_seconds": 0.0,
+            "last_query_seconds": 0.0,
+            "updates": 0,
+            "update_seconds": 0.0,
+            "last_update_seconds": 0.0,
+            "trees_repaired": 0,
+            "trees_skipped": 0,
+            "nodes_touched": 0,
+        }
+
+    # ------------------------------------------
+    # 질의
+    # ------------------------------------------
+    def route(self, start, end):
+        """find_shortest_path 와 같은 (경로, 총 거리). 길이 없으면 (None, None)"""
+        started = time.perf_counter()
+        source = self.index[start]
+        target = self.index[end]
+
+        tree = self._trees.get(source)
+        if tree is None:
+            tree = self._build_tree(source)
+        else:
+            self._trees.move_to_end(source)
+
+        path = tree.routes.get(target)
+        if path is not None:
+            self._metrics["cache_hits"] += 1
+        elif tree.dist[target] != INF:
+            path = tree.routes[target] = [self.names[n] for n in build_path(tree.prev, source, target)]
+
+        elapsed = time.perf_counter() - started
+        self._metrics["queries"] += 1
+        self._metrics["query_seconds"] += elapsed
+        self._metrics["last_query_seconds"] = elapsed
+
+        if path is None:
+            return None, None
+        return path, tree.dist[target]
+
+    def _build_tree(self, source):
+        n = len(self.names)
+        dist = array('d', [INF]) * n
+        prev = array('q', [-1]) * n
+        dist[source] = 0.0
+        self._relax_from(dist, prev, [(0.0, source)])
+
+        tree = self._trees[source] = _Tree(dist, prev)
+        while len(self._trees) > self.max_trees:
+            self._trees.popitem(last=False)
+        return tree
+
+    def _relax_from(self, dist, prev, heap):
+        """heap 에 든 노드들부터 Dijkstra 를 이어서 진행합니다. 갱신된 노드 집합을 돌려줍니다."""
+        out_edges = self.out_edges
+        touched = set()
+        heapq.heapify(heap)
+        while heap:
+            d, u = heapq.heappop(heap)
+            if d > dist[u]:
+                continue
+            touched.add(u)
+            for v, w in out_edges[u].items():
+                nd = d + w
+                if nd < dist[v]:
+                    dist[v] = nd
+                    prev[v] = u
+                    heapq.heappush(heap, (nd, v))
+        return touched
+
+    # ------------------------------------------
+    # 간선 변경
+    # ------------------------------------------
+    def update_edge(self, start, end, weight):
+        """기존 간선 start -> end 의 거리를 바꿉니다. (정체·해소)"""
+        u, v = self.index[start], self.index[end]
+        if v not in self.out_edges[u]:
+            raise KeyError(f"없는 간선입니다: {start} -> {end}")
+        self._apply(u, v, weight)
+
+    def add_edge(self, start, end, weight):
+        """간선을 추가합니다. 처음 보는 도시는 새 노드로 등록하며, 이미 있으면 거리만 바꿉니다."""
+        u, v = self._intern(start), self._intern(end)
+        self._apply(u, v, weight)
+
+    def remove_edge(self, start, end):
+        """간선을 지웁니다. (도로 통제)"""
+        u, v = self.index[start], self.index[end]
+        if v not in self.out_edges[u]:
+            raise KeyError(f"없는 간선입니다: {start} -> {end}")
+        self._apply(u, v, None)
+
+    def _intern(self, name):
+        node = self.index.get(name)
+        if node is None:
+            node = self.index[name] = len(self.names)
+            self.names.append(name)
+            self.out_edges.append({})
+            self.in_edges.append({})
+            for tree in self._trees.values():
+                tree.dist.append(INF)
+                tree.prev.append(-1)
+        return node
+
+    def _apply(self, u, v, weight):
+        started = time.perf_counter()
+        old = self.out_edges[u].get(v, INF)
+        if weight is None:
+            self.out_edges[u].pop(v, None)
+            self.in_edges[v].pop(u, None)
+            new = INF
+        else:
+            self.out_edges[u][v] = self.in_edges[v][u] = weight
+            new = weight
+
+        for tree in self._trees.values():
+            if new < old:
+                touched = self._repair_decrease(tree, u, v, new)
+            elif new > old and tree.prev[v] == u:
+                touched = self._repair_increase(tree, v)
+            else:
+                touched = None
+
+            if not touched:
+                self._metrics["trees_skipped"] += 1
+                continue
+            self._metrics["trees_repaired"] += 1
+            self._metrics["nodes_touched"] += len(touched)
+            # 거리나 경로가 바뀐 도착지의 캐시 경로만 버립니다.
+            for node in touched:
+                tree.routes.pop(node, None)
+
+        elapsed = time.perf_counter() - started
+        self._metrics["updates"] += 1
+        self._metrics["update_seconds"] += elapsed
+        self._metrics["last_update_seconds"] = elapsed
+
+    def _repair_decrease(self, tree, u, v, weight):
+        """u -> v 가 짧아졌을 때: v 가 실제로 더 가까워지는 경우에만 개선을 전파"""
+        nd = tree.dist[u] + weight
+        if nd >= tree.dist[v]:
+            return None
+        tree.dist[v] = nd
+        tree.prev[v] = u
+        # v 를 거쳐 가던 도착지는 모두 거리가 줄어들므로 touched 에 함께 들어갑니다.
+        return self._relax_from(tree.dist, tree.prev, [(nd, v)])
+
+    def _repair_increase(self, tree, v):
+        """트리 간선이 길어지거나 끊겼을 때: v 아래 서브트리만 다시 계산"""
+        affected = self._subtree(tree, [v])
+        dist, prev = tree.dist, tree.prev
+        for node in affected:
+            dist[node] = INF
+            prev[node] = -1
+
+        # 영향받지 않은 노드에서 들어오는 간선 중 가장 짧은 것으로 다시 시작
+        heap = []
+        for node in affected:
+            for p, w in self.in_edges[node].items():
+                if p not in affected and dist[p] + w < dist[node]:
+                    dist[node] = dist[p] + w
+                    prev[node] = p
+            if dist[node] != INF:
+                heap.append((dist[node], node))
+        self._relax_from(dist, prev, heap)
+        return affected
+
+    def _subtree(self, tree, roots):
+        """roots 와, 트리에서 그 아래에 달린 모든 노드"""
+        prev = tree.prev
+        found = set(roots)
+        stack = list(roots)
+        while stack:
+            node = stack.pop()
+            for child in self.out_edges[node]:
+                if prev[child] == node and child not in found:
+                    found.add(child)
+                    stack.append(child)
+        return found
+
+    # ------------------------------------------
+    # 조회
+    # ------------------------------------------
+    def metrics(self):
+        """질의·갱신 지연시간과 증분 재계산 통계"""
+        result = dict(self._metrics)
+        result["cached_trees"] = len(self._trees)
+        result["avg_query_seconds"] = result["query_seconds"] / result["queries"] if result["queries"] else 0.0
+        result["avg_update_seconds"] = result["update_seconds"] / result["updates"] if result["updates"] else 0.0
+        return result
+
+    def snapshot(self):
+        """현재 도로 상태를 새 RoutingGraph 로 만듭니다. (다른 탐색 방식의 전처리용)"""
+        sources, targets, weights = array('q'), array('q'), array('d')
+        for u, edges in enumerate(self.out_edges):
+            for v, w in edges.items():
+                sources.append(u)
+                targets.append(v)
+                weights.append(w)
+        return RoutingGraph.from_edges(self.names, sources, targets, weights)
@@ -0,0 +1,106 @@
+import math
+import random
+
+import numpy as np
+
+from .graph import RoutingGraph
+
+# ==========================================
+# 벤치마크용 합성 도로망 생성기
+# ==========================================
+# 같은 seed 를 주면 항상 같은 그래프가 만들어집니다. 모든 도로는 양방향입니다.
+#   - grid              : 격자형 도시 도로 (가중치 1~20 무작위)
+#   - random_geometric  : 평면에 흩뿌린 점을 가까운 것끼리 연결 (가중치 = 거리)
+#   - scale_free        : 허브 도시에 도로가 몰리는 Barabási–Albert 그래프
+
+
+def _bidirectional(n, sources, targets, weights):
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    weights = np.asarray(weights, dtype=np.float64)
+    return RoutingGraph.from_edges(
+        [str(i) for i in range(n)],
+        np.concatenate([sources, targets]).tolist(),
+        np.concatenate([targets, sources]).tolist(),
+        np.concatenate([weights, weights]).tolist(),
+    )
+
+
+def grid_graph(n, seed=0):
+    """약 n 개 노드의 정사각 격자 (한 변 = ceil(sqrt(n)), 마지막 줄은 일부만 채움)"""
+    rng = np.random.default_rng(seed)
+    side = max(1, math.ceil(math.sqrt(n)))
+    ids = np.arange(n)
+    right = ids[(ids % side < side - 1) & (ids + 1 < n)]
+    down = ids[ids + side < n]
+    sources = np.concatenate([right, down])
+    targets = np.concatenate([right + 1, down + side])
+    weights = rng.integers(1, 21, size=len(sources))
+    return _bidirectional(n, sources, targets, weights)
+
+
+def random_geometric_graph(n, seed=0, degree=6.0):
+    """단위 정사각형 위 n 개 점을 반경 r 안의 점끼리 연결합니다 (평균 차수 ≈ degree).
+
+    점들을 r 크기 칸(cell)으로 나눠 이웃 칸끼리만 비교하므로 O(n) 에 가깝게 동작합니다.
+    """
+    rng = np.random.default_rng(seed)
+    points = rng.random((n, 2))
+    radius = math.sqrt(degree / (math.pi * max(n, 1)))
+    cells_per_side = max(1, int(1.0 / radius))
+
+    cell_xy = np.minimum((points * cells_per_side).astype(np.int64), cells_per_side - 1)
+    cell = cell_xy[:, 0] * cells_per_side + cell_xy[:, 1]
+    order = np.argsort(cell, kind='stable')
+    counts = np.bincount(cell, minlength=cells_per_side * cells_per_side)
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    max_count = int(counts.max()) if n else 0
+
+    sources, targets = [], []
+    # 자기 칸 + 오른쪽/위쪽 방향 이웃 칸만 보면 모든 쌍을 한 번씩 비교합니다.
+    for dx, dy in ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1)):
+        nx = cell_xy[:, 0] + dx
+        ny = cell_xy[:, 1] + dy
+        valid = (nx >= 0) & (nx < cells_per_side) & (ny >= 0) & (ny < cells_per_side)
+        points_idx = np.nonzero(valid)[0]
+        other_cell = nx[valid] * cells_per_side + ny[valid]
+        for j in range(max_count):
+            has = counts[other_cell] > j
+            a = points_idx[has]
+            b = order[starts[other_cell[has]] + j]
+            keep = a < b if (dx, dy) == (0, 0) else np.ones(len(a), dtype=bool)
+            sources.append(a[keep])
+            targets.append(b[keep])
+
+    sources = np.concatenate(sources) if sources else np.empty(0, dtype=np.int64)
+    targets = np.concatenate(targets) if targets else np.empty(0, dtype=np.int64)
+    lengths = np.hypot(*(points[sources] - points[targets]).T)
+    close = lengths <= radius
+    # 거리 단위를 km 처럼 보이도록 1000 배
+    return _bidirectional(n, sources[close], targets[close], np.round(lengths[close] * 1000, 3))
+
+
+def scale_free_graph(n, seed=0, edges_per_node=2):
+    """Barabási–Albert 선호 연결: 새 노드는 차수가 큰 노드에 붙을 확률이 높습니다."""
+    rng = random.Random(seed)
+    m = edges_per_node
+    sources, targets = [], []
+    repeated = list(range(min(m, n)))  # 차수만큼 반복해서 들어 있는 노드 목록
+    for new in range(m, n):
+        chosen = set()
+        while len(chosen) < m:
+            chosen.add(rng.choice(repeated))
+        for old in chosen:
+            sources.append(new)
+            targets.append(old)
+        repeated.extend(chosen)
+        repeated.extend([new] * m)
+    weights = [rng.randint(1, 50) for _ in sources]
+    return _bidirectional(n, sources, targets, weights)
+
+
+GENERATORS = {
+    "grid": grid_graph,
+    "geometric": random_geometric_graph,
+    "scale_free": scale_free_graph,
+}
@@ -0,0 +1,143 @@
+from array import array
+
+import numpy as np
+
+# ==========================================
+# 정수 인덱스 기반 CSR 그래프
+# ==========================================
+# 도시 이름(문자열) 대신 0..N-1 정수 id를 사용하고,
+# 간선은 offsets / targets / weights 세 개의 평평한 배열에 저장합니다.
+#   - u 번 노드의 이웃: targets[offsets[u]:offsets[u + 1]]
+#   - 같은 구간의 weights 가 각 간선의 거리
+# dict-of-dict 보다 메모리가 훨씬 작고, 배열 인덱싱만으로 이웃을 순회할 수 있습니다.
+
+
+class RoutingGraph:
+    """CSR(Compressed Sparse Row) 형태의 방향 그래프와 이름<->id 변환 테이블"""
+
+    def __init__(self, names, offsets, targets, weights):
+        self.names = list(names)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self._reverse = None
+
+        if len(self.offsets) != len(self.names) + 1:
+            raise ValueError("offsets 길이는 노드 수 + 1 이어야 합니다.")
+        if len(self.targets) != len(self.weights):
+            raise ValueError("targets 와 weights 의 길이가 다릅니다.")
+
+    @classmethod
+    def from_edges(cls, names, sources, targets, weights):
+        """(출발 id, 도착 id, 거리) 간선 목록을 출발 id 기준으로 정렬해 CSR 로 만듭니다."""
+        num_nodes = len(names)
+        num_edges = len(sources)
+
+        # 1. 노드별 진출 간선 수 세기 -> 누적합으로 offsets 생성 (counting sort)
+        offsets = array('q', [0]) * (num_nodes + 1)
+        for u in sources:
+            offsets[u + 1] += 1
+        for i in range(num_nodes):
+            offsets[i + 1] += offsets[i]
+
+        # 2. 각 간선을 자기 구간의 다음 빈 칸에 배치
+        cursor = array('q', offsets[:num_nodes])
+        csr_targets = array('q', [0]) * num_edges
+        csr_weights = array('d', [0.0]) * num_edges
+        for u, v, w in zip(sources, targets, weights):
+            pos = cursor[u]
+            csr_targets[pos] = v
+            csr_weights[pos] = w
+            cursor[u] = pos + 1
+
+        return cls(names, offsets, csr_targets, csr_weights)
+
+    @property
+    def num_nodes(self):
+        return len(self.names)
+
+    @property
+    def num_edges(self):
+        return len(self.targets)
+
+    def node_id(self, name):
+        """도시 이름을 정수 id 로 변환합니다. 없는 도시면 KeyError."""
+        return self.index[name]
+
+    def neighbors(self, u):
+        """u 에서 나가는 (이웃 id, 거리) 쌍을 순서대로 돌려줍니다."""
+        targets = self.targets
+        weights = self.weights
+        for pos in range(self.offsets[u], self.offsets[u + 1]):
+            yield targets[pos], weights[pos]
+
+    def edge_arrays(self):
+        """(출발 id, 도착 id, 거리) 를 복사 없이 NumPy 배열로 돌려줍니다."""
+        offsets = np.frombuffer(self.offsets, dtype=np.int64)
+        sources = np.repeat(np.arange(self.num_nodes, dtype=np.int64), np.diff(offsets))
+        targets = np.frombuffer(self.targets, dtype=np.int64)
+        weights = np.frombuffer(self.weights, dtype=np.float64)
+        return sources, targets, weights
+
+    def reverse(self):
+        """모든 간선 방향을 뒤집은 그래프 (한 번 만든 뒤 재사용)"""
+        if self._reverse is None:
+            sources = array('q')
+            offsets = self.offsets
+            for u in range(self.num_nodes):
+                sources.extend([u] * (offsets[u + 1] - offsets[u]))
+            self._reverse = RoutingGraph.from_edges(self.names, self.targets, sources, self.weights)
+            self._reverse._reverse = self
+        return self._reverse
+
+    def to_dict(self):
+        """기존 map.py 와 같은 {도시: {이웃: 거리}} 형태로 되돌립니다."""
+        graph = {}
+        for u, name in enumerate(self.names):
+            graph[name] = {self.names[v]: w for v, w in self.neighbors(u)}
+        return graph
+
+    def __getstate__(self):
+        # mmap 위의 memoryview 는 pickle 할 수 없으므로 (프로세스 풀 전달 시) array 로 복사합니다.
+        state = self.__dict__.copy()
+        for key, typecode in (("offsets", 'q'), ("targets", 'q'), ("weights", 'd')):
+            if not isinstance(state[key], array):
+                values = array(typecode)
+                # 형식이 'q'/'d' 로 지정된 memoryview 는 frombytes 가 받지 않으므로 바이트 단위로 바꿔 넘깁니다.
+                values.frombytes(memoryview(state[key]).cast('B'))
+                state[key] = values
+        state.pop("_mmap", None)
+        state["_reverse"] = None
+        return state
+
+    def __repr__(self):
+        return f"RoutingGraph(nodes={self.num_nodes}, edges={self.num_edges})"
+
+
+def from_dict_graph(graph):
+    """map.py 의 {도시: {이웃: 거리}} 딕셔너리를 RoutingGraph 로 변환합니다.
+
+    이웃으로만 등장하고 key 로는 없는 도시도 노드로 등록합니다.
+    """
+    names = []
+    index = {}
+
+    def intern(name):
+        node = index.get(name)
+        if node is None:
+            node = index[name] = len(names)
+            names.append(name)
+        return node
+
+    sources = array('q')
+    targets = array('q')
+    weights = array('d')
+    for city, neighbors in graph.items():
+        u = intern(city)
+        for neighbor, weight in neighbors.items():
+            sources.append(u)
+            targets.append(intern(neighbor))
+            weights.append(weight)
+
+    return RoutingGraph.from_edges(names, sources, targets, weights)
@@ -0,0 +1,204 @@
+import csv
+import mmap
+import os
+import struct
+from array import array
+
+from cache_utils import file_sha256
+
+from .graph import RoutingGraph
+
+# ==========================================
+# 간선 목록 파일(CSV/TSV) 로더 + mmap 바이너리 캐시
+# ==========================================
+# 입력 파일 형식 (헤더는 있어도 되고 없어도 됨, '#' 으로 시작하는 줄은 주석):
+#     from,to,weight[,oneway]
+#     서울,천안,85
+#     천안,서울,85,1
+# oneway 가 비어 있거나 0/false 이면 양방향 도로로 보고 역방향 간선도 추가합니다.
+#
+# 한 번 읽은 그래프는 바이너리 캐시(.rgraph)로 저장해 두고, 다음 프로세스부터는
+# mmap 으로 열어 offsets / targets / weights 배열을 복사 없이 그대로 사용합니다.
+# 원본 파일의 수정 시각(mtime)·크기가 바뀌면 해시를 다시 계산해, 내용이 실제로 달라졌을 때만 재생성합니다.
+
+CACHE_SUFFIX = ".rgraph"
+MAGIC = b"RGRAPH01"
+# magic, 노드 수, 간선 수, 이름 바이트 수, 원본 mtime_ns, 원본 크기, 원본 sha256
+HEADER = struct.Struct("<8sqqqqq32s")
+ALIGN = 8
+
+TRUE_VALUES = {"1", "true", "t", "yes", "y", "oneway"}
+
+
+def read_edge_list(path, delimiter=None):
+    """간선 목록 파일을 한 줄씩 읽어(스트리밍) RoutingGraph 로 만듭니다."""
+    if delimiter is None:
+        delimiter = '\t' if os.path.splitext(path)[1].lower() in ('.tsv', '.tab') else ','
+
+    names = []
+    index = {}
+    sources = array('q')
+    targets = array('q')
+    weights = array('d')
+
+    def intern(name):
+        node = index.get(name)
+        if node is None:
+            node = index[name] = len(names)
+            names.append(name)
+        return node
+
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        columns = (0, 1, 2, 3)
+        first_row = True
+        for line_no, row in enumerate(reader, start=1):
+            if not row or row[0].startswith('#'):
+                continue
+            is_header = first_row and not _is_number(row[2] if len(row) > 2 else '')
+            first_row = False
+            if is_header:
+                # 헤더 줄: 열 이름으로 위치를 찾고, 없는 열은 기본 순서를 사용
+                header = [c.strip().lower() for c in row]
+                columns = tuple(
+                    header.index(key) if key in header else default
+                    for key, default in (("from", 0), ("to", 1), ("weight", 2), ("oneway", 3))
+                )
+                continue
+
+            try:
+                u = intern(row[columns[0]].strip())
+                v = intern(row[columns[1]].strip())
+                w = float(row[columns[2]])
+            except (IndexError, ValueError) as e:
+                raise ValueError(f"{path}:{line_no} 줄을 해석할 수 없습니다: {row}") from e
+
+            oneway = len(row) > columns[3] and row[columns[3]].strip().lower() in TRUE_VALUES
+            sources.append(u)
+            targets.append(v)
+            weights.append(w)
+            if not oneway:
+                sources.append(v)
+                targets.append(u)
+                weights.append(w)
+
+    return RoutingGraph.from_edges(names, sources, targets, weights)
+
+
+def _is_number(text):
+    try:
+        float(text)
+    except ValueError:
+        return False
+    return True
+
+
+def _padding(size):
+    return b'\0' * (-size % ALIGN)
+
+
+def write_graph_cache(rg, cache_path, source_mtime_ns=0, source_size=0, source_hash=b''):
+    """RoutingGraph 를 mmap 으로 열 수 있는 바이너리 파일로 저장합니다.
+
+    레이아웃: 헤더 | offsets(int64) | targets(int64) | weights(float64) | 이름('\\0' 구분 UTF-8)
+    임시 파일에 쓴 뒤 교체하므로, 다른 프로세스가 읽는 도중에도 안전합니다.
+    """
+    names_blob = '\0'.join(rg.names).encode('utf-8')
+    header = HEADER.pack(
+        MAGIC, rg.num_nodes, rg.num_edges, len(names_blob),
+        source_mtime_ns, source_size, source_hash.ljust(32, b'\0'),
+    )
+
+    tmp_path = f"{cache_path}.tmp{os.getpid()}"
+    with open(tmp_path, 'wb') as f:
+        f.write(header + _padding(len(header)))
+        for values in (rg.offsets, rg.targets, rg.weights):
+            f.write(values)
+        f.write(names_blob)
+    os.replace(tmp_path, cache_path)
+
+
+def read_cache_header(cache_path):
+    """캐시 헤더만 읽어 dict 로 돌려줍니다. 형식이 다르면 None."""
+    try:
+        with open(cache_path, 'rb') as f:
+            raw = f.read(HEADER.size)
+    except OSError:
+        return None
+    if len(raw) < HEADER.size:
+        return None
+    magic, num_nodes, num_edges, names_bytes, mtime_ns, size, digest = HEADER.unpack(raw)
+    if magic != MAGIC:
+        return None
+    return {
+        "num_nodes": num_nodes,
+        "num_edges": num_edges,
+        "names_bytes": names_bytes,
+        "source_mtime_ns": mtime_ns,
+        "source_size": size,
+        "source_hash": digest,
+    }
+
+
+def open_graph_cache(cache_path):
+    """바이너리 캐시를 mmap 으로 열어 복사 없이 RoutingGraph 를 만듭니다."""
+    header = read_cache_header(cache_path)
+    if header is None:
+        raise ValueError(f"그래프 캐시 파일 형식이 아닙니다: {cache_path}")
+
+    with open(cache_path, 'rb') as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    buffer = memoryview(mm)
+
+    n = header["num_nodes"]
+    m = header["num_edges"]
+    pos = HEADER.size + len(_padding(HEADER.size))
+    offsets = buffer[pos:pos + (n + 1) * 8].cast('q')
+    pos += (n + 1) * 8
+    targets = buffer[pos:pos + m * 8].cast('q')
+    pos += m * 8
+    weights = buffer[pos:pos + m * 8].cast('d')
+    pos += m * 8
+    names_blob = bytes(buffer[pos:pos + header["names_bytes"]])
+    names = names_blob.decode('utf-8').split('\0') if n else []
+
+    rg = RoutingGraph(names, offsets, targets, weights)
+    rg._mmap = mm  # 배열들이 mmap 을 참조하므로 그래프와 수명을 같이 합니다.
+    return rg
+
+
+def _touch_cache_header(cache_path, header, mtime_ns, size):
+    """내용은 같고 mtime 만 바뀐 경우: 배열은 그대로 두고 헤더의 mtime/크기만 고칩니다."""
+    packed = HEADER.pack(
+        MAGIC, header["num_nodes"], header["num_edges"], header["names_bytes"],
+        mtime_ns, size, header["source_hash"],
+    )
+    with open(cache_path, 'r+b') as f:
+        f.write(packed)
+
+
+def load_graph(path, cache_path=None, delimiter=None):
+    """간선 목록 파일을 읽되, 유효한 바이너리 캐시가 있으면 그것을 mmap 으로 엽니다.
+
+    - mtime 과 크기가 캐시 헤더와 같으면: 바로 캐시 사용
+    - 다르면 sha256 비교: 내용이 같으면 헤더만 갱신, 다르면 파일을 다시 읽어 캐시 재생성
+    """
+    if cache_path is None:
+        cache_path = path + CACHE_SUFFIX
+
+    stat = os.stat(path)
+    header = read_cache_header(cache_path)
+    if header is not None:
+        if header["source_mtime_ns"] == stat.st_mtime_ns and header["source_size"] == stat.st_size:
+            return open_graph_cache(cache_path)
+
+        digest = file_sha256(path)
+        if header["source_hash"] == digest:
+            _touch_cache_header(cache_path, header, stat.st_mtime_ns, stat.st_size)
+            return open_graph_cache(cache_path)
+    else:
+        digest = file_sha256(path)
+
+    rg = read_edge_list(path, delimiter)
+    write_graph_cache(rg, cache_path, stat.st_mtime_ns, stat.st_size, digest)
+    return open_graph_cache(cache_path)
@@ -0,0 +1,68 @@
+from collections import namedtuple
+
+from .ch import build_contraction_hierarchy
+from .dijkstra import INF, build_path, dijkstra
+from .search import Landmarks, alt_search, bidirectional_dijkstra
+
+# 경로 탐색 결과: (도시 이름 경로, 총 거리, 확정한 노드 수)
+# 길이 없으면 path 와 distance 가 None 입니다.
+RouteResult = namedtuple("RouteResult", ["path", "distance", "settled"])
+
+
+class Router:
+    """탐색 방식(mode)을 골라 쓸 수 있는 경로 탐색기
+
+    - "dijkstra"      : 기준이 되는 단방향 Dijkstra
+    - "bidirectional" : 양방향 Dijkstra
+    - "alt"           : 랜드마크 기반 A* (첫 질의 때 랜드마크를 한 번 계산)
+    - "ch"            : Contraction Hierarchies (첫 질의 때 전처리를 한 번 수행)
+    """
+
+    MODES = ("dijkstra", "bidirectional", "alt", "ch")
+
+    def __init__(self, rg, num_landmarks=8, hierarchy=None):
+        self.rg = rg
+        self.num_landmarks = num_landmarks
+        self._landmarks = None
+        self._hierarchy = hierarchy
+
+    @property
+    def landmarks(self):
+        if self._landmarks is None:
+            self._landmarks = Landmarks.build(self.rg, self.num_landmarks)
+        return self._landmarks
+
+    @property
+    def hierarchy(self):
+        if self._hierarchy is None:
+            # 메모리 측정(tracemalloc)은 벤치마크에서만 켭니다.
+            self._hierarchy = build_contraction_hierarchy(self.rg, measure_memory=False)
+        return self._hierarchy
+
+    def route(self, start, end, mode="dijkstra"):
+        """start -> end 최단 경로를 mode 방식으로 찾아 RouteResult 로 돌려줍니다."""
+        rg = self.rg
+        source = rg.node_id(start)
+        target = rg.node_id(end)
+
+        if mode == "dijkstra":
+            dist, prev, settled = dijkstra(rg, source, target)
+            distance = dist[target]
+            path = build_path(prev, source, target) if distance != INF else None
+        elif mode == "bidirectional":
+            distance, path, settled = bidirectional_dijkstra(rg, source, target)
+        elif mode == "alt":
+            distance, path, settled = alt_search(rg, self.landmarks, source, target)
+        elif mode == "ch":
+            distance, path, settled = self.hierarchy.query(source, target)
+        else:
+            raise ValueError(f"지원하지 않는 탐색 방식입니다: {mode} (가능: {', '.join(self.MODES)})")
+
+        if path is None:
+            return RouteResult(None, None, settled)
+        return RouteResult([rg.names[node] for node in path], distance, settled)
+
+    def shortest_path(self, start, end, mode="dijkstra"):
+        """find_shortest_path 와 같은 (경로, 총 거리) 형태"""
+        result = self.route(start, end, mode)
+        return result.path, result.distance
@@ -0,0 +1,176 @@
+import heapq
+from array import array
+
+from .dijkstra import INF, build_path, dijkstra
+
+# ==========================================
+# 장거리 질의용 탐색: 양방향 Dijkstra / ALT(A* + Landmark)
+# ==========================================
+# 서울 -> 부산 같은 장거리 질의에서 일반 Dijkstra 는 목적지에 닿기 전에
+# 거의 모든 노드를 확정(settle)합니다.
+#   - 양방향 Dijkstra : 출발지와 도착지에서 동시에 탐색해 중간에서 만납니다.
+#   - ALT            : 미리 계산한 랜드마크 거리로 "남은 거리의 하한"을 추정해
+#                      목적지 방향의 노드부터 꺼내는 A* 입니다.
+# 모든 함수는 (거리, id 경로, 확정 노드 수) 를 돌려주며 길이 없으면 (INF, None, 확정 수) 입니다.
+
+
+def bidirectional_dijkstra(rg, source, target):
+    """정방향(source 부터)과 역방향(target 부터) 탐색을 번갈아 진행합니다."""
+    if source == target:
+        return 0.0, [source], 1
+
+    graphs = (rg, rg.reverse())
+    dist = ({source: 0.0}, {target: 0.0})
+    prev = ({source: -1}, {target: -1})
+    done = (set(), set())
+    heaps = ([(0.0, source)], [(0.0, target)])
+    best = INF
+    meeting = -1
+    settled = 0
+
+    while heaps[0] and heaps[1]:
+        # 두 방향 최소 키의 합이 현재 최선 이상이면 더 짧은 경로는 없습니다.
+        if heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+
+        # 힙이 작은 쪽(덜 퍼진 쪽)을 한 단계 진행
+        side = 0 if len(heaps[0]) <= len(heaps[1]) else 1
+        d, u = heapq.heappop(heaps[side])
+        if u in done[side]:
+            continue
+        done[side].add(u)
+        settled += 1
+
+        g = graphs[side]
+        my_dist, my_prev = dist[side], prev[side]
+        other_dist = dist[1 - side]
+        for pos in range(g.offsets[u], g.offsets[u + 1]):
+            v = g.targets[pos]
+            nd = d + g.weights[pos]
+            if nd < my_dist.get(v, INF):
+                my_dist[v] = nd
+                my_prev[v] = u
+                heapq.heappush(heaps[side], (nd, v))
+            # 반대편 탐색이 이미 도달한 노드라면 두 탐색을 잇는 경로 후보
+            if v in other_dist and my_dist[v] + other_dist[v] < best:
+                best = my_dist[v] + other_dist[v]
+                meeting = v
+
+    if meeting == -1:
+        return INF, None, settled
+
+    # source -> meeting (정방향 prev) + meeting -> target (역방향 prev)
+    path = []
+    node = meeting
+    while node != -1:
+        path.append(node)
+        node = prev[0][node]
+    path.reverse()
+    node = prev[1][meeting]
+    while node != -1:
+        path.append(node)
+        node = prev[1][node]
+    # best 는 정방향 합 + 역방향 합이라 덧셈 순서가 Dijkstra 와 달라 마지막 자리가 다를 수 있으므로,
+    # 이어 붙인 경로의 간선 거리를 경로 순서대로 다시 더해 돌려줍니다.
+    return _path_length(rg, path), path, settled
+
+
+def _path_length(rg, path):
+    """id 경로의 간선 거리를 앞에서부터 더한 값 (같은 두 노드 사이 간선이 여럿이면 가장 짧은 것)"""
+    total = 0.0
+    for u, v in zip(path, path[1:]):
+        total += min(rg.weights[pos] for pos in range(rg.offsets[u], rg.offsets[u + 1]) if rg.targets[pos] == v)
+    return total
+
+
+class Landmarks:
+    """ALT 용 랜드마크와 각 랜드마크로부터/까지의 전체 거리 표"""
+
+    def __init__(self, nodes, dist_from, dist_to):
+        self.nodes = list(nodes)
+        self.dist_from = dist_from  # dist_from[i][v] = 랜드마크 i -> v
+        self.dist_to = dist_to  # dist_to[i][v]   = v -> 랜드마크 i
+
+    @classmethod
+    def build(cls, rg, count=4, seed_node=0):
+        """서로 최대한 멀리 떨어진 노드를 랜드마크로 고릅니다 (farthest selection)."""
+        if rg.num_nodes == 0:
+            return cls([], [], [])
+        reverse = rg.reverse()
+        count = min(count, rg.num_nodes)
+
+        # 임의의 노드에서 가장 먼 노드를 첫 랜드마크로 삼고,
+        # 이후에는 기존 랜드마크들과의 최소 거리가 가장 큰 노드를 추가합니다.
+        closest = _finite(dijkstra(rg, seed_node)[0])
+        nodes, dist_from, dist_to = [], [], []
+        for _ in range(count):
+            candidate = max(range(rg.num_nodes), key=lambda v: (v not in nodes, closest[v]))
+            nodes.append(candidate)
+            dist_from.append(array('d', dijkstra(rg, candidate)[0]))
+            dist_to.append(array('d', dijkstra(reverse, candidate)[0]))
+            reach = _finite([min(a, b) for a, b in zip(dist_from[-1], dist_to[-1])])
+            closest = [min(c, r) for c, r in zip(closest, reach)] if len(nodes) > 1 else reach
+
+        return cls(nodes, dist_from, dist_to)
+
+    def heuristic(self, target):
+        """target 까지 남은 거리의 하한 h(v) 를 계산하는 함수를 돌려줍니다.
+
+        삼각 부등식:  d(v, t) >= d(L, t) - d(L, v)  그리고  d(v, t) >= d(v, L) - d(t, L)
+        """
+        terms = [
+            (d_from, d_from[target], d_to, d_to[target])
+            for d_from, d_to in zip(self.dist_from, self.dist_to)
+        ]
+
+        def h(v):
+            best = 0.0
+            for d_from, from_t, d_to, to_t in terms:
+                from_v = d_from[v]
+                if from_t != INF and from_v != INF and from_t - from_v > best:
+                    best = from_t - from_v
+                to_v = d_to[v]
+                if to_v != INF and to_t != INF and to_v - to_t > best:
+                    best = to_v - to_t
+            return best
+
+        return h
+
+
+def _finite(values):
+    """도달 불가(INF)는 -1 로 바꿔 '가장 먼 노드' 후보에서 빠지게 합니다."""
+    return [v if v != INF else -1.0 for v in values]
+
+
+def alt_search(rg, landmarks, source, target):
+    """랜드마크 하한을 휴리스틱으로 쓰는 A* 탐색"""
+    h = landmarks.heuristic(target)
+    offsets = rg.offsets
+    targets = rg.targets
+    weights = rg.weights
+
+    dist = {source: 0.0}
+    prev = {source: -1}
+    estimate = {source: h(source)}
+    heap = [(estimate[source], 0.0, source)]
+    settled = 0
+
+    while heap:
+        _, d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue
+        settled += 1
+        if u == target:
+            return d, build_path(prev, source, target), settled
+
+        for pos in range(offsets[u], offsets[u + 1]):
+            v = targets[pos]
+            nd = d + weights[pos]
+            if nd < dist.get(v, INF):
+                dist[v] = nd
+                prev[v] = u
+                if v not in estimate:
+                    estimate[v] = h(v)
+                heapq.heappush(heap, (nd + estimate[v], nd, v))
+
+    return INF, None, settled
@@ -0,0 +1,78 @@
+import numpy as np
+
+# ==========================================
+# 전 구간(All-Pairs) 거리 / 다음 경유지 테이블
+# ==========================================
+# 고정된 도시망에 같은 질의가 반복된다면 매번 Dijkstra 를 돌릴 필요가 없습니다.
+# Floyd-Warshall 을 NumPy 브로드캐스팅으로 한 번만 계산해 두면
+#   - dist[i, j]     : i -> j 최단 거리
+#   - next_hop[i, j] : i 에서 j 로 갈 때 바로 다음에 들를 도시 id (-1 이면 길 없음)
+# 로 경로를 탐색 없이 O(경로 길이) 에 복원할 수 있습니다.
+# 메모리가 O(V^2) 이므로 수천 개 이하의 도시망에 알맞습니다.
+
+
+class DistanceTable:
+    """미리 계산한 전 구간 거리/다음 경유지 행렬"""
+
+    def __init__(self, names, dist, next_hop):
+        self.names = list(names)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.dist = dist
+        self.next_hop = next_hop
+
+    def distance(self, start, end):
+        return float(self.dist[self.index[start], self.index[end]])
+
+    def route(self, start, end):
+        """find_shortest_path 와 같은 (경로, 총 거리). 길이 없으면 (None, None)"""
+        i = self.index[start]
+        j = self.index[end]
+        if self.next_hop[i, j] < 0:
+            return None, None
+
+        next_hop = self.next_hop
+        path = [i]
+        while i != j:
+            i = int(next_hop[i, j])
+            path.append(i)
+        return [self.names[node] for node in path], float(self.dist[path[0], j])
+
+    def save(self, file_path):
+        """바이너리(.npz, 비압축) 파일로 저장합니다."""
+        with open(file_path, 'wb') as f:
+            np.savez(f, names=np.array(self.names), dist=self.dist, next_hop=self.next_hop)
+
+    @classmethod
+    def load(cls, file_path):
+        """save() 로 저장한 테이블을 다시 읽습니다. (재계산 없음)"""
+        with np.load(file_path, allow_pickle=False) as data:
+            return cls(data['names'].tolist(), data['dist'], data['next_hop'])
+
+    def __repr__(self):
+        return f"DistanceTable(nodes={len(self.names)})"
+
+
+def build_distance_table(rg):
+    """RoutingGraph 전체에 대해 거리/다음 경유지 행렬을 계산합니다."""
+    n = rg.num_nodes
+    sources, targets, weights = rg.edge_arrays()
+
+    # 1. 직접 연결된 간선으로 초기화 (중복 간선은 가장 짧은 것만)
+    dist = np.full((n, n), np.inf)
+    np.minimum.at(dist, (sources, targets), weights)
+    np.fill_diagonal(dist, 0.0)
+
+    next_hop = np.full((n, n), -1, dtype=np.int32)
+    reachable = np.isfinite(dist)
+    next_hop[reachable] = np.broadcast_to(np.arange(n, dtype=np.int32), (n, n))[reachable]
+
+    # 2. k 를 경유하는 편이 더 짧으면 갱신 (행렬 전체를 한 번에 비교)
+    for k in range(n):
+        via = dist[:, k, None] + dist[None, k, :]
+        better = via < dist
+        if not better.any():
+            continue
+        dist[better] = via[better]
+        next_hop[better] = np.broadcast_to(next_hop[:, k, None], (n, n))[better]
+
+    return DistanceTable(rg.names, dist, next_hop)
@@ -0,0 +1,16 @@
+"""pages/voyage.py 에서 쓰는 관광지 데이터 계층"""
+
+from .cube import TourismCube
+from .export import ExportCache, MIME_TYPES, available_formats, iter_csv_chunks
+from .search import PlaceIndex, choseong, normalize
+
+__all__ = [
+    "TourismCube",
+    "ExportCache",
+    "MIME_TYPES",
+    "available_formats",
+    "iter_csv_chunks",
+    "PlaceIndex",
+    "choseong",
+    "normalize",
+]
@@ -0,0 +1,185 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+# ==========================================
+# 지역 x 카테고리 x 관광지 x 월 집계 큐브
+# ==========================================
+# 원본이 일별 방문 기록 수백만 행이어도, 화면에 필요한 것은 합계·순위·세부 분류뿐입니다.
+# 데이터를 읽을 때 한 번만
+#   - 관광지(이름, 지역, 카테고리)를 정수 코드로 바꾸고 (사전 인코딩)
+#   - 관광지 x 기간(월) 방문객 합계 행렬 하나 (float64, 열 단위 배열)
+# 로 줄여 둡니다. 관광지마다 지역·카테고리가 하나씩이므로 지역·카테고리 집계는
+# 이 행렬의 행을 np.bincount 로 묶으면 되고, 원본 행은 다시 보지 않습니다.
+# 자주 쓰는 순위(TOP N)는 (지역, 카테고리, 기간) 조합별로 처음 한 번만 정렬해 보관합니다.
+
+NAME_COL = '관광지명'
+REGION_COL = '지역'
+CATEGORY_COL = '카테고리'
+VALUE_COL = '방문객수(만명)'
+DATE_COLS = ('날짜', '방문일', '기준년월')
+MONTH_COL = '월'
+ALL_PERIODS = '전체'
+# 날짜를 해석할 수 없는 행의 기간 이름 ('전체 기간' 선택과 헷갈리지 않도록 '전체' 와 따로 둡니다)
+UNKNOWN_PERIOD = '날짜 미상'
+
+DEFAULT_CHUNKSIZE = 500_000
+
+
+def _period_labels(df):
+    """행마다 기간(월) 이름. 날짜 열이 없으면 모두 '전체', 날짜를 해석할 수 없는 행은 '날짜 미상'"""
+    for col in DATE_COLS:
+        if col in df.columns:
+            # 날짜 종류는 행 수보다 훨씬 적으므로 서로 다른 값만 해석해 다시 펼칩니다.
+            codes, uniques = pd.factorize(df[col].astype(str).str.strip())
+            dates = pd.to_datetime(pd.Series(uniques), errors='coerce', format='mixed')
+            labels = dates.dt.strftime('%Y-%m').fillna(UNKNOWN_PERIOD).to_numpy(dtype=object)
+            return pd.Series(labels[codes], index=df.index)
+    if MONTH_COL in df.columns:
+        return df[MONTH_COL].astype(str).where(df[MONTH_COL].notna(), UNKNOWN_PERIOD)
+    return pd.Series(ALL_PERIODS, index=df.index)
+
+
+def _partial_sums(df, value_col):
+    """청크 하나를 (관광지, 지역, 카테고리, 기간) 별 (방문객 합계, 행 수)로 줄입니다."""
+    keys = pd.DataFrame({
+        NAME_COL: df[NAME_COL].astype(str),
+        REGION_COL: df[REGION_COL].astype(str),
+        CATEGORY_COL: df[CATEGORY_COL].astype(str),
+        'period': _period_labels(df),
+        'value': pd.to_numeric(df[value_col], errors='coerce').fillna(0.0),
+    })
+    return keys.groupby([NAME_COL, REGION_COL, CATEGORY_COL, 'period'], sort=False)['value'].agg(['sum', 'count'])
+
+
+class TourismCube:
+    """관광지 x 기간 방문객 행렬과 지역·카테고리 코드로 이루어진 집계 큐브"""
+
+    def __init__(self, names, regions, categories, attr_region, attr_category, periods, visits, records):
+        self.names = np.asarray(names, dtype=object)          # 관광지 이름 (관광지 코드 순)
+        self.regions = np.asarray(regions, dtype=object)      # 지역 이름 (지역 코드 순)
+        self.categories = np.asarray(categories, dtype=object)
+        self.attr_region = np.asarray(attr_region, dtype=np.int32)      # 관광지 -> 지역 코드
+        self.attr_category = np.asarray(attr_category, dtype=np.int32)  # 관광지 -> 카테고리 코드
+        self.periods = list(periods)
+        self.period_index = {p: j for j, p in enumerate(self.periods)}
+        self.region_index = {r: i for i, r in enumerate(self.regions)}
+        self.category_index = {c: i for i, c in enumerate(self.categories)}
+        self.visits = np.ascontiguousarray(visits, dtype=np.float64)    # 관광지 x 기간
+        self.records = int(records)                                     # 원본 행 수
+
+        # 기간 전체 합계와 전체 순위는 미리 계산
+        self.attr_total = self.visits.sum(axis=1)
+        self._top = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------
+    # 만들기
+    # ------------------------------------------
+    @classmethod
+    def from_partials(cls, partials):
+        """청크별 부분합을 합쳐 큐브를 만듭니다."""
+        if not partials:
+            return cls([], [], [], [], [], [ALL_PERIODS], np.zeros((0, 1)), 0)
+        totals = pd.concat(partials).groupby(level=[0, 1, 2, 3], sort=False).sum().reset_index()
+
+        attrs = totals[[NAME_COL, REGION_COL, CATEGORY_COL]].drop_duplicates().reset_index(drop=True)
+        attr_codes = pd.MultiIndex.from_frame(attrs).get_indexer(
+            pd.MultiIndex.from_frame(totals[[NAME_COL, REGION_COL, CATEGORY_COL]])
+        )
+        region_codes, regions = pd.factorize(attrs[REGION_COL], sort=True)
+        category_codes, categories = pd.factorize(attrs[CATEGORY_COL], sort=True)
+        period_codes, periods = pd.factorize(totals['period'], sort=True)
+
+        visits = np.zeros((len(attrs), len(periods)))
+        np.add.at(visits, (attr_codes, period_codes), totals['sum'].to_numpy(dtype=np.float64))
+        return cls(
+            attrs[NAME_COL].to_numpy(), regions, categories, region_codes, category_codes,
+            list(periods), visits, totals['count'].sum(),
+        )
+
+    @classmethod
+    def from_frame(cls, df, value_col=VALUE_COL):
+        return cls.from_partials([_partial_sums(df, value_col)])
+
+    @classmethod
+    def from_csv(cls, path, value_col=VALUE_COL, chunksize=DEFAULT_CHUNKSIZE, encoding='utf-8-sig'):
+        """큰 CSV 를 chunksize 행씩 읽어 부분합만 모읍니다 (메모리는 그룹 수에 비례)."""
+        partials = []
+        for chunk in pd.read_csv(path, chunksize=chunksize, encoding=encoding):
+            partials.append(_partial_sums(chunk, value_col))
+            if len(partials) >= 8:
+                partials = [pd.concat(partials).groupby(level=[0, 1, 2, 3], sort=False).sum()]
+        return cls.from_partials(partials)
+
+    # ------------------------------------------
+    # 조회 (모두 큐브 배열만 사용)
+    # ------------------------------------------
+    def _values(self, period=None):
+        """관광지별 방문객 수 (period=None 이면 전체 기간 합계)"""
+        if period is None:
+            return self.attr_total
+        return self.visits[:, self.period_index[period]]
+
+    def _mask(self, region=None, category=None):
+        mask = np.ones(len(self.names), dtype=bool)
+        if region is not None:
+            mask &= self.attr_region == self.region_index.get(region, -1)
+        if category is not None:
+            mask &= self.attr_category == self.category_index.get(category, -1)
+        return mask
+
+    def total(self, region=None, category=None, period=None):
+        """조건에 맞는 방문객 합계"""
+        return float(self._values(period)[self._mask(region, category)].sum())
+
+    def top_attractions(self, n=10, region=None, category=None, period=None):
+        """방문객이 많은 관광지 코드 n 개. (지역, 카테고리, 기간) 별 정렬 결과를 보관해 재사용합니다."""
+        key = (region, category, period)
+        with self._lock:
+            order = self._top.get(key)
+        if order is None:
+            values = self._values(period)
+            candidates = np.nonzero(self._mask(region, category))[0]
+            order = candidates[np.argsort(-values[candidates], kind='stable')]
+            with self._lock:
+                self._top[key] = order
+        return order[:n]
+
+    def by_region(self, category=None, period=None):
+        """지역별 방문객 합계 Series (큰 순서)"""
+        mask = self._mask(category=category)
+        sums = np.bincount(self.attr_region[mask], weights=self._values(period)[mask], minlength=len(self.regions))
+        return pd.Series(sums, index=self.regions, name=VALUE_COL).sort_values(ascending=False)
+
+    def by_category(self, region=None, period=None):
+        """카테고리별 방문객 합계 Series (큰 순서)"""
+        mask = self._mask(region=region)
+        sums = np.bincount(self.attr_category[mask], weights=self._values(period)[mask], minlength=len(self.categories))
+        return pd.Series(sums, index=self.categories, name=VALUE_COL).sort_values(ascending=False)
+
+    def category_counts(self, region=None):
+        """카테고리별 관광지 수 Series (많은 순서)"""
+        codes = self.attr_category[self._mask(region=region)]
+        counts = np.bincount(codes, minlength=len(self.categories))
+        return pd.Series(counts, index=self.categories, name='count').sort_values(ascending=False, kind='stable')
+
+    def by_period(self, region=None, category=None):
+        """기간별 방문객 합계 Series (기간 순서)"""
+        mask = self._mask(region, category)
+        return pd.Series(self.visits[mask].sum(axis=0), index=self.periods, name=VALUE_COL)
+
+    def frame(self, attrs, period=None):
+        """관광지 코드 배열 -> 화면 표시용 DataFrame"""
+        attrs = np.asarray(attrs, dtype=np.int64)
+        return pd.DataFrame({
+            NAME_COL: self.names[attrs],
+            REGION_COL: self.regions[self.attr_region[attrs]],
+            CATEGORY_COL: self.categories[self.attr_category[attrs]],
+            VALUE_COL: self._values(period)[attrs],
+        })
+
+    def __repr__(self):
+        return (f"TourismCube(attractions={len(self.names)}, regions={len(self.regions)}, "
+                f"categories={len(self.categories)}, periods={len(self.periods)}, records={self.records})")
@@ -0,0 +1,109 @@
+import codecs
+import hashlib
+import os
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet 내보내기는 pyarrow 가 있을 때만
+    pa = pq = None
+
+from cache_utils import DiskLRU
+
+# ==========================================
+# 다운로드용 CSV / Parquet 내보내기 (지연 생성 + 크기 제한 캐시)
+# ==========================================
+# 다운로드 버튼을 그릴 때마다 df.to_csv() 로 전체를 직렬화하지 않도록
+#   - 파일 내용은 실제로 버튼을 누를 때(callable 호출 시) 처음 만들고,
+#   - (데이터 판, 필터, 형식) 별로 .cache/tourism/exports/ 에 한 번만 저장해 재사용합니다.
+# 큰 표는 chunk_rows 행씩 잘라 파일에 이어 쓰므로, 전체 문자열과 그 인코딩 사본을
+# 동시에 메모리에 만들지 않습니다. 저장 파일의 총 크기가 max_bytes 를 넘으면 오래 쓰지 않은 것부터 지웁니다.
+# 파일 이름은 (데이터 판, 필터, 형식) 의 해시이므로, 시작할 때 폴더를 다시 훑어 이전 프로세스가 남긴 파일도
+# 크기 한도에 넣고 그대로 재사용합니다 (cache_utils.DiskLRU).
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EXPORT_DIR = os.path.join(PROJECT_ROOT, ".cache", "tourism", "exports")
+
+MIME_TYPES = {
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+}
+DEFAULT_CHUNK_ROWS = 50_000
+
+
+def available_formats():
+    return ["csv", "parquet"] if pq is not None else ["csv"]
+
+
+def iter_csv_chunks(df, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """UTF-8(BOM) CSV 를 chunk_rows 행씩 bytes 로 내보냅니다. 첫 조각에만 BOM 과 헤더가 붙습니다."""
+    yield codecs.BOM_UTF8
+    if len(df) == 0:
+        yield df.to_csv(index=False).encode('utf-8')
+        return
+    for start in range(0, len(df), chunk_rows):
+        part = df.iloc[start:start + chunk_rows]
+        yield part.to_csv(index=False, header=(start == 0)).encode('utf-8')
+
+
+def write_csv(df, f, chunk_rows=DEFAULT_CHUNK_ROWS):
+    for chunk in iter_csv_chunks(df, chunk_rows):
+        f.write(chunk)
+
+
+def write_parquet(df, f, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """chunk_rows 행씩 Parquet row group 으로 이어 씁니다."""
+    if pq is None:
+        raise ImportError("Parquet 내보내기에는 pyarrow 가 필요합니다.")
+    # 빈 표로 스키마를 만들면 object(문자열) 열의 형식을 알 수 없어 null 이 되므로, 첫 조각의 실제 값으로 정하고
+    # 나머지 조각은 그 스키마에 맞춰 변환합니다.
+    first = pa.Table.from_pandas(df.iloc[:chunk_rows], preserve_index=False)
+    schema = first.schema
+    with pq.ParquetWriter(f, schema) as writer:
+        writer.write_table(first)
+        for start in range(chunk_rows, len(df), chunk_rows):
+            part = df.iloc[start:start + chunk_rows]
+            writer.write_table(pa.Table.from_pandas(part, schema=schema, preserve_index=False))
+
+
+WRITERS = {"csv": write_csv, "parquet": write_parquet}
+
+
+class ExportCache:
+    """(데이터 판, 필터, 형식) -> 내보낸 파일. 총 크기가 제한된 LRU (세션 간 공유)"""
+
+    def __init__(self, directory=EXPORT_DIR, max_bytes=256 * 1024 * 1024, chunk_rows=DEFAULT_CHUNK_ROWS):
+        self.directory = directory
+        self.chunk_rows = chunk_rows
+        self._files = DiskLRU(directory, max_bytes, [f".{fmt}" for fmt in WRITERS])
+
+    @staticmethod
+    def _key(version, filter_key, fmt):
+        """파일 이름으로 쓰는 키 (이전 프로세스가 만든 같은 파일도 찾을 수 있도록 내용 대신 해시)"""
+        return hashlib.sha1(repr((version, filter_key, fmt)).encode('utf-8')).hexdigest()[:16]
+
+    def path(self, make_frame, version, filter_key=None, fmt="csv"):
+        """내보낸 파일 경로. 없으면 make_frame() 으로 표를 받아 조각 단위로 씁니다."""
+        if fmt not in WRITERS:
+            raise ValueError(f"지원하지 않는 내보내기 형식입니다: {fmt}")
+        key = self._key(version, filter_key, fmt)
+        path = self._files.get(key)
+        if path is not None:
+            return path
+        return self._files.write(key, f".{fmt}", lambda f: WRITERS[fmt](make_frame(), f, self.chunk_rows))
+
+    def data(self, make_frame, version, filter_key=None, fmt="csv"):
+        """st.download_button(data=...) 에 넘길 인자 없는 callable. 버튼을 누를 때만 파일을 만들고 읽습니다.
+
+        Streamlit 은 받은 데이터를 어차피 전부 읽어 보관하므로, 파일 핸들을 넘기지 않고 닫은 뒤 bytes 로 돌려줍니다.
+        """
+        def read():
+            with open(self.path(make_frame, version, filter_key, fmt), 'rb') as f:
+                return f.read()
+        return read
+
+    def stats(self):
+        return self._files.stats()
+
+    def __len__(self):
+        return len(self._files)
@@ -0,0 +1,166 @@
+import numpy as np
+
+# ==========================================
+# 관광지명 검색 인덱스 (n-gram 역색인 + 초성 + 접두어)
+# ==========================================
+# 검색어가 바뀔 때마다 전체 행에 str.contains 를 돌리지 않도록, 데이터를 읽을 때 한 번만
+#   - 관광지명·지역·카테고리의 글자 1-gram / 2-gram -> 행 번호 배열 (역색인)
+#   - 관광지명의 초성 문자열('에버랜드' -> 'ㅇㅂㄹㄷ')에 대한 같은 역색인
+# 을 만들어 둡니다.
+# 질의는 검색어 n-gram 들의 행 번호 배열을 교집합한 뒤(후보가 가장 적은 배열부터),
+# 남은 후보에서만 실제 포함 여부를 확인하고 점수(정확히 일치 > 접두어 > 포함, 관광지명 > 지역 > 카테고리)로 정렬합니다.
+# 확인·점수 계산은 후보 행 번호 배열에 대해 NumPy 로 한 번에 하며, 이를 위해 행별 글자 수와 첫 글자를 미리 저장해 둡니다.
+# limit 을 주면 argpartition 으로 상위 limit 개만 골라 정렬합니다.
+# 'ㄱㅂ' 처럼 초성이 섞인 검색어는 초성 색인에서 찾습니다.
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+CHOSEONG_SET = frozenset(CHOSEONG)
+
+# 검색할 열과 열별 가중치
+FIELDS = {"관광지명": 3.0, "지역": 2.0, "카테고리": 1.0}
+
+# 일치 방식별 점수 (가중치와 곱함)
+EXACT, PREFIX, CONTAINS = 100.0, 60.0, 40.0
+
+
+def normalize(text):
+    """대소문자·공백 차이를 없앤 비교용 문자열"""
+    return "".join(str(text).lower().split())
+
+
+def choseong(text):
+    """완성형 한글은 초성으로 바꾸고 나머지 글자는 그대로 둡니다. ('N서울타워' -> 'nㅅㅇㅌㅇ')"""
+    out = []
+    for ch in normalize(text):
+        code = ord(ch)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            out.append(CHOSEONG[(code - HANGUL_BASE) // 588])
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def ngrams(text):
+    """글자 1-gram 과 2-gram 집합"""
+    grams = set(text)
+    grams.update(text[i:i + 2] for i in range(len(text) - 1))
+    return grams
+
+
+def _query_grams(query):
+    """교집합에 쓸 검색어 n-gram (2글자 이상이면 2-gram, 1글자면 그 글자)"""
+    if len(query) == 1:
+        return [query]
+    return sorted({query[i:i + 2] for i in range(len(query) - 1)})
+
+
+class _GramIndex:
+    """문자열 목록에 대한 n-gram -> 행 번호(int32, 오름차순) 역색인 + 행별 글자 수·첫 글자"""
+
+    def __init__(self, texts):
+        self.texts = np.asarray(texts, dtype=str)
+        self.lengths = np.char.str_len(self.texts).astype(np.int32)
+        self.heads = np.asarray([ord(text[0]) if text else 0 for text in texts], dtype=np.int32)
+        postings = {}
+        for row, text in enumerate(texts):
+            for gram in ngrams(text):
+                postings.setdefault(gram, []).append(row)
+        self.postings = {gram: np.asarray(rows, dtype=np.int32) for gram, rows in postings.items()}
+
+    def candidates(self, query):
+        """검색어를 포함하는 행 번호 배열 (n-gram 교집합 후 실제 포함 여부 확인)"""
+        lists = []
+        for gram in _query_grams(query):
+            rows = self.postings.get(gram)
+            if rows is None:
+                return np.empty(0, dtype=np.int32)
+            lists.append(rows)
+        lists.sort(key=len)
+        rows = lists[0]
+        for other in lists[1:]:
+            rows = np.intersect1d(rows, other, assume_unique=True)
+            if len(rows) == 0:
+                return rows
+        if len(query) <= 2:
+            return rows
+        # 2-gram 이 모두 있어도 순서가 다를 수 있으므로 후보만 확인
+        return rows[np.char.find(self.texts[rows], query) >= 0]
+
+    def scores(self, rows, query, weight):
+        """query 를 포함하는 행들(rows)의 점수 배열"""
+        lengths = self.lengths[rows]
+        # 접두어 확인은 첫 글자가 같은 행에서만 합니다.
+        prefix = self.heads[rows] == ord(query[0])
+        if len(query) > 1 and prefix.any():
+            prefix[prefix] = np.char.startswith(self.texts[rows[prefix]], query)
+        base = np.where(prefix, PREFIX, CONTAINS)
+        # 검색어를 포함하면서 길이가 같으면 정확히 일치
+        base[lengths == len(query)] = EXACT
+        # 같은 방식이면 짧은 이름(검색어가 차지하는 비율이 큰 것)을 앞에
+        return weight * (base + 10.0 * len(query) / np.maximum(lengths, 1))
+
+
+class PlaceIndex:
+    """관광지 표의 검색 인덱스. search() 는 점수순 행 번호(0부터, DataFrame 위치)를 돌려줍니다."""
+
+    def __init__(self, columns):
+        # columns: {열 이름: 값 목록}
+        self.size = len(next(iter(columns.values()))) if columns else 0
+        self.fields = {}
+        for name, values in columns.items():
+            self.fields[name] = _GramIndex([normalize(v) for v in values])
+        name_field = "관광지명" if "관광지명" in columns else next(iter(columns), None)
+        self.choseong = _GramIndex([choseong(v) for v in columns[name_field]]) if name_field else None
+        self.name_field = name_field
+
+    @classmethod
+    def from_frame(cls, df, fields=FIELDS):
+        return cls({name: df[name].astype(str).tolist() for name in fields if name in df.columns})
+
+    def search(self, query, limit=None):
+        """검색어와 맞는 행 번호를 점수 높은 순으로 (limit 개까지). 검색어가 비어 있으면 빈 배열"""
+        query = normalize(query)
+        if not query or self.size == 0:
+            return np.empty(0, dtype=np.int32)
+
+        if any(ch in CHOSEONG_SET for ch in query):
+            # 초성 검색: 검색어의 완성형 글자도 초성으로 바꿔 초성 색인에서 찾음
+            q = choseong(query)
+            targets = [(self.choseong, q, FIELDS.get(self.name_field, 1.0))]
+        else:
+            targets = [(index, query, FIELDS.get(name, 1.0)) for name, index in self.fields.items()]
+
+        row_parts, score_parts = [], []
+        for index, q, weight in targets:
+            rows = index.candidates(q)
+            if len(rows):
+                row_parts.append(rows)
+                score_parts.append(index.scores(rows, q, weight))
+        if not row_parts:
+            return np.empty(0, dtype=np.int32)
+        rows = np.concatenate(row_parts)
+        scores = np.concatenate(score_parts)
+
+        if len(row_parts) > 1:
+            # 여러 열에서 맞은 행은 가장 높은 점수 하나만 남김 (행 번호순, 같은 행은 점수 높은 것부터 정렬 후 첫 번째)
+            order = np.lexsort((-scores, rows))
+            rows, scores = rows[order], scores[order]
+            first = np.ones(len(rows), dtype=bool)
+            first[1:] = rows[1:] != rows[:-1]
+            rows, scores = rows[first], scores[first]
+
+        if limit is not None and limit < len(rows):
+            if limit <= 0:
+                return np.empty(0, dtype=np.int32)
+            # limit 번째로 높은 점수를 argpartition 으로 찾고, 그보다 높은 행 전부 + 같은 점수 중 행 번호가 작은 것만 남김
+            # (rows 는 오름차순이므로 전체를 정렬한 결과의 앞 limit 개와 같습니다)
+            kth = scores[np.argpartition(-scores, limit - 1)[limit - 1]]
+            keep = scores > kth
+            keep[np.flatnonzero(scores == kth)[:limit - keep.sum()]] = True
+            rows, scores = rows[keep], scores[keep]
+        return rows[np.lexsort((rows, -scores))]
+
+    def __len__(self):
+        return self.size
@@ -0,0 +1,46 @@
+"""pages/01_기온시각화.py 에서 쓰는 기온 데이터 계층"""
+
+from .loader import (
+    CACHE_DIR, DATE_COL, STATION_COL, TEMP_COL, TEMPERATURE_COLS, YEAR_COL,
+    clean_frame, detect_encoding, load_temperature, read_temperature_csv,
+)
+from .downsample import MultiResolution, lttb_indices, minmax_indices
+from .incremental import IncrementalTrend
+from .stream import GroupTotals, StreamAggregate, cached_stream_aggregate, stream_aggregate
+from .stations import (
+    STATION_DIR, compare_serial_parallel, discover_station_files, ingest_stations, merge_station_frames,
+    station_year_matrix,
+)
+from .trends import TrendAnalytics, analyze_trends, grouped_slopes, rolling_mean, rolling_slope
+
+__all__ = [
+    "CACHE_DIR",
+    "DATE_COL",
+    "STATION_COL",
+    "TEMP_COL",
+    "TEMPERATURE_COLS",
+    "YEAR_COL",
+    "clean_frame",
+    "detect_encoding",
+    "load_temperature",
+    "read_temperature_csv",
+    "MultiResolution",
+    "lttb_indices",
+    "minmax_indices",
+    "IncrementalTrend",
+    "GroupTotals",
+    "StreamAggregate",
+    "cached_stream_aggregate",
+    "stream_aggregate",
+    "STATION_DIR",
+    "compare_serial_parallel",
+    "discover_station_files",
+    "ingest_stations",
+    "merge_station_frames",
+    "station_year_matrix",
+    "TrendAnalytics",
+    "analyze_trends",
+    "grouped_slopes",
+    "rolling_mean",
+    "rolling_slope",
+]
@@ -0,0 +1,111 @@
+import numpy as np
+
+# ==========================================
+# 긴 시계열을 Plotly 로 보내기 전 서버에서 점 수 줄이기
+# ==========================================
+# 100년치 일별 기온(수만 점)을 그대로 브라우저에 보내면 JSON 이 커지고 그리기가 느려집니다.
+#   - LTTB (Largest-Triangle-Three-Buckets): 구간마다 이웃 구간과 만드는 삼각형이 가장 큰 점 하나를 남겨
+#     선 모양(봉우리·골)을 유지합니다.
+#   - min/max: 구간마다 최솟값·최댓값 두 점을 남깁니다 (극값이 중요할 때).
+# MultiResolution 은 원본 -> 1/4 -> 1/16 ... 해상도 단계를 미리 만들어 두고,
+# 화면에 보이는 범위에서 max_points 이하가 되는 가장 촘촘한 단계를 골라 잘라 줍니다.
+# 따라서 전송하는 점 수는 기록 길이와 관계없이 max_points 를 넘지 않습니다.
+
+METHODS = ("lttb", "minmax")
+
+
+def lttb_indices(x, y, n_out):
+    """LTTB 로 고른 점 번호 (처음·끝 점 포함, 오름차순)"""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # 처음·끝 점을 뺀 나머지를 n_out - 2 개 구간으로 나눔: [edges[i], edges[i+1])
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    out = np.empty(n_out, dtype=np.int64)
+    out[0], out[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # 다음 구간의 평균점 (마지막 구간의 다음은 끝 점)
+        nlo = hi
+        nhi = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[nlo:nhi].mean()
+        avg_y = y[nlo:nhi].mean()
+        # 삼각형 넓이의 2배: |(a - avg) x (a - p)|
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(area.argmax())
+        out[i + 1] = a
+    return out
+
+
+def minmax_indices(y, n_buckets):
+    """같은 길이의 구간마다 최솟값·최댓값 점 번호 (오름차순, 중복 제거)"""
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n_buckets <= 0 or 2 * n_buckets >= n:
+        return np.arange(n)
+
+    size = -(-n // n_buckets)
+    padded = np.full(n_buckets * size, np.nan)
+    padded[:n] = y
+    blocks = padded.reshape(n_buckets, size)
+    # 끝 구간이 모두 NaN 이 되지 않도록 n_buckets 를 실제 필요한 개수로 맞춤
+    used = -(-n // size)
+    blocks = blocks[:used]
+    starts = np.arange(used) * size
+    picks = np.concatenate([starts + np.nanargmin(blocks, axis=1), starts + np.nanargmax(blocks, axis=1)])
+    return np.unique(picks)
+
+
+def _as_float(x):
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        return x.astype('datetime64[ns]').astype(np.int64).astype(np.float64)
+    return x.astype(np.float64)
+
+
+class MultiResolution:
+    """미리 만든 해상도 단계 중, 보이는 범위에 맞는 단계를 골라 잘라 주는 시계열"""
+
+    def __init__(self, x, y, max_points=2000, factor=4, method="lttb"):
+        if method not in METHODS:
+            raise ValueError(f"지원하지 않는 다운샘플링 방식입니다: {method}")
+        order = np.argsort(np.asarray(x), kind='stable')
+        self.x = np.asarray(x)[order]
+        self.y = np.asarray(y, dtype=np.float64)[order]
+        self.max_points = max_points
+        self.method = method
+
+        xf = _as_float(self.x)
+        n = len(self.x)
+        # levels[0] 은 원본, 이후 단계는 점 수가 factor 배씩 줄어들고 마지막 단계는 max_points 이하
+        self.levels = [np.arange(n)]
+        size = n
+        while size > max_points:
+            size = max(max_points, size // factor)
+            if method == "lttb":
+                idx = lttb_indices(xf, self.y, size)
+            else:
+                idx = minmax_indices(self.y, size // 2)
+            self.levels.append(idx)
+        self._level_x = [self.x[idx] for idx in self.levels]
+
+    def select(self, start=None, end=None):
+        """(x, y, 단계 번호). [start, end] 범위에서 max_points 이하인 가장 촘촘한 단계를 사용합니다."""
+        for level, (idx, lx) in enumerate(zip(self.levels, self._level_x)):
+            lo = 0 if start is None else np.searchsorted(lx, start, side='left')
+            hi = len(lx) if end is None else np.searchsorted(lx, end, side='right')
+            if hi - lo <= self.max_points or level == len(self.levels) - 1:
+                picked = idx[lo:hi]
+                return self.x[picked], self.y[picked], level
+        return self.x[:0], self.y[:0], 0
+
+    def level_sizes(self):
+        return [len(idx) for idx in self.levels]
+
+    def __len__(self):
+        return len(self.x)
@@ -0,0 +1,202 @@
+import csv
+import io
+import os
+import threading
+
+import pandas as pd
+
+from cache_utils import file_sha256
+
+from .loader import (
+    CACHE_DIR, CACHE_VERSION, DATE_COL, TEMP_COL, YEAR_COL,
+    _read_meta, _write_meta, cache_stem, clean_frame, detect_encoding,
+)
+
+# ==========================================
+# 새로 추가된 일별 관측값만 반영하는 증분 집계
+# ==========================================
+# 파일 끝에 새 날짜 행이 계속 붙는 경우, 매번 전체를 다시 읽지 않도록
+#   - 연도별 (합계, 개수)
+#   - 연평균 추세선용 회귀 모멘트 n, Σx, Σy, Σxy, Σx² (x = 연도 - 기준 연도, y = 연평균)
+#   - 지금까지 읽은 바이트 위치(offset)
+# 를 .cache/weather/*.stats.json 에 저장해 둡니다.
+# 새 행이 들어오면 offset 뒤의 바이트만 읽어, 값이 바뀐 연도의 모멘트 기여분만 빼고 다시 더합니다.
+# 기울기·절편·지표 갱신 비용은 새 행 수(와 그 행들이 속한 연도 수)에 비례합니다.
+#
+# 파일이 수정됐는데 offset 보다 커지지 않았다면 (덮어쓰기·줄어듦) 처음부터 다시 집계하고,
+# 커졌다면 offset 까지의 앞부분 전체 해시가 저장된 값과 같을 때만 새 바이트를 이어서 반영합니다.
+
+STATE_SUFFIX = ".stats.json"
+
+
+class IncrementalTrend:
+    """연도별 충분통계량과 회귀 모멘트를 디스크에 두고 새 행만 반영하는 집계기"""
+
+    def __init__(self, path, state_path=None, cache_dir=CACHE_DIR):
+        self.path = path
+        self.state_path = state_path or cache_stem(path, cache_dir) + STATE_SUFFIX
+        self.last_ingested = 0
+        self._lock = threading.Lock()
+        state = _read_meta(self.state_path)
+        if state is None or state.get("kind") != "incremental" or state.get("source") != os.path.abspath(path):
+            state = None
+        self._state = state
+
+    # ------------------------------------------
+    # 상태 초기화 / 저장
+    # ------------------------------------------
+    def _empty_state(self, f):
+        f.seek(0)
+        header = f.readline()
+        encoding = detect_encoding(self.path)
+        columns = [c.strip() for c in next(csv.reader([header.decode(encoding)]))]
+        return {
+            "version": CACHE_VERSION,
+            "kind": "incremental",
+            "source": os.path.abspath(self.path),
+            "encoding": 'utf-8' if encoding == 'utf-8-sig' else encoding,
+            "columns": columns,
+            "offset": len(header),
+            "mtime_ns": 0,
+            "prefix_sha256": "",
+            "rows": 0,
+            "base_year": None,
+            "years": {},
+            "moments": {"n": 0, "sx": 0.0, "sy": 0.0, "sxy": 0.0, "sxx": 0.0},
+        }
+
+    def _prefix_unchanged(self, size):
+        """파일이 offset 뒤로만 늘어났는지 (offset 까지의 내용이 지난번과 같은지)"""
+        state = self._state
+        if size <= state["offset"]:
+            return False
+        return file_sha256(self.path, state["offset"]).hex() == state.get("prefix_sha256")
+
+    def _save(self):
+        state = self._state
+        state["prefix_sha256"] = file_sha256(self.path, state["offset"]).hex()
+        try:
+            os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+            _write_meta(self.state_path, state)
+        except OSError:
+            pass  # 캐시 폴더에 쓸 수 없으면 메모리 상태만 유지
+
+    # ------------------------------------------
+    # 증분 반영
+    # ------------------------------------------
+    def _apply_year(self, year, add_sum, add_count):
+        """연도 하나의 (합계, 개수)를 갱신하고, 그 연도의 회귀 기여분만 교체합니다."""
+        state = self._state
+        moments = state["moments"]
+        if state["base_year"] is None:
+            state["base_year"] = year
+        x = year - state["base_year"]
+
+        key = str(year)
+        old = state["years"].get(key)
+        if old is not None and old[1] > 0:
+            y = old[0] / old[1]
+            moments["n"] -= 1
+            moments["sx"] -= x
+            moments["sy"] -= y
+            moments["sxy"] -= x * y
+            moments["sxx"] -= x * x
+            total, count = old[0] + add_sum, old[1] + add_count
+        else:
+            total, count = add_sum, add_count
+
+        state["years"][key] = [total, count]
+        if count > 0:
+            y = total / count
+            moments["n"] += 1
+            moments["sx"] += x
+            moments["sy"] += y
+            moments["sxy"] += x * y
+            moments["sxx"] += x * x
+
+    def _ingest(self, data):
+        """완전한 줄들만 담긴 바이트 덩어리를 해석해 연도별 통계에 더합니다."""
+        state = self._state
+        df = pd.read_csv(
+            io.BytesIO(data), header=None, names=state["columns"],
+            encoding=state["encoding"], dtype={DATE_COL: str},
+        )
+        df = clean_frame(df)
+        totals = df.groupby(YEAR_COL)[TEMP_COL].agg(['sum', 'count'])
+        for year, row in totals.iterrows():
+            self._apply_year(int(year), float(row['sum']), int(row['count']))
+        state["rows"] += len(df)
+        return len(df)
+
+    def refresh(self):
+        """파일에 새로 붙은 행을 반영하고, 반영한 행 수를 돌려줍니다.
+
+        마지막 줄바꿈 뒤의 (아직 쓰는 중인) 줄은 다음 refresh 때 읽습니다.
+        """
+        with self._lock:
+            stat = os.stat(self.path)
+            with open(self.path, 'rb') as f:
+                if self._state is not None:
+                    if stat.st_size == self._state["offset"] and stat.st_mtime_ns == self._state["mtime_ns"]:
+                        self.last_ingested = 0
+                        return 0
+                    if not self._prefix_unchanged(stat.st_size):
+                        self._state = None
+                if self._state is None:
+                    self._state = self._empty_state(f)
+
+                offset = self._state["offset"]
+                f.seek(offset)
+                data = f.read(stat.st_size - offset)
+                end = data.rfind(b'\n') + 1
+                ingested = self._ingest(data[:end]) if end > 0 else 0
+
+                self._state["offset"] = offset + end
+                self._state["mtime_ns"] = stat.st_mtime_ns
+                self._save()
+
+            self.last_ingested = ingested
+            return ingested
+
+    # ------------------------------------------
+    # 조회 (저장된 통계에서 바로 계산)
+    # ------------------------------------------
+    def trend(self):
+        """연평균 기온의 1차 추세선 (기울기, 절편). 연도가 2개 미만이면 None"""
+        with self._lock:
+            if self._state is None:
+                return None
+            m = self._state["moments"]
+            n = m["n"]
+            denom = n * m["sxx"] - m["sx"] ** 2
+            if n < 2 or denom <= 0:
+                return None
+            slope = (n * m["sxy"] - m["sx"] * m["sy"]) / denom
+            # x 는 기준 연도를 뺀 값이므로 절편을 실제 연도 기준으로 옮깁니다.
+            intercept = (m["sy"] - slope * m["sx"]) / n - slope * self._state["base_year"]
+            return slope, intercept
+
+    def yearly_frame(self):
+        """페이지의 df_yearly 와 같은 모양: ['연도', '평균기온(℃)']"""
+        with self._lock:
+            years = {} if self._state is None else self._state["years"]
+            rows = sorted((int(year), total / count) for year, (total, count) in years.items() if count > 0)
+        return pd.DataFrame(rows, columns=[YEAR_COL, TEMP_COL])
+
+    def metrics(self):
+        """분석 기간·전체 상승폭·연평균 상승률 (페이지 상단 지표)"""
+        fit = self.trend()
+        with self._lock:
+            years = [int(y) for y, (_, count) in self._state["years"].items() if count > 0] if self._state else []
+            rows = self._state["rows"] if self._state else 0
+        if fit is None or not years:
+            return None
+        slope, _ = fit
+        start_year, end_year = min(years), max(years)
+        return {
+            "start_year": start_year,
+            "end_year": end_year,
+            "total_change": slope * (end_year - start_year),
+            "slope": slope,
+            "rows": rows,
+        }
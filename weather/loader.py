@@ -0,0 +1,168 @@
+import codecs
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+from cache_utils import file_sha256
+
+# ==========================================
+# 기온 CSV 로더 + Parquet 전처리 캐시
+# ==========================================
+# 기상청 일별 기온 CSV 는 파일마다 인코딩(cp949 / UTF-8 BOM)이 다르고,
+# 날짜 칸이 '"\t1907-10-01"' 처럼 따옴표·탭이 섞여 있습니다.
+#   - 인코딩은 파일 앞부분(sample)만 점진적 디코더로 시험해 한 번에 정하고,
+#   - 날짜는 한 번의 strip 후 형식('%Y-%m-%d')을 지정해 파싱합니다.
+# 정리된 표는 .cache/weather/ 아래 Parquet 파일로 저장해 두고, 다음 프로세스부터는
+# CSV 를 다시 해석하지 않고 열 단위 데이터를 바로 읽습니다.
+# 원본의 수정 시각(mtime)·크기가 바뀌면 sha256 을 비교해, 내용이 실제로 달라졌을 때만 다시 만듭니다.
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_DIR = os.path.join(PROJECT_ROOT, ".cache", "weather")
+CACHE_VERSION = 1
+
+DATE_COL = '날짜'
+STATION_COL = '지점'
+TEMP_COL = '평균기온(℃)'
+YEAR_COL = '연도'
+TEMPERATURE_COLS = ['평균기온(℃)', '최저기온(℃)', '최고기온(℃)']
+DATE_FORMAT = '%Y-%m-%d'
+
+SAMPLE_BYTES = 64 * 1024
+# 앞에서부터 시험할 인코딩 (BOM 이 있으면 utf-8-sig)
+ENCODINGS = ('utf-8', 'cp949')
+
+
+def detect_encoding(path, sample_bytes=SAMPLE_BYTES):
+    """파일 앞부분만 읽어 인코딩을 정합니다.
+
+    점진적 디코더(final=False)를 쓰므로 표본 끝에서 잘린 한글 바이트는 오류로 보지 않습니다.
+    """
+    with open(path, 'rb') as f:
+        sample = f.read(sample_bytes)
+    if sample.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    for encoding in ENCODINGS:
+        try:
+            codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
+        except UnicodeDecodeError:
+            continue
+        return encoding
+    return ENCODINGS[-1]
+
+
+def clean_frame(df):
+    """컬럼명·날짜·기온을 정리하고 '연도' 열을 붙입니다. 필수 컬럼이 없으면 ValueError"""
+    df.columns = [c.strip() for c in df.columns]
+
+    if DATE_COL not in df.columns:
+        raise ValueError(f"CSV 파일에 '{DATE_COL}' 컬럼이 없습니다.")
+    if TEMP_COL not in df.columns:
+        raise ValueError(f"CSV 파일에 '{TEMP_COL}' 컬럼이 없습니다.")
+
+    # '"\t1907-10-01"' -> '1907-10-01' 을 한 번에 정리하고, 형식을 지정해 빠르게 파싱
+    dates = df[DATE_COL].astype(str).str.strip(' \t"')
+    df[DATE_COL] = pd.to_datetime(dates, format=DATE_FORMAT, errors='coerce')
+    df[YEAR_COL] = df[DATE_COL].dt.year
+
+    # 문자로 들어온 값은 숫자로 강제 변환 (변환 실패는 NaN)
+    for col in TEMPERATURE_COLS:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+
+    # 평균기온이나 날짜가 비어 있는 행은 분석에서 제외
+    df = df.dropna(subset=[TEMP_COL, YEAR_COL]).reset_index(drop=True)
+    df[YEAR_COL] = df[YEAR_COL].astype('int64')
+    return df
+
+
+def read_temperature_csv(path, encoding=None):
+    """CSV 를 한 번만 해석해 정리된 DataFrame 을 돌려줍니다."""
+    if encoding is None:
+        encoding = detect_encoding(path)
+    df = pd.read_csv(path, encoding=encoding, dtype={DATE_COL: str})
+    return clean_frame(df)
+
+
+def cache_stem(path, cache_dir=CACHE_DIR):
+    """캐시 파일 경로의 공통 앞부분. 같은 이름의 다른 폴더 파일과 겹치지 않도록 경로 해시를 붙입니다."""
+    tag = hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest()[:10]
+    return os.path.join(cache_dir, f"{os.path.splitext(os.path.basename(path))[0]}-{tag}")
+
+
+def cache_paths(path, cache_dir=CACHE_DIR):
+    """(Parquet 경로, 메타데이터 JSON 경로)"""
+    base = cache_stem(path, cache_dir)
+    return base + ".parquet", base + ".json"
+
+
+def _read_meta(meta_path):
+    try:
+        with open(meta_path, encoding='utf-8') as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return meta if meta.get("version") == CACHE_VERSION else None
+
+
+def _write_meta(meta_path, meta):
+    tmp_path = f"{meta_path}.tmp{os.getpid()}"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False)
+    os.replace(tmp_path, meta_path)
+
+
+def write_cache(df, parquet_path, meta_path, meta):
+    """Parquet 와 메타데이터를 임시 파일에 쓴 뒤 교체합니다 (읽는 중인 다른 프로세스에 안전)."""
+    os.makedirs(os.path.dirname(parquet_path), exist_ok=True)
+    tmp_path = f"{parquet_path}.tmp{os.getpid()}"
+    df.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, parquet_path)
+    _write_meta(meta_path, meta)
+
+
+def load_temperature(path, cache_dir=CACHE_DIR, use_cache=True):
+    """정리된 기온 DataFrame. 유효한 Parquet 캐시가 있으면 CSV 대신 그것을 읽습니다.
+
+    - mtime 과 크기가 캐시 메타데이터와 같으면: 바로 캐시 사용
+    - 다르면 sha256 비교: 내용이 같으면 메타데이터만 갱신, 다르면 CSV 를 다시 읽어 캐시 재생성
+    pyarrow 가 없거나 캐시 폴더에 쓸 수 없으면 CSV 를 읽은 결과를 그대로 돌려줍니다.
+    """
+    if not use_cache:
+        return read_temperature_csv(path)
+
+    parquet_path, meta_path = cache_paths(path, cache_dir)
+    stat = os.stat(path)
+    meta = _read_meta(meta_path)
+    digest = None
+
+    if meta is not None and os.path.exists(parquet_path):
+        try:
+            if meta["mtime_ns"] == stat.st_mtime_ns and meta["size"] == stat.st_size:
+                return pd.read_parquet(parquet_path)
+
+            digest = file_sha256(path).hex()
+            if meta["sha256"] == digest:
+                df = pd.read_parquet(parquet_path)
+                _write_meta(meta_path, dict(meta, mtime_ns=stat.st_mtime_ns, size=stat.st_size))
+                return df
+        except (ImportError, OSError, ValueError):
+            pass
+
+    encoding = detect_encoding(path)
+    df = read_temperature_csv(path, encoding)
+    meta = {
+        "version": CACHE_VERSION,
+        "source": os.path.abspath(path),
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": digest or file_sha256(path).hex(),
+        "encoding": encoding,
+        "rows": len(df),
+    }
+    try:
+        write_cache(df, parquet_path, meta_path, meta)
+    except (ImportError, OSError):
+        pass
+    return df
@@ -0,0 +1,121 @@
+import glob
+import os
+import sys
+import time
+import types
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from multiprocessing import get_context
+
+import pandas as pd
+
+from .loader import DATE_COL, PROJECT_ROOT, STATION_COL, TEMP_COL, YEAR_COL, detect_encoding
+from .stream import stream_aggregate
+
+# ==========================================
+# 지점별 CSV 여러 개를 프로세스 풀로 병렬 집계
+# ==========================================
+# 관측 지점마다 CSV 가 하나씩 있을 때, 파일 하나의 해석·집계는 서로 독립이므로
+# 파일 단위로 프로세스 풀에 나눠 맡깁니다 (pandas 파싱은 GIL 때문에 스레드로는 빨라지지 않습니다).
+# 각 작업은 청크 집계(stream_aggregate)로 지점 x 연도별 (합계, 개수)만 돌려주고,
+# 부모 프로세스가 이를 합쳐 지점 x 연도 평균기온 표 하나로 만듭니다.
+# 파일에 '지점' 컬럼이 없으면 파일 이름을 지점 이름으로 씁니다.
+# 찾을 폴더는 STATION_DIR (프로젝트의 data/stations) 로 고정합니다. 화면에서 방문자가 서버의 임의 폴더를 훑게 하지 않고,
+# 페이지 스크립트가 있는 pages 폴더의 다른 CSV 가 지점 파일로 섞이지도 않습니다.
+# 작업 프로세스는 spawn 으로 띄웁니다. Streamlit 서버는 스레드를 여럿 쓰므로 fork 하면 잠긴 lock 까지 복사될 수 있습니다.
+# spawn 은 새 프로세스에서 __main__ 을 다시 실행하는데, Streamlit 에서는 __main__ 이 페이지 스크립트라
+# 페이지 전체가 작업 프로세스마다 다시 돌게 되므로, 작업을 띄우는 동안만 __main__ 을 빈 모듈로 바꿔 둡니다.
+
+STATION_DIR = os.path.join(PROJECT_ROOT, "data", "stations")
+
+
+def _has_columns(path):
+    """헤더에 '날짜' 와 '평균기온(℃)' 이 있는 CSV 인지 첫 줄만 읽어 확인합니다."""
+    try:
+        with open(path, encoding=detect_encoding(path)) as f:
+            header = [c.strip().strip('"') for c in f.readline().split(',')]
+    except (OSError, UnicodeDecodeError):
+        return False
+    return DATE_COL in header and TEMP_COL in header
+
+
+def discover_station_files(directory=STATION_DIR, pattern="*.csv"):
+    """directory 아래(하위 폴더 포함)에서 기온 CSV 파일 경로를 이름순으로 찾습니다."""
+    paths = glob.glob(os.path.join(directory, "**", pattern), recursive=True)
+    return sorted(p for p in paths if os.path.isfile(p) and _has_columns(p))
+
+
+def station_yearly(path):
+    """파일 하나의 지점 x 연도별 (합계, 개수). 프로세스 풀 작업 단위입니다."""
+    result = stream_aggregate(path)
+    if result.station_yearly is not None:
+        df = result.station_yearly
+        df[STATION_COL] = df[STATION_COL].astype(str)
+    else:
+        df = result.yearly.copy()
+        df.insert(0, STATION_COL, os.path.splitext(os.path.basename(path))[0])
+    return df[[STATION_COL, YEAR_COL, 'sum', 'count']], result.rows
+
+
+def merge_station_frames(frames):
+    """파일별 결과를 합쳐 지점 x 연도별 평균기온 긴 표로 만듭니다 (같은 지점이 여러 파일이면 합산)."""
+    if not frames:
+        return pd.DataFrame(columns=[STATION_COL, YEAR_COL, 'sum', 'count', TEMP_COL])
+    merged = pd.concat(frames, ignore_index=True).groupby([STATION_COL, YEAR_COL], as_index=False)[['sum', 'count']].sum()
+    merged[TEMP_COL] = merged['sum'] / merged['count']
+    return merged
+
+
+@contextmanager
+def _without_main_script():
+    """spawn 으로 띄운 프로세스가 __main__ (페이지 스크립트)을 다시 실행하지 않게 합니다.
+
+    작업 함수는 이 모듈에 있으므로 작업 프로세스에는 __main__ 이 필요 없습니다.
+    """
+    main = sys.modules.get("__main__")
+    sys.modules["__main__"] = types.ModuleType("__main__")
+    try:
+        yield
+    finally:
+        sys.modules["__main__"] = main
+
+
+def ingest_stations(paths, processes=None):
+    """(지점 x 연도 긴 표, 읽은 행 수, 걸린 시간). processes=1 이면 현재 프로세스에서 차례로 읽습니다."""
+    started = time.perf_counter()
+    if processes == 1 or len(paths) <= 1:
+        results = [station_yearly(path) for path in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=processes, mp_context=get_context("spawn")) as pool:
+            # 작업 프로세스는 submit 할 때 필요한 만큼 만들어지므로, 그동안만 __main__ 을 숨깁니다.
+            with _without_main_script():
+                futures = [pool.submit(station_yearly, path) for path in paths]
+            results = [future.result() for future in futures]
+    table = merge_station_frames([df for df, _ in results])
+    rows = sum(n for _, n in results)
+    return table, rows, time.perf_counter() - started
+
+
+def station_year_matrix(table):
+    """긴 표 -> 지점(행) x 연도(열) 평균기온 표"""
+    return table.pivot(index=STATION_COL, columns=YEAR_COL, values=TEMP_COL).sort_index(axis=1)
+
+
+def compare_serial_parallel(paths, processes=None):
+    """직렬 / 병렬 집계 시간을 재고, 두 결과가 같은지 확인합니다."""
+    serial, rows, serial_seconds = ingest_stations(paths, processes=1)
+    parallel, _, parallel_seconds = ingest_stations(paths, processes=processes)
+    try:
+        pd.testing.assert_frame_equal(serial, parallel)
+        same = True
+    except AssertionError:
+        same = False
+    return {
+        "files": len(paths),
+        "rows": rows,
+        "processes": processes or os.cpu_count(),
+        "serial_seconds": serial_seconds,
+        "parallel_seconds": parallel_seconds,
+        "speedup": serial_seconds / parallel_seconds if parallel_seconds > 0 else 0.0,
+        "same_result": bool(same),
+    }
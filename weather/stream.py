@@ -0,0 +1,121 @@
+import os
+import time
+
+import pandas as pd
+
+from cache_utils import BoundedLRU
+
+from .loader import DATE_COL, STATION_COL, TEMP_COL, YEAR_COL, clean_frame, detect_encoding
+
+# ==========================================
+# 메모리보다 큰 기온 파일의 청크 단위 집계
+# ==========================================
+# 전국 여러 지점의 일별 자료처럼 한 번에 DataFrame 으로 올릴 수 없는 파일을
+# 정해진 행 수(chunksize)씩 읽으며 그룹별 (합계, 개수) 만 누적합니다.
+# 메모리 사용량은 행 수가 아니라 그룹 수(연도, 지점 x 연도, 연도 x 월)에 비례합니다.
+# 평균은 마지막에 합계 / 개수 로 구하므로 전체를 읽어 groupby().mean() 한 결과와 같습니다.
+
+MONTH_COL = '월'
+DEFAULT_CHUNKSIZE = 200_000
+MAX_CACHED_RESULTS = 8
+
+_cache = BoundedLRU(maxsize=MAX_CACHED_RESULTS)
+
+
+class GroupTotals:
+    """keys 별 평균기온 (합계, 개수) 누적기"""
+
+    def __init__(self, keys):
+        self.keys = list(keys)
+        self.totals = None
+
+    def add(self, chunk):
+        part = chunk.groupby(self.keys)[TEMP_COL].agg(['sum', 'count'])
+        self.totals = part if self.totals is None else self.totals.add(part, fill_value=0)
+
+    def frame(self):
+        """keys 열 + 합계 / 개수 / 평균기온 열로 이루어진 DataFrame"""
+        if self.totals is None:
+            return pd.DataFrame(columns=self.keys + ['sum', 'count', TEMP_COL])
+        df = self.totals.sort_index().reset_index()
+        df['count'] = df['count'].astype('int64')
+        df[TEMP_COL] = df['sum'] / df['count']
+        return df
+
+    def __len__(self):
+        return 0 if self.totals is None else len(self.totals)
+
+
+class StreamAggregate:
+    """청크 집계 결과: 연도별 / 지점 x 연도별 / 연도 x 월별 평균과 처리 속도"""
+
+    def __init__(self, yearly, station_yearly, monthly, rows, seconds):
+        self.yearly = yearly
+        self.station_yearly = station_yearly
+        self.monthly = monthly
+        self.rows = rows
+        self.seconds = seconds
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+    def yearly_frame(self):
+        """페이지의 df_yearly 와 같은 모양: ['연도', '평균기온(℃)']"""
+        return self.yearly[[YEAR_COL, TEMP_COL]].copy()
+
+    def __repr__(self):
+        return (f"StreamAggregate(rows={self.rows}, years={len(self.yearly)}, "
+                f"rows_per_second={self.rows_per_second:.0f})")
+
+
+def _wanted(column):
+    return column.strip() in (DATE_COL, STATION_COL, TEMP_COL)
+
+
+def stream_aggregate(path, chunksize=DEFAULT_CHUNKSIZE, encoding=None, progress=None):
+    """파일을 chunksize 행씩 읽으며 그룹별 합계·개수를 누적합니다.
+
+    progress(rows, rows_per_second) 는 청크를 하나 처리할 때마다 호출됩니다.
+    """
+    if encoding is None:
+        encoding = detect_encoding(path)
+
+    yearly = GroupTotals([YEAR_COL])
+    station_yearly = None
+    monthly = GroupTotals([YEAR_COL, MONTH_COL])
+    rows = 0
+    started = time.perf_counter()
+
+    reader = pd.read_csv(path, encoding=encoding, usecols=_wanted, dtype={DATE_COL: str}, chunksize=chunksize)
+    for raw in reader:
+        rows += len(raw)
+        chunk = clean_frame(raw)
+        chunk[MONTH_COL] = chunk[DATE_COL].dt.month
+
+        yearly.add(chunk)
+        monthly.add(chunk)
+        if STATION_COL in chunk.columns:
+            if station_yearly is None:
+                station_yearly = GroupTotals([STATION_COL, YEAR_COL])
+            station_yearly.add(chunk)
+
+        if progress is not None:
+            elapsed = time.perf_counter() - started
+            progress(rows, rows / elapsed if elapsed > 0 else 0.0)
+
+    seconds = time.perf_counter() - started
+    return StreamAggregate(
+        yearly.frame(),
+        station_yearly.frame() if station_yearly is not None else None,
+        monthly.frame(),
+        rows,
+        seconds,
+    )
+
+
+def cached_stream_aggregate(path, chunksize=DEFAULT_CHUNKSIZE, progress=None):
+    """(경로, mtime, 크기, chunksize) 별로 집계 결과를 재사용합니다. 파일이 바뀌면 다시 읽습니다."""
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size, chunksize)
+    return _cache.get_or_compute(key, lambda: stream_aggregate(path, chunksize, progress=progress))
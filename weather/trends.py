@@ -0,0 +1,131 @@
+import hashlib
+from collections import namedtuple
+
+import numpy as np
+
+from cache_utils import BoundedLRU
+
+# ==========================================
+# 누적합 기반 이동평균·구간별 추세 분석
+# ==========================================
+# 창(window)마다 np.polyfit 을 부르면 창 수만큼 최소제곱을 다시 풉니다.
+# 여기서는 x, y, xy, x² 의 누적합을 한 번 만들어 두고, 어떤 구간 [i, j) 의 합이든
+# cumsum[j] - cumsum[i] 로 O(1) 에 구해 기울기를 계산합니다.
+#     기울기 = (n Σxy - Σx Σy) / (n Σx² - (Σx)²)
+# 이동평균·이동 기울기는 O(n), 연대별·월별 기울기는 np.bincount 로 그룹 합을 구해 O(n) 입니다.
+# x 는 첫 연도를 빼서(0 부터 시작) 제곱합이 커지며 생기는 자릿수 손실을 줄입니다.
+#
+# 창은 "연속한 데이터 점 window 개" 입니다. 빠진 연도가 있으면 창이 그만큼 더 긴 기간을 덮습니다.
+
+# 분석 결과:
+#   rolling_mean  : 이동평균 (앞쪽 window-1 개는 NaN)
+#   rolling_slope : 이동 기울기 (℃/년, 창의 마지막 점 위치에 기록)
+#   decades       : (연대 시작 연도 배열, 연대별 기울기, 연대별 평균)
+#   months        : (1~12, 월별 기울기) 또는 월별 자료가 없으면 None
+TrendAnalytics = namedtuple("TrendAnalytics", ["years", "values", "rolling_mean", "rolling_slope", "decades", "months"])
+
+MAX_CACHED_RESULTS = 32
+
+_cache = BoundedLRU(maxsize=MAX_CACHED_RESULTS)
+
+
+def _prefix(values):
+    """앞에 0 을 붙인 누적합: 구간 [i, j) 합 = out[j] - out[i]"""
+    out = np.zeros(len(values) + 1)
+    np.cumsum(values, out=out[1:])
+    return out
+
+
+def _slope(n, sx, sy, sxy, sxx):
+    """합계들로 구한 최소제곱 기울기 (점이 2개 미만이거나 x 가 모두 같으면 NaN)"""
+    n = np.asarray(n, dtype=np.float64)
+    denom = n * sxx - sx * sx
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slope = (n * sxy - sx * sy) / denom
+    return np.where((n >= 2) & (denom > 1e-12), slope, np.nan)
+
+
+def rolling_mean(values, window):
+    """길이 window 이동평균 (O(n))"""
+    values = np.asarray(values, dtype=np.float64)
+    out = np.full(len(values), np.nan)
+    if 0 < window <= len(values):
+        c = _prefix(values)
+        out[window - 1:] = (c[window:] - c[:-window]) / window
+    return out
+
+
+def rolling_slope(x, y, window):
+    """연속한 window 개 점마다의 1차 추세 기울기 (O(n))"""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    out = np.full(len(x), np.nan)
+    if window < 2 or window > len(x):
+        return out
+    x = x - x[0]
+    cx, cy, cxy, cxx = _prefix(x), _prefix(y), _prefix(x * y), _prefix(x * x)
+
+    def window_sum(c):
+        return c[window:] - c[:-window]
+
+    out[window - 1:] = _slope(window, window_sum(cx), window_sum(cy), window_sum(cxy), window_sum(cxx))
+    return out
+
+
+def grouped_slopes(groups, x, y):
+    """(그룹 값 배열, 그룹별 기울기, 그룹별 y 평균). 그룹별 합은 bincount 한 번씩으로 구합니다."""
+    groups = np.asarray(groups)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    labels, inverse = np.unique(groups, return_inverse=True)
+    if len(labels) == 0:
+        return labels, np.empty(0), np.empty(0)
+    x = x - x.min()
+
+    def total(weights=None):
+        return np.bincount(inverse, weights=weights, minlength=len(labels))
+
+    n = total()
+    sx, sy = total(x), total(y)
+    slopes = _slope(n, sx, sy, total(x * y), total(x * x))
+    return labels, slopes, sy / n
+
+
+def _fingerprint(*arrays):
+    digest = hashlib.sha1()
+    for a in arrays:
+        a = np.ascontiguousarray(a)
+        digest.update(str(a.dtype).encode())
+        digest.update(a.tobytes())
+    return digest.hexdigest()
+
+
+def analyze_trends(years, values, window=10, monthly=None):
+    """연도별 평균 기온의 이동평균·이동 기울기·연대별 기울기 (+ 월별 기울기)
+
+    monthly 는 (연도 배열, 월 배열, 월평균 배열). 결과는 (데이터 지문, window) 별로 재사용합니다.
+    """
+    years = np.asarray(years, dtype=np.int64)
+    values = np.asarray(values, dtype=np.float64)
+    parts = [years, values] + ([np.asarray(a) for a in monthly] if monthly is not None else [])
+    key = (_fingerprint(*parts), window, monthly is not None)
+    return _cache.get_or_compute(key, lambda: _analyze(years, values, window, monthly))
+
+
+def _analyze(years, values, window, monthly):
+    order = np.argsort(years, kind='stable')
+    years, values = years[order], values[order]
+    decades = grouped_slopes(years // 10 * 10, years, values)
+    months = None
+    if monthly is not None:
+        m_years, m_months, m_values = (np.asarray(a) for a in monthly)
+        labels, slopes, _ = grouped_slopes(m_months, m_years, m_values)
+        months = (labels, slopes)
+
+    return TrendAnalytics(
+        years, values,
+        rolling_mean(values, window),
+        rolling_slope(years, values, window),
+        decades,
+        months,
+    )